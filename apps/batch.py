@@ -0,0 +1,453 @@
+"""
+Headless bulk extraction.
+
+Runs every PDF/image under a directory (or listed in a manifest) through
+:class:`~apps.ui.components.document_processor.DocumentProcessor` with bounded
+concurrency, records each job in the :class:`SubmissionStore` the UI reads,
+and streams finished records to a JSONL file as they complete::
+
+    python -m apps.batch <dir-or-manifest> --schema simple
+        [--concurrency 4] [--output results.jsonl] [--checkpoint path]
+        [--no-cache | --refresh-cache] [--retry-errors] [--auto-schema]
+
+A manifest is a text file with one document path per line (relative paths
+are resolved against the manifest's directory; blank lines and ``#``
+comments are ignored).
+
+Progress is journaled to an append-only checkpoint (``<output>.checkpoint``
+by default): each document's ``process_id`` is written as soon as GroundX
+accepts its ingest, and a ``done`` entry once its record is stored. Running
+the same command again after a crash skips documents that finished (unless
+the file changed since), polls the recorded ``process_id`` of documents that
+were in flight instead of uploading them again, and starts the rest.
+
+With ``--auto-schema`` each document is first matched against every schema
+under ``--prompts-dir`` by the local first-page classifier
+(:mod:`apps.ui.components.schema_classifier`); ``--schema`` is used for
+documents it cannot place. The classification is stored on the record, and
+resumed documents keep the schema they were started with.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Set, TextIO, Tuple
+
+from apps.ui.components.document_processor import (
+    STAGE_DOWNLOAD,
+    STAGE_INGEST,
+    STAGE_PROCESSING,
+)
+from apps.ui.components.job_queue import INGESTING, PROCESSING, QUEUED
+from apps.ui.components.processor_cache import get_processor
+from apps.ui.components.sample_documents import SampleDocument
+from apps.ui.components.schema_classifier import classify
+from apps.ui.components.submission_store import SubmissionStore
+
+# File types the upload page accepts (see BillingClient.validate_uploaded_file).
+DOCUMENT_EXTENSIONS = (".pdf", ".jpg", ".jpeg", ".png")
+
+_STAGE_STATES = {
+    STAGE_INGEST: INGESTING,
+    STAGE_PROCESSING: PROCESSING,
+    STAGE_DOWNLOAD: PROCESSING,
+}
+
+# (mtime_ns, size) of an input file; a change means it must be processed again.
+Signature = Tuple[int, int]
+
+
+def discover(source: str) -> List[str]:
+    """Absolute paths of the documents under a directory or listed in a manifest."""
+    if os.path.isdir(source):
+        paths = []
+        for root, dirs, files in os.walk(source):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            paths.extend(
+                os.path.join(root, name)
+                for name in sorted(files)
+                if name.lower().endswith(DOCUMENT_EXTENSIONS) and not name.startswith(".")
+            )
+        return [os.path.abspath(p) for p in paths]
+
+    base = os.path.dirname(os.path.abspath(source))
+    paths = []
+    with open(source) as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                paths.append(os.path.abspath(os.path.join(base, line)))
+    return list(dict.fromkeys(paths))
+
+
+def signature(path: str) -> Optional[Signature]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class Checkpoint:
+    """Append-only journal of ingest and completion events, keyed by file path.
+
+    Lines are JSON objects: ``{"event": "ingested", "path", "signature",
+    "submission_id", "process_id", "bucket_id", "workflow_id"}`` and
+    ``{"event": "done", "path", "signature", "submission_id", "status"}``.
+    A truncated last line (crash mid-write) is ignored on load.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.done: Dict[str, Dict[str, Any]] = {}
+        self.inflight: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._load()
+        self._file: TextIO = open(path, "a")
+
+    def _load(self) -> None:
+        try:
+            f = open(self.path)
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                path = entry.get("path")
+                if entry.get("event") == "ingested":
+                    self.inflight[path] = entry
+                elif entry.get("event") == "done":
+                    self.inflight.pop(path, None)
+                    self.done[path] = entry
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+
+    def ingested(
+        self, path: str, sig: Optional[Signature], submission_id: str, ids: Dict[str, Any]
+    ) -> None:
+        entry = dict(
+            ids, event="ingested", path=path, signature=sig, submission_id=submission_id
+        )
+        with self._lock:
+            self.inflight[path] = entry
+        self._append(entry)
+
+    def finished(
+        self, path: str, sig: Optional[Signature], submission_id: str, status: str
+    ) -> None:
+        entry = {
+            "event": "done",
+            "path": path,
+            "signature": sig,
+            "submission_id": submission_id,
+            "status": status,
+        }
+        with self._lock:
+            self.inflight.pop(path, None)
+            self.done[path] = entry
+        self._append(entry)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class BatchRunner:
+    """Runs documents through the pipeline and records results and checkpoints."""
+
+    def __init__(
+        self,
+        schema: str,
+        store: SubmissionStore,
+        checkpoint: Checkpoint,
+        output: TextIO,
+        concurrency: int = 4,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
+        retry_errors: bool = False,
+        prompts_dir: str = "prompts",
+        auto_schema: bool = False,
+    ):
+        self.schema = schema
+        self.yaml_file = f"{schema}.yaml"
+        self.store = store
+        self.checkpoint = checkpoint
+        self.output = output
+        self.concurrency = max(1, concurrency)
+        self.use_cache = use_cache
+        self.refresh_cache = refresh_cache
+        self.retry_errors = retry_errors
+        self.prompts_dir = prompts_dir
+        self.auto_schema = auto_schema
+        self.counts = {"complete": 0, "error": 0, "skipped": 0, "resumed": 0}
+        self._output_lock = threading.Lock()
+        self._counts_lock = threading.Lock()
+
+    def _count(self, key: str) -> None:
+        with self._counts_lock:
+            self.counts[key] += 1
+
+    def _should_skip(self, path: str, sig: Optional[Signature]) -> bool:
+        done = self.checkpoint.done.get(path)
+        if done is None or tuple(done.get("signature") or ()) != sig:
+            return False
+        return done.get("status") == "complete" or not self.retry_errors
+
+    def run(self, paths: List[str], on_progress=None) -> Dict[str, int]:
+        """Process ``paths``; return counts of complete/error/skipped/resumed documents."""
+        pool = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="batch-worker")
+        pending: Set[Future] = set()
+        try:
+            for path in paths:
+                sig = signature(path)
+                if self._should_skip(path, sig):
+                    self._count("skipped")
+                    continue
+                # Keep a bounded number of queued futures for very large inputs.
+                while len(pending) >= self.concurrency * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(pool.submit(self._run_one, path, sig, on_progress))
+            for future in wait(pending).done:
+                future.result()
+        except BaseException:
+            # Ctrl-C: drop queued documents; in-flight ones stay checkpointed.
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+        pool.shutdown()
+        return dict(self.counts)
+
+    def _run_one(self, path: str, sig: Optional[Signature], on_progress=None) -> None:
+        """Process one document; a failure at any step becomes its error record.
+
+        Errors never propagate to :meth:`run`, so one bad document cannot
+        cancel the rest of the batch.
+        """
+        submission_id: Optional[str] = None
+        try:
+            document = SampleDocument(path)
+            resume = self.checkpoint.inflight.get(path)
+            if resume is not None and tuple(resume.get("signature") or ()) != sig:
+                resume = None
+
+            existing = self.store.get(resume["submission_id"]) if resume is not None else None
+            if existing is not None:
+                submission_id = existing["id"]
+                yaml_file = existing.get("yaml_file") or self.yaml_file
+                self.store.update(submission_id, status=PROCESSING, error=None)
+            else:
+                record = {
+                    "filename": document.name,
+                    "file_size": sig[1] if sig else None,
+                    "yaml_file": self.yaml_file,
+                    "status": QUEUED,
+                    "source_path": path,
+                }
+                submission_id = self.store.record(record)["id"]
+                yaml_file = self.yaml_file
+                if self.auto_schema and resume is None:
+                    classification = classify(
+                        document, self.yaml_file, prompts_dir=self.prompts_dir
+                    )
+                    yaml_file = classification.schema
+                    self.store.update(
+                        submission_id,
+                        yaml_file=yaml_file,
+                        classification=classification.as_dict(),
+                    )
+
+            state = {"current": PROCESSING if resume else QUEUED}
+
+            def on_stage(stage: str) -> None:
+                new_state = _STAGE_STATES.get(stage)
+                if new_state and new_state != state["current"]:
+                    state["current"] = new_state
+                    self.store.update(submission_id, status=new_state)
+
+            def on_ingest(ids: Dict[str, Any]) -> None:
+                self.checkpoint.ingested(path, sig, submission_id, ids)
+
+            processor = get_processor(
+                os.path.splitext(yaml_file)[0], prompts_dir=self.prompts_dir
+            )
+            if resume is not None:
+                self._count("resumed")
+                job = processor.resume(
+                    document,
+                    resume["process_id"],
+                    on_stage=on_stage,
+                    use_cache=self.use_cache,
+                    bucket_id=resume.get("bucket_id"),
+                    workflow_id=resume.get("workflow_id"),
+                )
+            else:
+                job = processor.process(
+                    document,
+                    on_stage=on_stage,
+                    use_cache=self.use_cache,
+                    refresh_cache=self.refresh_cache,
+                    on_ingest=on_ingest,
+                )
+
+            job.update(yaml_file=yaml_file, status="complete", progress=None, error=None)
+            record = self.store.update(submission_id, **job) or dict(job, id=submission_id)
+        except Exception as exc:
+            record = self._record_error(path, sig, submission_id, exc)
+        self._finish(path, sig, record, on_progress)
+
+    def _record_error(
+        self, path: str, sig: Optional[Signature], submission_id: Optional[str], exc: Exception
+    ) -> Dict[str, Any]:
+        """Store ``exc`` as the document's error, creating its submission if needed."""
+        fields = {
+            "status": "error",
+            "error": str(exc),
+            "timings": getattr(exc, "timings", None) or {},
+        }
+        record = None
+        try:
+            if submission_id is None:
+                record = self.store.record(
+                    dict(
+                        fields,
+                        filename=os.path.basename(path),
+                        file_size=sig[1] if sig else None,
+                        yaml_file=self.yaml_file,
+                        source_path=path,
+                    )
+                )
+            else:
+                record = self.store.update(submission_id, **fields)
+        except Exception:
+            # The store itself is failing; still report the document below.
+            pass
+        return record or dict(fields, id=submission_id, source_path=path)
+
+    def _finish(
+        self, path: str, sig: Optional[Signature], record: Dict[str, Any], on_progress
+    ) -> None:
+        status = record.get("status", "error")
+        with self._output_lock:
+            self.output.write(json.dumps(dict(record, source_path=path), default=str) + "\n")
+            self.output.flush()
+        self.checkpoint.finished(path, sig, record["id"], status)
+        self._count("complete" if status == "complete" else "error")
+        if on_progress is not None:
+            on_progress(path, record)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m apps.batch",
+        description="Extract every document in a directory or manifest with GroundX.",
+    )
+    parser.add_argument("source", help="directory to walk, or a manifest file of paths")
+    parser.add_argument(
+        "--schema", default="simple", help="schema name under prompts/ (default: simple)"
+    )
+    parser.add_argument("--prompts-dir", default="prompts")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=int(os.getenv("BILLING_WORKERS", "4")),
+        help="documents processed at once (default: BILLING_WORKERS or 4)",
+    )
+    parser.add_argument(
+        "--output",
+        default="batch-results.jsonl",
+        help="JSONL results, appended across runs ('-' for stdout)",
+    )
+    parser.add_argument("--checkpoint", help="progress journal (default: <output>.checkpoint)")
+    parser.add_argument(
+        "--submissions-dir", help="SubmissionStore directory (default: SUBMISSIONS_DIR)"
+    )
+    cache = parser.add_mutually_exclusive_group()
+    cache.add_argument("--no-cache", action="store_true", help="always call GroundX")
+    cache.add_argument(
+        "--refresh-cache", action="store_true", help="re-extract and overwrite cached results"
+    )
+    parser.add_argument(
+        "--retry-errors", action="store_true", help="re-run documents that previously failed"
+    )
+    parser.add_argument(
+        "--auto-schema",
+        action="store_true",
+        help="pick each document's schema from its first page, falling back to --schema",
+    )
+    args = parser.parse_args(argv)
+
+    schema = args.schema[:-5] if args.schema.endswith(".yaml") else args.schema
+    if not os.path.exists(os.path.join(args.prompts_dir, f"{schema}.yaml")):
+        parser.error(f"schema {schema!r} not found under {args.prompts_dir}/")
+    if not os.path.exists(args.source):
+        parser.error(f"{args.source} does not exist")
+
+    processor = get_processor(schema, prompts_dir=args.prompts_dir)
+    if not processor.is_ready:
+        print(f"GroundX is not configured: {processor.init_error}", file=sys.stderr)
+        return 2
+
+    paths = discover(args.source)
+    checkpoint_path = args.checkpoint or (
+        "batch-results.jsonl.checkpoint" if args.output == "-" else f"{args.output}.checkpoint"
+    )
+    checkpoint = Checkpoint(checkpoint_path)
+    output = sys.stdout if args.output == "-" else open(args.output, "a")
+    log = sys.stderr
+
+    total = len(paths)
+    finished = [0]
+
+    def on_progress(path: str, record: Dict[str, Any]) -> None:
+        finished[0] += 1
+        detail = record.get("error") or record.get("document_id") or ""
+        print(f"[{finished[0]}] {record.get('status')}: {path} {detail}".rstrip(), file=log)
+
+    runner = BatchRunner(
+        schema,
+        SubmissionStore(base_dir=args.submissions_dir),
+        checkpoint,
+        output,
+        concurrency=args.concurrency,
+        use_cache=not args.no_cache,
+        refresh_cache=args.refresh_cache,
+        retry_errors=args.retry_errors,
+        prompts_dir=args.prompts_dir,
+        auto_schema=args.auto_schema,
+    )
+    print(
+        f"{total} document(s); {len(checkpoint.done)} done and "
+        f"{len(checkpoint.inflight)} in flight in {checkpoint_path}",
+        file=log,
+    )
+    started = time.monotonic()
+    try:
+        counts = runner.run(paths, on_progress=on_progress)
+    except KeyboardInterrupt:
+        print("Interrupted; re-run the same command to resume.", file=log)
+        return 130
+    finally:
+        checkpoint.close()
+        if output is not sys.stdout:
+            output.close()
+
+    print(
+        f"Done in {time.monotonic() - started:.1f}s: {counts['complete']} complete, "
+        f"{counts['error']} failed, {counts['skipped']} skipped, {counts['resumed']} resumed.",
+        file=log,
+    )
+    return 1 if counts["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+Bulk export of stored submissions from the command line.
+
+Streams every submission matching the filters to JSONL, CSV or Parquet (see
+:mod:`apps.ui.components.export`)::
+
+    python -m apps.export --format csv --since 2025-07-01 --until 2025-07-31
+        [--status complete] [--schema simple] [--output july.csv]
+
+``--until`` is inclusive when given as a date. Without ``--output`` the
+export is written to stdout.
+"""
+
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+from apps.ui.components.export import FORMATS, Exporter, ExportError
+from apps.ui.components.submission_store import SubmissionStore
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m apps.export",
+        description="Export stored submissions as JSONL, CSV or Parquet.",
+    )
+    parser.add_argument("--format", choices=FORMATS, default="jsonl")
+    parser.add_argument("--output", "-o", help="file to write (default: stdout)")
+    parser.add_argument(
+        "--status", action="append", help="only this status (repeatable, e.g. complete)"
+    )
+    parser.add_argument("--since", help="created on or after this ISO date/timestamp")
+    parser.add_argument(
+        "--until", help="created on or before this ISO date (a full timestamp is exclusive)"
+    )
+    parser.add_argument("--schema", help="only submissions extracted with this schema")
+    parser.add_argument("--prompts-dir", default="prompts")
+    parser.add_argument(
+        "--submissions-dir", help="SubmissionStore directory (default: SUBMISSIONS_DIR)"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        exporter = Exporter(
+            store=SubmissionStore(base_dir=args.submissions_dir),
+            status=args.status,
+            since=args.since,
+            until=args.until,
+            schema=args.schema,
+            prompts_dir=args.prompts_dir,
+        )
+        if args.output:
+            count = exporter.write_file(args.format, args.output)
+        elif args.format == "parquet":
+            count = exporter.write_parquet(sys.stdout.buffer)
+        else:
+            count = exporter.write(args.format, sys.stdout)
+            sys.stdout.flush()
+    except ExportError as exc:
+        print(f"Export failed: {exc}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # Output piped into e.g. `head`, which stopped reading.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+
+    print(f"Exported {count} submission(s).", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Maintenance commands for the submissions directory.
+
+::
+
+    python -m apps.submissions compact [--submissions-dir DIR] [--json]
+    python -m apps.submissions prune [--dry-run] [--max-age-days N]
+        [--keep-errors-days N] [--max-count N]
+    python -m apps.submissions archive [--month YYYY-MM] [--id ID] [--status S]
+
+``compact`` rewrites every stored record in the current on-disk encoding
+(compact JSON, gzipped above ``SUBMISSIONS_COMPRESS_THRESHOLD``; see
+:mod:`apps.ui.components.submission_store`), removes temp files left by an
+interrupted write, and reports how many bytes it reclaimed. Run it once after
+upgrading to shrink records written pretty-printed by older versions.
+
+``prune`` applies the retention policy once (limits default to the
+``SUBMISSIONS_*`` environment, see :mod:`apps.ui.components.retention`),
+moving expired submissions into the monthly archive bundles, and reports
+what it reclaimed. ``archive`` lists the bundles, or prints archived records
+as JSONL for one ``--month`` or ``--id``.
+"""
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from apps.ui.components.retention import Archive, RetentionPolicy, run_exclusive
+from apps.ui.components.submission_store import SubmissionStore
+
+
+def _compact(store: SubmissionStore, as_json: bool) -> int:
+    stats = store.compact()
+    if as_json:
+        print(json.dumps(stats))
+    else:
+        print(
+            f"Compacted {stats['rewritten']} of {stats['files']} record(s): "
+            f"{stats['bytes_before']:,} -> {stats['bytes_after']:,} bytes "
+            f"({stats['bytes_saved']:,} saved)."
+        )
+    return 0
+
+
+def _prune(store: SubmissionStore, args: argparse.Namespace) -> int:
+    env = RetentionPolicy.from_env()
+
+    def override(value, default):
+        return default if value is None else (value if value > 0 else None)
+
+    policy = RetentionPolicy(
+        max_age_days=override(args.max_age_days, env.max_age_days),
+        max_count=override(args.max_count, env.max_count),
+        keep_errors_days=override(args.keep_errors_days, env.keep_errors_days),
+    )
+    if not policy.enabled:
+        print("No retention limit configured; nothing to prune.", file=sys.stderr)
+        return 2
+    report = run_exclusive(store, policy=policy, dry_run=args.dry_run)
+    if report is None:
+        print("Another process is pruning this directory.", file=sys.stderr)
+        return 1
+    if args.json:
+        print(json.dumps(report))
+    elif args.dry_run:
+        print(
+            f"{report['expired']} submission(s) would be archived "
+            f"({', '.join(report['months']) or 'none'})."
+        )
+    else:
+        print(
+            f"Archived {report['archived']} submission(s) into "
+            f"{', '.join(report['months']) or 'no months'}: "
+            f"{report['bytes_reclaimed']:,} bytes reclaimed, "
+            f"{report['archive_bytes']:,} bytes added to bundles in {report['duration']:.1f}s."
+        )
+        if report.get("skipped"):
+            print(
+                f"{report['skipped']} unreadable submission(s) were left in place; "
+                "see the log for their ids.",
+                file=sys.stderr,
+            )
+    return 0
+
+
+def _archive(store: SubmissionStore, args: argparse.Namespace) -> int:
+    archive = Archive(store)
+    if args.id:
+        record = archive.get(args.id)
+        if record is None:
+            print(f"No archived submission {args.id}.", file=sys.stderr)
+            return 1
+        print(json.dumps(record, default=str))
+    elif args.month:
+        for record in archive.records(args.month, status=args.status):
+            print(json.dumps(record, default=str))
+    elif args.json:
+        print(json.dumps(archive.months()))
+    else:
+        for month in archive.months():
+            print(
+                f"{month['month']}  {month['count']:>7} submission(s)  "
+                f"{month['bytes']:>12,} bytes"
+            )
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m apps.submissions",
+        description="Maintain the submissions directory.",
+    )
+    parser.add_argument(
+        "--submissions-dir", help="SubmissionStore directory (default: SUBMISSIONS_DIR)"
+    )
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("compact", help="rewrite records compactly and report bytes saved")
+    prune = commands.add_parser("prune", help="archive submissions past retention")
+    prune.add_argument("--dry-run", action="store_true", help="only count what would expire")
+    prune.add_argument("--max-age-days", type=float, help="0 disables (default: env)")
+    prune.add_argument("--keep-errors-days", type=float, help="0 disables (default: env)")
+    prune.add_argument("--max-count", type=int, help="0 disables (default: env)")
+    archive = commands.add_parser("archive", help="list or read archived submissions")
+    archive.add_argument("--month", help="print this month's records (YYYY-MM) as JSONL")
+    archive.add_argument("--id", help="print one archived submission")
+    archive.add_argument("--status", help="with --month, only this status")
+    args = parser.parse_args(argv)
+
+    store = SubmissionStore(base_dir=args.submissions_dir)
+    if args.command == "compact":
+        return _compact(store, args.json)
+    if args.command == "prune":
+        return _prune(store, args)
+    return _archive(store, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
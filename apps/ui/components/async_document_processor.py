@@ -0,0 +1,416 @@
+"""
+Asyncio variant of the extraction pipeline.
+
+:class:`AsyncDocumentProcessor` runs the same stages as
+:class:`~apps.ui.components.document_processor.DocumentProcessor` —
+``ensure_bucket``, ``ensure_workflow``, ``ingest_file``,
+``wait_for_completion`` and ``download_extract`` — as coroutines on the
+GroundX SDK's ``AsyncGroundX`` client, so a single worker thread can keep many
+documents in flight. A semaphore bounds how many documents run at once.
+
+It wraps a synchronous ``DocumentProcessor`` (``self.processor``) rather than
+subclassing it: prompt rendering, the workflow registry, the extraction cache
+and job-record helpers are shared, while the synchronous API stays intact for
+callers of the wrapped processor. Anything that touches local files — the
+cache lookups, upload staging and the workflow registry — runs in
+``asyncio.to_thread`` so it never blocks the event loop. Workflow setup reuses
+``DocumentProcessor.ensure_workflow`` in a thread, so it shares that method's
+per-schema single-flight lock with synchronous jobs in the same process.
+
+The ``AsyncGroundX`` client (whose pooled connections belong to the loop
+that opened them), the semaphore and the bucket lock are created per event
+loop, so one processor can be driven by successive ``asyncio.run`` calls.
+Whoever drives a loop closes that loop's connections before it ends, with
+``await processor.aclose()`` or by using the processor as an async context
+manager (``async with processor: ...``).
+
+Job records are built by the same helpers as ``DocumentProcessor.process``, so
+they can be passed to ``SubmissionStore.record`` unchanged.
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from apps.ui.components.bucket_cache import BUCKET_CACHE
+from apps.ui.components.document_processor import (
+    _COMPLETE_STATES,
+    _ERROR_STATES,
+    STAGE_BUCKET,
+    STAGE_CACHE,
+    STAGE_DOWNLOAD,
+    STAGE_INGEST,
+    STAGE_PROCESSING,
+    STAGE_STAGING,
+    STAGE_WORKFLOW,
+    DocumentProcessor,
+    DocumentProcessorError,
+    StatusCallback,
+    _UnknownBucketError,
+)
+from apps.ui.components.extract_quality import summarize
+from apps.ui.components.metrics import STATUS_POLLS, UPLOAD_BYTES, StageClock
+from apps.ui.components.polling import PollStats, status_phase
+
+
+def _async_sdk():
+    """``(AsyncGroundX, build_async_client)``, or ``(None, None)`` without the SDK.
+
+    Imported on first use, like the synchronous SDK (see
+    :func:`~apps.ui.components.document_processor.load_sdk`).
+    """
+    try:
+        from groundx import AsyncGroundX
+
+        from apps.ui.components.http_pool import build_async_client
+    except Exception:  # pragma: no cover - depends on optional extras
+        return None, None
+    return AsyncGroundX, build_async_client
+
+
+@dataclass
+class _LoopState:
+    """Client and asyncio primitives bound to one event loop."""
+
+    client: Any
+    http: Any
+    semaphore: asyncio.Semaphore
+    bucket_lock: asyncio.Lock
+
+
+class AsyncDocumentProcessor:
+    """Coroutine-based pipeline around a :class:`DocumentProcessor`, on ``AsyncGroundX``."""
+
+    def __init__(
+        self,
+        *args: Any,
+        concurrency: int = 16,
+        processor: Optional[DocumentProcessor] = None,
+        **kwargs: Any,
+    ):
+        """Initialize the async client around a synchronous processor.
+
+        Args:
+            concurrency: Maximum number of documents processed at once by
+                :meth:`process_all` / :meth:`process` (per event loop).
+            processor: Synchronous processor to share schema, registry and
+                cache state with; built from ``*args, **kwargs`` when omitted.
+            *args, **kwargs: Forwarded to :class:`DocumentProcessor`.
+        """
+        self.processor = processor or DocumentProcessor(*args, **kwargs)
+        self.concurrency = concurrency
+        self._init_error: Optional[str] = None
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]"
+        self._loops = weakref.WeakKeyDictionary()
+        self._loops_lock = threading.Lock()
+
+        self._async_groundx, self._build_async_client = _async_sdk()
+        if self.processor.is_ready and self._async_groundx is None:
+            self._init_error = "The installed groundx SDK has no AsyncGroundX client."
+
+    @property
+    def is_ready(self) -> bool:
+        """True when the async client is usable in addition to the sync pieces."""
+        return self.processor.is_ready and self._async_groundx is not None
+
+    @property
+    def async_client(self) -> Any:
+        """The ``AsyncGroundX`` client for the running event loop."""
+        return self._loop_state().client
+
+    @property
+    def init_error(self) -> Optional[str]:
+        """Why the processor is not ready, if it isn't."""
+        return self.processor.init_error or self._init_error
+
+    def _loop_state(self) -> _LoopState:
+        """Client, semaphore and bucket lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._loops_lock:
+            state = self._loops.get(loop)
+            if state is None:
+                http = self._build_async_client()
+                client_kwargs: Dict[str, Any] = {
+                    "api_key": os.getenv("GROUNDX_API_KEY"),
+                    "httpx_client": http,
+                }
+                if self.processor.base_url:
+                    client_kwargs["base_url"] = self.processor.base_url
+                state = _LoopState(
+                    client=self._async_groundx(**client_kwargs),
+                    http=http,
+                    semaphore=asyncio.Semaphore(self.concurrency),
+                    bucket_lock=asyncio.Lock(),
+                )
+                self._loops[loop] = state
+            return state
+
+    async def aclose(self) -> None:
+        """Close the running event loop's client and its pooled connections.
+
+        The next call on this loop builds a fresh client.
+        """
+        loop = asyncio.get_running_loop()
+        with self._loops_lock:
+            state = self._loops.pop(loop, None)
+        if state is not None:
+            await state.http.aclose()
+
+    async def __aenter__(self) -> "AsyncDocumentProcessor":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    # -- pipeline steps ------------------------------------------------------
+
+    async def ensure_bucket(self) -> int:
+        """Return the working bucket id via the shared cache, listing on a miss."""
+        key = (self.processor.base_url, self.processor.bucket_name)
+        bucket_id = BUCKET_CACHE.peek(key)
+        if bucket_id is not None:
+            return bucket_id
+        async with self._loop_state().bucket_lock:
+            bucket_id = BUCKET_CACHE.peek(key)
+            if bucket_id is None:
+                bucket_id = await self._resolve_bucket()
+                BUCKET_CACHE.put(key, bucket_id)
+            return bucket_id
+
+    async def _resolve_bucket(self) -> int:
+        bucket_name = self.processor.bucket_name
+        try:
+            existing = await self.async_client.buckets.list()
+            for bucket in getattr(existing, "buckets", []) or []:
+                if bucket.name == bucket_name:
+                    return bucket.bucket_id
+        except Exception:
+            # Listing is best-effort; fall through to create.
+            pass
+
+        res = await self.async_client.buckets.create(name=bucket_name)
+        if not res.bucket:
+            raise DocumentProcessorError(f"Failed to create bucket: {res}")
+        return res.bucket.bucket_id
+
+    async def ensure_workflow(self, set_as_account_default: bool = True) -> str:
+        """Run :meth:`DocumentProcessor.ensure_workflow` in a worker thread.
+
+        The registry lookup is a local file read and the create/update is
+        single-flighted by a thread lock shared with synchronous jobs, so
+        neither may run on the event loop.
+        """
+        return await asyncio.to_thread(
+            self.processor.ensure_workflow, set_as_account_default=set_as_account_default
+        )
+
+    async def ingest_file(
+        self,
+        file_path: str,
+        bucket_id: int,
+        file_name: Optional[str] = None,
+    ) -> str:
+        """Ingest a local file into the bucket, returning the process_id."""
+        files = [(file_path, file_name)]
+        documents = self.processor._ingest_documents(files, bucket_id)
+        try:
+            res = await self.async_client.ingest(
+                documents=documents, **self.processor._ingest_options()
+            )
+        except Exception as exc:
+            raise self.processor._ingest_error(exc, bucket_id) from exc
+        UPLOAD_BYTES.inc(await asyncio.to_thread(self.processor._upload_size, files))
+        return res.ingest.process_id
+
+    async def wait_for_completion(
+        self,
+        process_id: str,
+        on_status: Optional[StatusCallback] = None,
+        poll_interval: Optional[float] = None,
+        timeout: float = 900.0,
+        stats: Optional[PollStats] = None,
+    ) -> str:
+        """Poll the processing status with ``asyncio.sleep`` between checks."""
+        polling = self.processor._polling_for(poll_interval)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        last_status: Optional[str] = None
+        last_phase: Optional[str] = None
+        attempt = 0
+        stats = stats if stats is not None else PollStats()
+
+        while True:
+            res = await self.async_client.documents.get_processing_status_by_id(
+                process_id=process_id,
+            )
+            status = (res.ingest.status or "").lower()
+            document_id = DocumentProcessor._document_id_from_status(res)
+
+            if status != last_status and on_status is not None:
+                on_status(status)
+                last_status = status
+
+            phase = status_phase(status)
+            STATUS_POLLS.inc(phase=phase)
+            if phase != last_phase:
+                attempt, last_phase = 0, phase
+
+            if status in _COMPLETE_STATES:
+                stats.record(phase)
+                if not document_id:
+                    raise DocumentProcessorError(
+                        "Processing completed but no document_id was returned."
+                    )
+                return document_id
+
+            if status in _ERROR_STATES:
+                stats.record(phase)
+                raise DocumentProcessorError(
+                    f"Document processing failed with status '{status}'."
+                )
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                stats.record(phase)
+                raise DocumentProcessorError(
+                    f"Timed out waiting for processing (last status: '{status}')."
+                )
+
+            delay = polling.next_delay(phase, attempt, remaining)
+            stats.record(phase, delay)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def download_extract(self, document_id: str) -> Dict[str, Any]:
+        """Download the structured extraction JSON for a document."""
+        return await self.async_client.documents.get_extract(document_id=document_id)
+
+    async def _validate_extract(self, document_id: str, extracted_data: Any) -> Dict[str, Any]:
+        quality = summarize(extracted_data)
+        if quality["has_values"]:
+            return quality
+
+        extracted_flag = None
+        try:
+            detail = await self.async_client.documents.get(document_id=document_id)
+            doc = getattr(detail, "document", detail)
+            extracted_flag = getattr(doc, "extracted", None)
+        except Exception:
+            pass
+
+        raise self.processor._empty_extract_error(document_id, extracted_flag)
+
+    # -- orchestration -------------------------------------------------------
+
+    async def process(
+        self,
+        uploaded_file,
+        on_status: Optional[StatusCallback] = None,
+        set_as_account_default: bool = True,
+        on_stage: Optional[StatusCallback] = None,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
+    ) -> Dict[str, Any]:
+        """Run the end-to-end pipeline for one file under the concurrency limit.
+
+        Returns the same job record as :meth:`DocumentProcessor.process`.
+        Raises :class:`DocumentProcessorError` on failure.
+        """
+        if not self.is_ready:
+            raise DocumentProcessorError(
+                self.init_error or "AsyncDocumentProcessor is not initialized."
+            )
+        processor = self.processor
+        clock = StageClock()
+        emit, enter = processor._stage_hooks(clock, on_status, on_stage)
+
+        # Identical bytes + unchanged schema: replay the stored extraction.
+        clock.enter(STAGE_CACHE)
+        cache_key = None
+        if use_cache:
+            cache_key = await asyncio.to_thread(processor._cache_key, uploaded_file)
+        if cache_key is not None and not refresh_cache:
+            cached = await asyncio.to_thread(processor._cached_job, uploaded_file, cache_key)
+            if cached is not None:
+                emit("Reused cached extraction for an identical document.")
+                cached["timings"] = clock.finish()
+                return cached
+
+        # Includes waiting for a concurrency slot.
+        clock.enter(STAGE_STAGING)
+        async with self._loop_state().semaphore:
+            tmp_dir, tmp_path = await asyncio.to_thread(processor._stage_upload, uploaded_file)
+            try:
+                enter(STAGE_BUCKET, "Creating bucket…")
+                bucket_id = await self.ensure_bucket()
+
+                enter(STAGE_WORKFLOW, "Creating extraction workflow…")
+                workflow_id = await self.ensure_workflow(
+                    set_as_account_default=set_as_account_default
+                )
+
+                enter(STAGE_INGEST, "Ingesting document…")
+                try:
+                    process_id = await self.ingest_file(
+                        tmp_path, bucket_id, file_name=uploaded_file.name
+                    )
+                except _UnknownBucketError:
+                    bucket_id = await self.ensure_bucket()
+                    process_id = await self.ingest_file(
+                        tmp_path, bucket_id, file_name=uploaded_file.name
+                    )
+
+                enter(STAGE_PROCESSING, "Processing document…")
+                poll_stats = PollStats()
+                document_id = await self.wait_for_completion(
+                    process_id,
+                    on_status=lambda s: emit(f"Status: {s}"),
+                    stats=poll_stats,
+                )
+
+                enter(STAGE_DOWNLOAD, "Downloading extractions…")
+                extracted_data = await self.download_extract(document_id)
+                quality = await self._validate_extract(document_id, extracted_data)
+
+                job = processor._job_record(
+                    uploaded_file,
+                    bucket_id=bucket_id,
+                    workflow_id=workflow_id,
+                    process_id=process_id,
+                    document_id=document_id,
+                    extracted_data=extracted_data,
+                    quality=quality,
+                    polling=poll_stats.as_dict(),
+                )
+                await asyncio.to_thread(processor._remember_job, cache_key, job)
+                job["timings"] = clock.finish()
+                return job
+            except Exception as exc:
+                exc.timings = clock.finish()
+                raise
+            finally:
+                await asyncio.to_thread(processor._cleanup_upload, tmp_dir, tmp_path)
+
+    async def process_all(
+        self,
+        uploaded_files: Sequence[Any],
+        set_as_account_default: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Process many files concurrently; return one job record per file, in order.
+
+        A failing file yields an error record (``status: "error"``) instead of
+        cancelling the others.
+        """
+
+        async def run(uploaded_file) -> Dict[str, Any]:
+            try:
+                return await self.process(
+                    uploaded_file, set_as_account_default=set_as_account_default
+                )
+            except Exception as exc:
+                return self.processor._error_record(uploaded_file, str(exc))
+
+        return list(await asyncio.gather(*(run(f) for f in uploaded_files)))
@@ -0,0 +1,86 @@
+"""
+Process-wide cache of resolved GroundX bucket ids.
+
+``DocumentProcessor.ensure_bucket`` has to list every bucket in the account to
+find ``workflow-test``; once it is known that lookup is pure overhead. Entries
+are keyed by ``(base_url, bucket_name)``, expire after ``GROUNDX_BUCKET_CACHE_TTL``
+seconds (default 600), and are dropped as soon as an ingest reports the bucket
+no longer exists. Concurrent sessions resolving the same key wait on a single
+lookup instead of each listing buckets.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+BucketKey = Tuple[Optional[str], str]
+
+
+class BucketCache:
+    """Thread-safe TTL cache with single-flight resolution per key."""
+
+    def __init__(self, ttl: Optional[float] = None):
+        """Initialize the cache; ``ttl`` defaults to ``GROUNDX_BUCKET_CACHE_TTL``."""
+        if ttl is None:
+            ttl = float(os.getenv("GROUNDX_BUCKET_CACHE_TTL", "600"))
+        self.ttl = ttl
+        self._entries: Dict[BucketKey, Tuple[int, float]] = {}
+        self._key_locks: Dict[BucketKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _fresh(self, key: BucketKey) -> Optional[int]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        bucket_id, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return bucket_id
+
+    def get_or_resolve(self, key: BucketKey, resolve: Callable[[], int]) -> int:
+        """Return the cached bucket id for ``key``, calling ``resolve`` on a miss.
+
+        Only one caller per key runs ``resolve``; the others block until it
+        finishes and then reuse its result.
+        """
+        with self._lock:
+            bucket_id = self._fresh(key)
+            if bucket_id is not None:
+                return bucket_id
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                bucket_id = self._fresh(key)
+                if bucket_id is not None:
+                    return bucket_id
+            bucket_id = resolve()
+            with self._lock:
+                self._entries[key] = (bucket_id, time.monotonic() + self.ttl)
+            return bucket_id
+
+    def peek(self, key: BucketKey) -> Optional[int]:
+        """Return the cached bucket id for ``key`` without resolving a miss."""
+        with self._lock:
+            return self._fresh(key)
+
+    def put(self, key: BucketKey, bucket_id: int) -> None:
+        """Cache ``bucket_id`` for ``key`` (for callers that resolve it themselves)."""
+        with self._lock:
+            self._entries[key] = (bucket_id, time.monotonic() + self.ttl)
+
+    def invalidate(self, key: BucketKey) -> None:
+        """Forget ``key`` so the next lookup lists buckets again."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached bucket id."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every DocumentProcessor in the Streamlit server process.
+BUCKET_CACHE = BucketCache()
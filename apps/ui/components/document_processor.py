@@ -5,7 +5,8 @@ This mirrors the flow in ``get_started.ipynb`` exactly:
 
     1. Initialize the GroundX client and the ExtractPromptManager
     2. Create (or reuse) a bucket
-    3. Create a workflow from the prompt manager and set it as the account default
+    3. Create (or reuse) a workflow from the prompt manager and set it as the
+       account default
     4. Ingest the uploaded document
     5. Poll the processing status by ``process_id`` until complete
     6. Download the structured extractions by ``document_id``
@@ -18,8 +19,29 @@ and the notebook produce identical workflows.
 import os
 import sys
 import tempfile
+import threading
 import time
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from apps.ui.components.bucket_cache import BUCKET_CACHE
+from apps.ui.components.extract_quality import has_values, quality_of, summarize
+from apps.ui.components.extraction_cache import CACHED_FIELDS, ExtractionCache, file_hash
+from apps.ui.components.metrics import (
+    STAGE_SECONDS,
+    STATUS_POLLS,
+    UPLOAD_BYTES,
+    StageClock,
+)
+from apps.ui.components.polling import (
+    AdaptivePolling,
+    FixedPolling,
+    PollingStrategy,
+    PollStats,
+    QUEUED,
+    status_phase,
+)
+from apps.ui.components.uploads import local_path, spool_to, upload_sha256
+from apps.ui.components.workflow_registry import WorkflowRegistry, workflow_fingerprint
 
 # The notebook's prompt machinery (manager.py + prompts/) lives at the repo
 # root. Pin the repo root to the front of sys.path so ``manager`` and
@@ -32,39 +54,86 @@ _REPO_ROOT = os.path.dirname(
 if _REPO_ROOT not in sys.path:
     sys.path.insert(0, _REPO_ROOT)
 
-# Imported lazily-safe so the module still imports for local dev / tests where
-# the extract extra isn't installed. Each stage is tracked separately so the UI
-# can report *which* dependency is missing rather than a blanket message.
+# The SDK (groundx, groundx.extract) and the prompt machinery (manager, which
+# pulls in the prompts package) are the most expensive imports in the app, so
+# they are loaded on first use by ``load_sdk`` rather than at module import —
+# pages that never build a processor (Documentation, Job History) skip them.
+# Each stage is tracked separately so the UI can report *which* dependency is
+# missing rather than a blanket message, and the module still imports for
+# local dev where the extract extra isn't installed.
 _SDK_ERROR: Optional[Exception] = None
 _MANAGER_ERROR: Optional[Exception] = None
+_SDK_LOADED = False
+_SDK_LOCK = threading.Lock()
+
+Document = GroundX = Logger = Source = shared_client = None  # type: ignore
+ExtractPromptManager = None  # type: ignore
+
+
+def load_sdk() -> bool:
+    """Import the GroundX SDK and prompt manager once; True when both are usable."""
+    global Document, GroundX, Logger, Source, shared_client, ExtractPromptManager
+    global _SDK_ERROR, _MANAGER_ERROR, _SDK_LOADED
+    with _SDK_LOCK:
+        if not _SDK_LOADED:
+            try:
+                from groundx import Document, GroundX
+                from groundx.extract import Logger, Source
 
-try:
-    from groundx import Document, GroundX
-    from groundx.extract import Logger, Source
-except Exception as exc:  # pragma: no cover - depends on optional extras
-    Document = GroundX = Logger = Source = None  # type: ignore
-    _SDK_ERROR = exc
+                from apps.ui.components.http_pool import shared_client
+            except Exception as exc:  # pragma: no cover - depends on optional extras
+                _SDK_ERROR = exc
 
-try:
-    from manager import ExtractPromptManager
-except Exception as exc:  # pragma: no cover - depends on repo layout
-    ExtractPromptManager = None  # type: ignore
-    _MANAGER_ERROR = exc
+            try:
+                from manager import ExtractPromptManager
+            except Exception as exc:  # pragma: no cover - depends on repo layout
+                _MANAGER_ERROR = exc
 
-GROUNDX_AVAILABLE = _SDK_ERROR is None and _MANAGER_ERROR is None
+            _SDK_LOADED = True
+    return _SDK_ERROR is None and _MANAGER_ERROR is None
 
 
 # Terminal states reported by the ingest status endpoint.
 _COMPLETE_STATES = {"complete", "completed"}
 _ERROR_STATES = {"error", "errors", "failed", "cancelled", "canceled"}
 
+# Per-request ingest limits enforced by the GroundX API (the SDK's
+# ``MAX_BATCH_SIZE`` / ``MAX_BATCH_SIZE_BYTES``). ``process_many`` chunks to these.
+INGEST_BATCH_SIZE = 50
+INGEST_BATCH_BYTES = 50 * 1024 * 1024
+
+# Pipeline stages timed in the record's ``timings``; all but ``cache`` and
+# ``staging`` (local spooling) are reported through ``process(on_stage=...)``.
+# ``ingest`` includes uploading the file to GroundX.
+STAGE_CACHE = "cache"
+STAGE_STAGING = "staging"
+STAGE_BUCKET = "bucket"
+STAGE_WORKFLOW = "workflow"
+STAGE_INGEST = "ingest"
+STAGE_PROCESSING = "processing"
+STAGE_DOWNLOAD = "download"
+
 StatusCallback = Callable[[str], None]
+# Receives {"bucket_id", "workflow_id", "process_id"} once GroundX accepts an ingest.
+IngestCallback = Callable[[Dict[str, Any]], None]
 
 
 class DocumentProcessorError(RuntimeError):
     """Raised when the extraction pipeline cannot be run or fails."""
 
 
+class _UnknownBucketError(DocumentProcessorError):
+    """Raised by ingest when the (cached) bucket id no longer exists."""
+
+
+def _is_unknown_bucket(exc: Exception) -> bool:
+    """True when an ingest error says the target bucket does not exist."""
+    status_code = getattr(exc, "status_code", None)
+    if status_code not in (400, 404):
+        return False
+    return "bucket" in str(getattr(exc, "body", None) or exc).lower()
+
+
 class DocumentProcessor:
     """Runs the GroundX extraction pipeline described in ``get_started.ipynb``."""
 
@@ -73,6 +142,9 @@ class DocumentProcessor:
         prompts_dir: str = "prompts",
         file_name: str = "simple",
         bucket_name: str = "workflow-test",
+        workflow_registry: Optional[WorkflowRegistry] = None,
+        polling: Optional[PollingStrategy] = None,
+        extraction_cache: Optional[ExtractionCache] = None,
     ):
         """Initialize the GroundX client and prompt manager.
 
@@ -82,15 +154,30 @@ class DocumentProcessor:
             file_name: Schema/workflow name to load, without the ``.yaml``
                 suffix (the notebook default is ``"simple"``).
             bucket_name: Bucket to ingest documents into (created if missing).
+            workflow_registry: Where schema → workflow mappings are persisted
+                (defaults to the shared registry on the submissions volume).
+            polling: Status polling strategy (defaults to
+                :class:`~apps.ui.components.polling.AdaptivePolling`).
+            extraction_cache: Content-hash cache of completed extractions
+                (defaults to the shared cache on the submissions volume).
         """
         self.prompts_dir = prompts_dir
         self.file_name = file_name
         self.bucket_name = bucket_name
+        self.workflow_registry = workflow_registry or WorkflowRegistry()
+        self.polling = polling or AdaptivePolling()
+        self.extraction_cache = extraction_cache or ExtractionCache()
+        self.base_url: Optional[str] = None
+        # GroundX deployment + API-key hash; scopes registered workflows.
+        self.account: Optional[str] = None
+        # Presigned-upload endpoint for local files; the SDK's SaaS default when unset.
+        self.upload_api: Optional[str] = os.getenv("GROUNDX_UPLOAD_API") or None
 
         self.gx_client = None
         self.prompt_manager = None
         self._init_error: Optional[str] = None
 
+        load_sdk()
         if _SDK_ERROR is not None:
             self._init_error = (
                 "The 'groundx[extract]' package is not available "
@@ -107,13 +194,16 @@ class DocumentProcessor:
 
         api_key = os.getenv("GROUNDX_API_KEY")
         base_url = os.getenv("GROUNDX_BASE_URL")
+        self.base_url = base_url
+        self.account = WorkflowRegistry.account(base_url, api_key)
         if not api_key:
             self._init_error = "GROUNDX_API_KEY environment variable is not set."
             return
 
         try:
             # base_url is optional (SaaS default); the OpenShift deployment sets it.
-            client_kwargs: Dict[str, Any] = {"api_key": api_key}
+            # Every client shares one pooled keep-alive transport (http_pool).
+            client_kwargs: Dict[str, Any] = {"api_key": api_key, "httpx_client": shared_client()}
             if base_url:
                 client_kwargs["base_url"] = base_url
             self.gx_client = GroundX(**client_kwargs)
@@ -154,6 +244,12 @@ class DocumentProcessor:
     # -- pipeline steps (mirroring the notebook cells) ---------------------
 
     def ensure_bucket(self) -> int:
+        """Return the working bucket id, resolving it through the shared cache."""
+        return BUCKET_CACHE.get_or_resolve(
+            (self.base_url, self.bucket_name), self._resolve_bucket
+        )
+
+    def _resolve_bucket(self) -> int:
         """Create the working bucket, reusing an existing one with the same name."""
         # Reuse an existing bucket so repeated runs don't pile up duplicates.
         try:
@@ -171,20 +267,75 @@ class DocumentProcessor:
         return res.bucket.bucket_id
 
     def ensure_workflow(self, set_as_account_default: bool = True) -> str:
-        """Create the extraction workflow from the prompt manager (notebook step)."""
-        res = self.gx_client.workflows.create(
-            chunk_strategy="element",
-            name=self.file_name,
-            steps=self.prompt_manager.workflow_steps(file_name=self.file_name),
-            extract=self.prompt_manager.workflow_extract_dict(file_name=self.file_name),
-        )
-        workflow_id = res.workflow.workflow_id
+        """Return the extraction workflow for the schema, creating it only when needed.
+
+        The rendered steps + extract config are fingerprinted and looked up in
+        the :class:`WorkflowRegistry`. A matching fingerprint reuses the
+        registered workflow; a changed schema updates that workflow in place
+        (``ExtractPromptManager.update_prompts``), and a new schema — or a
+        registered workflow that no longer exists — creates one (notebook step).
+        The whole sequence runs under the registry entry's lock, so concurrent
+        jobs on a cold schema create a single workflow.
+        """
+        key = WorkflowRegistry.key(self.account, self.file_name)
+        with self.workflow_registry.lock(key):
+            steps, extract, fingerprint, key, entry = self._workflow_plan()
+
+            workflow_id: Optional[str] = None
+            if entry and entry.get("fingerprint") == fingerprint:
+                workflow_id = entry["workflow_id"]
+            elif entry:
+                try:
+                    self.prompt_manager.update_prompts(
+                        workflow_id=entry["workflow_id"], file_name=self.file_name
+                    )
+                    workflow_id = entry["workflow_id"]
+                except Exception:
+                    # The registered workflow is gone (or unusable); recreate below.
+                    workflow_id = None
+
+            if workflow_id is None:
+                res = self.gx_client.workflows.create(
+                    chunk_strategy="element",
+                    name=self.file_name,
+                    steps=steps,
+                    extract=extract,
+                )
+                workflow_id = res.workflow.workflow_id
+
+            self._register_workflow(key, fingerprint, entry, workflow_id)
 
-        if set_as_account_default:
-            # Matches the notebook's "Assign to Account as the Default Prompt" step.
-            self.gx_client.workflows.add_to_account(workflow_id=workflow_id)
+            if set_as_account_default and self._needs_account_default(workflow_id):
+                # Matches the notebook's "Assign to Account as the Default Prompt" step.
+                self.gx_client.workflows.add_to_account(workflow_id=workflow_id)
+                self.workflow_registry.set_account_default(self.account, workflow_id)
 
-        return workflow_id
+            return workflow_id
+
+    def _workflow_plan(self) -> Tuple[Any, Any, str, str, Optional[Dict[str, Any]]]:
+        """Render the schema and look it up: ``(steps, extract, fingerprint, key, entry)``."""
+        steps = self.prompt_manager.workflow_steps(file_name=self.file_name)
+        extract = self.prompt_manager.workflow_extract_dict(file_name=self.file_name)
+        fingerprint = workflow_fingerprint(self.file_name, steps, extract)
+        key = WorkflowRegistry.key(self.account, self.file_name)
+        return steps, extract, fingerprint, key, self.workflow_registry.get(key)
+
+    def _register_workflow(
+        self,
+        key: str,
+        fingerprint: str,
+        entry: Optional[Dict[str, Any]],
+        workflow_id: str,
+    ) -> None:
+        """Persist the schema → workflow mapping when it changed."""
+        if not entry or entry.get("fingerprint") != fingerprint or (
+            entry.get("workflow_id") != workflow_id
+        ):
+            self.workflow_registry.put(key, fingerprint, workflow_id)
+
+    def _needs_account_default(self, workflow_id: str) -> bool:
+        """True unless ``workflow_id`` is already recorded as the account default."""
+        return self.workflow_registry.account_default(self.account) != workflow_id
 
     def ingest_file(
         self,
@@ -197,29 +348,120 @@ class DocumentProcessor:
         ``file_name`` overrides the on-disk basename so GroundX records the
         original upload name instead of a temp path like ``tmpXXXX.pdf``.
         """
-        doc_kwargs: Dict[str, Any] = {
-            "bucket_id": bucket_id,
-            "file_path": file_path,
-        }
-        if file_name:
-            doc_kwargs["file_name"] = file_name
-        res = self.gx_client.ingest(documents=[Document(**doc_kwargs)])
+        return self.ingest_files([(file_path, file_name)], bucket_id)
+
+    def ingest_files(
+        self,
+        files: Sequence[Tuple[str, Optional[str]]],
+        bucket_id: int,
+    ) -> str:
+        """Ingest several local files in a single request; return the shared process_id.
+
+        ``files`` is a sequence of ``(file_path, file_name)`` pairs. Callers are
+        responsible for keeping each request within ``INGEST_BATCH_SIZE`` /
+        ``INGEST_BATCH_BYTES`` (see :meth:`_ingest_batches`).
+
+        Raises :class:`_UnknownBucketError` (after invalidating the cached id)
+        when GroundX reports the bucket is gone; callers re-resolve and retry.
+        """
+        documents = self._ingest_documents(files, bucket_id)
+        try:
+            res = self.gx_client.ingest(documents=documents, **self._ingest_options())
+        except Exception as exc:
+            raise self._ingest_error(exc, bucket_id) from exc
+        UPLOAD_BYTES.inc(self._upload_size(files))
         return res.ingest.process_id
 
+    @staticmethod
+    def _upload_size(files: Sequence[Tuple[str, Optional[str]]]) -> int:
+        """Total on-disk size of the files in an ingest request."""
+        total = 0
+        for file_path, _ in files:
+            try:
+                total += os.path.getsize(file_path)
+            except OSError:
+                pass
+        return total
+
+    @staticmethod
+    def _ingest_documents(
+        files: Sequence[Tuple[str, Optional[str]]],
+        bucket_id: int,
+    ) -> List[Any]:
+        """Build the SDK ``Document`` list for an ingest request."""
+        documents = []
+        for file_path, file_name in files:
+            doc_kwargs: Dict[str, Any] = {
+                "bucket_id": bucket_id,
+                "file_path": file_path,
+            }
+            if file_name:
+                doc_kwargs["file_name"] = file_name
+            documents.append(Document(**doc_kwargs))
+        return documents
+
+    def _ingest_options(self) -> Dict[str, Any]:
+        """Extra ``ingest`` keyword arguments (the upload endpoint, when configured)."""
+        return {"upload_api": self.upload_api} if self.upload_api else {}
+
+    def _ingest_error(self, exc: Exception, bucket_id: int) -> Exception:
+        """Translate an ingest failure, invalidating the cached bucket if it is gone."""
+        if not _is_unknown_bucket(exc):
+            return exc
+        BUCKET_CACHE.invalidate((self.base_url, self.bucket_name))
+        return _UnknownBucketError(
+            f"Bucket {bucket_id} ('{self.bucket_name}') no longer exists: {exc}"
+        )
+
+    @staticmethod
+    def _ingest_batches(
+        entries: Sequence[Tuple[int, str, int]],
+        batch_size: int = INGEST_BATCH_SIZE,
+        batch_bytes: int = INGEST_BATCH_BYTES,
+    ) -> List[List[Tuple[int, str, int]]]:
+        """Split ``(index, path, size)`` entries into API-sized ingest requests."""
+        batches: List[List[Tuple[int, str, int]]] = []
+        current: List[Tuple[int, str, int]] = []
+        current_bytes = 0
+        for entry in entries:
+            size = entry[2]
+            if current and (
+                len(current) >= batch_size or current_bytes + size > batch_bytes
+            ):
+                batches.append(current)
+                current, current_bytes = [], 0
+            current.append(entry)
+            current_bytes += size
+        if current:
+            batches.append(current)
+        return batches
+
+    def _polling_for(self, poll_interval: Optional[float]) -> PollingStrategy:
+        """Honor an explicit fixed ``poll_interval``; otherwise use ``self.polling``."""
+        if poll_interval is not None:
+            return FixedPolling(poll_interval)
+        return self.polling
+
     def wait_for_completion(
         self,
         process_id: str,
         on_status: Optional[StatusCallback] = None,
-        poll_interval: float = 5.0,
+        poll_interval: Optional[float] = None,
         timeout: float = 900.0,
+        stats: Optional[PollStats] = None,
     ) -> str:
         """Poll ``get_processing_status_by_id`` until complete; return document_id.
 
         Mirrors the notebook's status-check cell but loops until the job reaches
-        a terminal state instead of requiring a manual re-run.
+        a terminal state instead of requiring a manual re-run. Delays between
+        polls come from the polling strategy (a fixed ``poll_interval`` when
+        given); pass ``stats`` to collect how many polls the job used.
         """
+        polling = self._polling_for(poll_interval)
         deadline = time.monotonic() + timeout
         last_status: Optional[str] = None
+        last_phase: Optional[str] = None
+        attempt = 0
 
         while True:
             res = self.gx_client.documents.get_processing_status_by_id(
@@ -232,7 +474,14 @@ class DocumentProcessor:
                 on_status(status)
                 last_status = status
 
+            phase = status_phase(status)
+            STATUS_POLLS.inc(phase=phase)
+            if phase != last_phase:
+                attempt, last_phase = 0, phase
+
             if status in _COMPLETE_STATES:
+                if stats is not None:
+                    stats.record(phase)
                 if not document_id:
                     raise DocumentProcessorError(
                         "Processing completed but no document_id was returned."
@@ -240,16 +489,25 @@ class DocumentProcessor:
                 return document_id
 
             if status in _ERROR_STATES:
+                if stats is not None:
+                    stats.record(phase)
                 raise DocumentProcessorError(
                     f"Document processing failed with status '{status}'."
                 )
 
-            if time.monotonic() >= deadline:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                if stats is not None:
+                    stats.record(phase)
                 raise DocumentProcessorError(
                     f"Timed out waiting for processing (last status: '{status}')."
                 )
 
-            time.sleep(poll_interval)
+            delay = polling.next_delay(phase, attempt, remaining)
+            if stats is not None:
+                stats.record(phase, delay)
+            attempt += 1
+            time.sleep(delay)
 
     @staticmethod
     def _document_id_from_status(res) -> Optional[str]:
@@ -262,6 +520,27 @@ class DocumentProcessor:
                 return phase.documents[0].document_id
         return None
 
+    @staticmethod
+    def _finished_documents(res) -> List[Tuple[str, Any]]:
+        """Return ``(phase, document)`` pairs that reached a terminal phase.
+
+        ``phase`` is ``"complete"`` or ``"error"``; cancelled documents are
+        reported as errors.
+        """
+        progress = getattr(res.ingest, "progress", None)
+        if not progress:
+            return []
+        finished: List[Tuple[str, Any]] = []
+        for attr, phase in (
+            ("complete", "complete"),
+            ("errors", "error"),
+            ("cancelled", "error"),
+        ):
+            bucket = getattr(progress, attr, None)
+            for doc in (getattr(bucket, "documents", None) or []):
+                finished.append((phase, doc))
+        return finished
+
     def download_extract(self, document_id: str) -> Dict[str, Any]:
         """Download the structured extraction JSON for a document (notebook step)."""
         return self.gx_client.documents.get_extract(document_id=document_id)
@@ -273,21 +552,19 @@ class DocumentProcessor:
         GroundX returns a schema skeleton filled with ``null`` / ``""`` when
         the layout/extract LLM calls fail (e.g. invalid ``GROUNDX_AGENT_API_KEY``).
         Treating that as success is why the UI previously showed all-null data.
+        Job records carry a precomputed ``quality`` block; prefer
+        :func:`quality_of` when a record is at hand.
         """
-        if isinstance(data, dict):
-            return any(DocumentProcessor.extract_has_values(v) for v in data.values())
-        if isinstance(data, list):
-            return any(DocumentProcessor.extract_has_values(v) for v in data)
-        if data is None:
-            return False
-        if isinstance(data, str):
-            return bool(data.strip())
-        return True
-
-    def _validate_extract(self, document_id: str, extracted_data: Any) -> None:
-        """Raise if the extract payload is an empty schema skeleton."""
-        if self.extract_has_values(extracted_data):
-            return
+        return has_values(data)
+
+    def _validate_extract(self, document_id: str, extracted_data: Any) -> Dict[str, Any]:
+        """Raise if the extract payload is an empty schema skeleton.
+
+        Returns the payload's ``quality`` summary for the job record.
+        """
+        quality = summarize(extracted_data)
+        if quality["has_values"]:
+            return quality
 
         extracted_flag = None
         try:
@@ -297,7 +574,13 @@ class DocumentProcessor:
         except Exception:
             pass
 
-        raise DocumentProcessorError(
+        raise self._empty_extract_error(document_id, extracted_flag)
+
+    @staticmethod
+    def _empty_extract_error(
+        document_id: str, extracted_flag: Any
+    ) -> DocumentProcessorError:
+        return DocumentProcessorError(
             "Processing finished but no field values were extracted "
             f"(document_id={document_id}, extracted={extracted_flag}). "
             "GroundX returned an empty schema (all null/blank). Common causes: "
@@ -308,16 +591,280 @@ class DocumentProcessor:
 
     # -- orchestration -----------------------------------------------------
 
+    def _cache_key(self, uploaded_file) -> Optional[str]:
+        """Extraction-cache key for the upload's bytes + this schema and account, if computable."""
+        schema_sha256 = file_hash(
+            os.path.join(self.prompts_dir, f"{self.file_name}.yaml")
+        )
+        if schema_sha256 is None or self.account is None:
+            return None
+        return ExtractionCache.key(upload_sha256(uploaded_file), schema_sha256, self.account)
+
+    def _cached_job(self, uploaded_file, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Job record replayed from the extraction cache, or None on a miss."""
+        entry = self.extraction_cache.get(cache_key)
+        if not entry or not quality_of(entry)["has_values"]:
+            return None
+        return self._job_record(
+            uploaded_file,
+            **{k: entry.get(k) for k in CACHED_FIELDS},
+            cache_hit=True,
+        )
+
+    def _remember_job(self, cache_key: Optional[str], job: Dict[str, Any]) -> None:
+        """Best-effort write of a completed job into the extraction cache."""
+        if cache_key is None:
+            return
+        try:
+            self.extraction_cache.put(cache_key, job)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _stage_upload(uploaded_file) -> Tuple[Optional[str], str]:
+        """Return a local path GroundX can read the upload from.
+
+        Documents already on disk (samples, batch inputs, queued uploads) are
+        ingested from their own path. In-memory uploads are spooled to a temp
+        file in chunks, keeping the original basename so GroundX metadata
+        matches the upload. Returns ``(tmp_dir, path)`` for
+        :meth:`_cleanup_upload`; ``tmp_dir`` is None when nothing was copied.
+        """
+        path = local_path(uploaded_file)
+        if path is not None:
+            return None, path
+
+        tmp_dir = tempfile.mkdtemp(prefix="billing-upload-")
+        tmp_path = os.path.join(tmp_dir, os.path.basename(uploaded_file.name))
+        try:
+            spool_to(uploaded_file, tmp_path)
+        except OSError:
+            DocumentProcessor._cleanup_upload(tmp_dir, tmp_path)
+            raise
+        return tmp_dir, tmp_path
+
+    @staticmethod
+    def _cleanup_upload(tmp_dir: Optional[str], tmp_path: str) -> None:
+        if tmp_dir is None:
+            # The caller's own file; never delete it.
+            return
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        try:
+            os.rmdir(tmp_dir)
+        except OSError:
+            pass
+
+    def _job_record(self, uploaded_file, **fields: Any) -> Dict[str, Any]:
+        """Build the job record stored by ``SubmissionStore.record``.
+
+        Records carrying ``extracted_data`` get its ``quality`` summary, unless
+        the caller already computed it.
+        """
+        record: Dict[str, Any] = {
+            "filename": uploaded_file.name,
+            "file_size": uploaded_file.size,
+            "yaml_file": f"{self.file_name}.yaml",
+        }
+        record.update(fields)
+        if "extracted_data" in record and record.get("quality") is None:
+            record["quality"] = summarize(record["extracted_data"])
+        return record
+
+    def _error_record(self, uploaded_file, error: str, **ids: Any) -> Dict[str, Any]:
+        """Build a failed job record, keeping whichever identifiers are known."""
+        return self._job_record(
+            uploaded_file,
+            status="error",
+            error=error,
+            **{k: v for k, v in ids.items() if v is not None},
+        )
+
+    def _stage_hooks(
+        self,
+        clock: StageClock,
+        on_status: Optional[StatusCallback],
+        on_stage: Optional[StatusCallback],
+    ) -> Tuple[StatusCallback, Callable[[str, str], None]]:
+        """``(emit, enter)`` callbacks shared by :meth:`process` and :meth:`resume`."""
+
+        def emit(msg: str) -> None:
+            if on_status is not None:
+                on_status(msg)
+
+        def enter(stage: str, msg: str) -> None:
+            clock.enter(stage)
+            if on_stage is not None:
+                on_stage(stage)
+            emit(msg)
+
+        return emit, enter
+
     def process(
         self,
         uploaded_file,
         on_status: Optional[StatusCallback] = None,
         set_as_account_default: bool = True,
+        on_stage: Optional[StatusCallback] = None,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
+        on_ingest: Optional[IngestCallback] = None,
     ) -> Dict[str, Any]:
         """Run the end-to-end pipeline for an uploaded file.
 
         Returns a job record containing the GroundX identifiers and the
         extracted data. Raises :class:`DocumentProcessorError` on failure.
+        ``on_stage`` receives each ``STAGE_*`` name as the pipeline enters it.
+        The record's ``timings`` holds the seconds spent in each stage plus
+        ``total``; on failure the same dict is attached to the exception as
+        ``timings``.
+
+        When ``use_cache`` is set, an upload whose bytes and schema match a
+        previous extraction returns that result (marked ``cache_hit``) without
+        calling GroundX; ``refresh_cache`` forces a fresh run and overwrites
+        the cached entry. ``use_cache=False`` bypasses the cache entirely.
+
+        ``on_ingest`` receives the bucket, workflow and process ids as soon as
+        the ingest request is accepted, so a caller can checkpoint them and
+        finish an interrupted job later with :meth:`resume`.
+        """
+        if not self.is_ready:
+            raise DocumentProcessorError(
+                self._init_error or "DocumentProcessor is not initialized."
+            )
+
+        clock = StageClock()
+        emit, enter = self._stage_hooks(clock, on_status, on_stage)
+
+        # Identical bytes + unchanged schema: replay the stored extraction.
+        clock.enter(STAGE_CACHE)
+        cache_key = self._cache_key(uploaded_file) if use_cache else None
+        if cache_key is not None and not refresh_cache:
+            cached = self._cached_job(uploaded_file, cache_key)
+            if cached is not None:
+                emit("Reused cached extraction for an identical document.")
+                cached["timings"] = clock.finish()
+                return cached
+
+        clock.enter(STAGE_STAGING)
+        tmp_dir, tmp_path = self._stage_upload(uploaded_file)
+        try:
+            enter(STAGE_BUCKET, "Creating bucket…")
+            bucket_id = self.ensure_bucket()
+
+            enter(STAGE_WORKFLOW, "Creating extraction workflow…")
+            workflow_id = self.ensure_workflow(
+                set_as_account_default=set_as_account_default
+            )
+
+            enter(STAGE_INGEST, "Ingesting document…")
+            try:
+                process_id = self.ingest_file(
+                    tmp_path, bucket_id, file_name=uploaded_file.name
+                )
+            except _UnknownBucketError:
+                # The cached bucket was deleted; resolve it again and retry once.
+                bucket_id = self.ensure_bucket()
+                process_id = self.ingest_file(
+                    tmp_path, bucket_id, file_name=uploaded_file.name
+                )
+            ids = {"bucket_id": bucket_id, "workflow_id": workflow_id, "process_id": process_id}
+            if on_ingest is not None:
+                on_ingest(dict(ids))
+
+            job = self._complete_job(uploaded_file, enter, emit, cache_key, **ids)
+            job["timings"] = clock.finish()
+            return job
+        except Exception as exc:
+            # Lets the caller record where a failed job spent its time.
+            exc.timings = clock.finish()
+            raise
+        finally:
+            self._cleanup_upload(tmp_dir, tmp_path)
+
+    def resume(
+        self,
+        uploaded_file,
+        process_id: str,
+        on_status: Optional[StatusCallback] = None,
+        on_stage: Optional[StatusCallback] = None,
+        use_cache: bool = True,
+        **ids: Any,
+    ) -> Dict[str, Any]:
+        """Finish a job whose ingest GroundX already accepted as ``process_id``.
+
+        Runs the processing and download stages of :meth:`process` without
+        uploading the file again; ``ids`` (``bucket_id`` / ``workflow_id``) are
+        copied into the job record. Returns and raises like :meth:`process`.
+        """
+        if not self.is_ready:
+            raise DocumentProcessorError(
+                self._init_error or "DocumentProcessor is not initialized."
+            )
+
+        clock = StageClock()
+        emit, enter = self._stage_hooks(clock, on_status, on_stage)
+        cache_key = self._cache_key(uploaded_file) if use_cache else None
+        try:
+            job = self._complete_job(
+                uploaded_file, enter, emit, cache_key, **ids, process_id=process_id
+            )
+        except Exception as exc:
+            exc.timings = clock.finish()
+            raise
+        job["timings"] = clock.finish()
+        return job
+
+    def _complete_job(
+        self,
+        uploaded_file,
+        enter: Callable[[str, str], None],
+        emit: StatusCallback,
+        cache_key: Optional[str],
+        **ids: Any,
+    ) -> Dict[str, Any]:
+        """Wait for ``ids["process_id"]``, download its extract and build the job record."""
+        enter(STAGE_PROCESSING, "Processing document…")
+        poll_stats = PollStats()
+        document_id = self.wait_for_completion(
+            ids["process_id"], on_status=lambda s: emit(f"Status: {s}"), stats=poll_stats
+        )
+
+        enter(STAGE_DOWNLOAD, "Downloading extractions…")
+        extracted_data = self.download_extract(document_id)
+        quality = self._validate_extract(document_id, extracted_data)
+
+        job = self._job_record(
+            uploaded_file,
+            **ids,
+            document_id=document_id,
+            extracted_data=extracted_data,
+            quality=quality,
+            polling=poll_stats.as_dict(),
+        )
+        self._remember_job(cache_key, job)
+        return job
+
+    def process_many(
+        self,
+        uploaded_files: Sequence[Any],
+        on_status: Optional[StatusCallback] = None,
+        set_as_account_default: bool = True,
+        poll_interval: Optional[float] = None,
+        timeout: float = 900.0,
+    ) -> List[Dict[str, Any]]:
+        """Run the pipeline for many files, packing them into shared ingest requests.
+
+        Files are chunked into as few ``gx_client.ingest`` calls as the API
+        limits allow; every document is tracked under its request's shared
+        ``process_id`` and its extract is downloaded as soon as it finishes.
+
+        Returns one job record per input file, in input order. Failures are
+        reported per file (``status: "error"`` with an ``error`` message) rather
+        than aborting the batch. Raises :class:`DocumentProcessorError` only when
+        the shared setup (bucket / workflow) cannot be completed.
         """
         if not self.is_ready:
             raise DocumentProcessorError(
@@ -328,53 +875,230 @@ class DocumentProcessor:
             if on_status is not None:
                 on_status(msg)
 
-        # Persist the upload to a temp file so GroundX can read it by path.
-        # Keep the original basename so GroundX metadata matches the upload.
-        suffix = os.path.splitext(uploaded_file.name)[1] or ""
-        tmp_dir = tempfile.mkdtemp(prefix="billing-upload-")
-        tmp_path = os.path.join(tmp_dir, os.path.basename(uploaded_file.name))
+        jobs: List[Optional[Dict[str, Any]]] = [None] * len(uploaded_files)
+        if not uploaded_files:
+            return []
+        started = time.monotonic()
+
+        staged: List[Tuple[Optional[str], str]] = []
         try:
-            with open(tmp_path, "wb") as tmp:
-                tmp.write(uploaded_file.getvalue())
+            # Each upload gets its own temp directory (if it needs one at all),
+            # so identical basenames in one batch don't overwrite each other.
+            entries: List[Tuple[int, str, int]] = []
+            for index, uploaded_file in enumerate(uploaded_files):
+                try:
+                    tmp_dir, tmp_path = self._stage_upload(uploaded_file)
+                except OSError as exc:
+                    jobs[index] = self._error_record(
+                        uploaded_file, f"Could not stage upload: {exc}"
+                    )
+                    continue
+                staged.append((tmp_dir, tmp_path))
+                try:
+                    size = os.path.getsize(tmp_path)
+                except OSError as exc:
+                    jobs[index] = self._error_record(
+                        uploaded_file, f"Could not stage upload: {exc}"
+                    )
+                    continue
+                entries.append((index, tmp_path, size))
 
+            # Setup stages are shared by every file; ingest is timed per request
+            # and processing/download per document.
+            setup = StageClock()
             emit("Creating bucket…")
+            setup.enter(STAGE_BUCKET)
             bucket_id = self.ensure_bucket()
 
             emit("Creating extraction workflow…")
+            setup.enter(STAGE_WORKFLOW)
             workflow_id = self.ensure_workflow(
                 set_as_account_default=set_as_account_default
             )
+            setup_timings = setup.finish()
+            del setup_timings["total"]
+            ids = {"bucket_id": bucket_id, "workflow_id": workflow_id}
+            # process_id -> (ingest seconds, monotonic time the request was accepted).
+            ingested: Dict[str, Tuple[float, float]] = {}
 
-            emit("Ingesting document…")
-            process_id = self.ingest_file(
-                tmp_path, bucket_id, file_name=uploaded_file.name
-            )
+            # process_id -> uploaded name -> input indices still awaiting a result.
+            inflight: Dict[str, Dict[str, List[int]]] = {}
+            # process_id -> identifiers shared by every document in that request.
+            batch_ids: Dict[str, Dict[str, Any]] = {}
+            batches = self._ingest_batches(entries)
+            for number, batch in enumerate(batches, start=1):
+                emit(f"Ingesting batch {number}/{len(batches)} ({len(batch)} documents)…")
+                files = [(path, uploaded_files[i].name) for i, path, _ in batch]
+                ingest_started = time.monotonic()
+                try:
+                    try:
+                        process_id = self.ingest_files(files, bucket_id)
+                    except _UnknownBucketError:
+                        bucket_id = self.ensure_bucket()
+                        ids["bucket_id"] = bucket_id
+                        process_id = self.ingest_files(files, bucket_id)
+                except Exception as exc:
+                    for i, _, _ in batch:
+                        jobs[i] = self._error_record(
+                            uploaded_files[i], f"Ingest failed: {exc}", **ids
+                        )
+                    continue
+                now = time.monotonic()
+                ingested[process_id] = (now - ingest_started, now)
+                STAGE_SECONDS.observe(now - ingest_started, stage=STAGE_INGEST)
+                pending: Dict[str, List[int]] = {}
+                for i, _, _ in batch:
+                    pending.setdefault(uploaded_files[i].name, []).append(i)
+                inflight[process_id] = pending
+                batch_ids[process_id] = dict(ids, process_id=process_id)
 
-            emit("Processing document…")
-            document_id = self.wait_for_completion(
-                process_id, on_status=lambda s: emit(f"Status: {s}")
-            )
+            emit(f"Processing {sum(len(b) for b in batches)} documents…")
+            polling = self._polling_for(poll_interval)
+            poll_stats = {process_id: PollStats() for process_id in inflight}
+            deadline = time.monotonic() + timeout
+            seen_documents: set = set()
+            attempt = 0
+            last_round_phase: Optional[str] = None
+            while inflight:
+                round_phase = QUEUED
+                for process_id in list(inflight):
+                    pending = inflight[process_id]
+                    try:
+                        res = self.gx_client.documents.get_processing_status_by_id(
+                            process_id=process_id,
+                        )
+                    except Exception as exc:
+                        emit(f"Status check failed for {process_id}: {exc}")
+                        continue
 
-            emit("Downloading extractions…")
-            extracted_data = self.download_extract(document_id)
-            self._validate_extract(document_id, extracted_data)
+                    for phase, doc in self._finished_documents(res):
+                        document_id = getattr(doc, "document_id", None)
+                        indices = pending.get(getattr(doc, "file_name", None) or "")
+                        if not indices or document_id in seen_documents:
+                            continue
+                        seen_documents.add(document_id)
+                        i = indices.pop(0)
+                        if not indices:
+                            del pending[uploaded_files[i].name]
+                        finished_at = time.monotonic()
+                        jobs[i] = self._finish_batch_document(
+                            uploaded_files[i],
+                            phase,
+                            doc,
+                            **batch_ids[process_id],
+                        )
+                        jobs[i]["timings"] = self._batch_timings(
+                            setup_timings, ingested[process_id], finished_at, started
+                        )
+                        emit(f"{uploaded_files[i].name}: {jobs[i].get('status', 'complete')}")
 
-            return {
-                "filename": uploaded_file.name,
-                "file_size": uploaded_file.size,
-                "yaml_file": f"{self.file_name}.yaml",
-                "bucket_id": bucket_id,
-                "workflow_id": workflow_id,
-                "process_id": process_id,
-                "document_id": document_id,
-                "extracted_data": extracted_data,
-            }
+                    status = (res.ingest.status or "").lower()
+                    phase = status_phase(status)
+                    poll_stats[process_id].record(phase)
+                    STATUS_POLLS.inc(phase=phase)
+                    if phase != QUEUED:
+                        round_phase = phase
+                    if pending and (status in _COMPLETE_STATES or status in _ERROR_STATES):
+                        # The request finished without reporting these files.
+                        for indices in pending.values():
+                            for i in indices:
+                                jobs[i] = self._error_record(
+                                    uploaded_files[i],
+                                    "Processing finished with status "
+                                    f"'{status}' but this document was not reported.",
+                                    **batch_ids[process_id],
+                                )
+                        pending.clear()
+                    if not pending:
+                        del inflight[process_id]
+
+                if not inflight:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    for process_id, pending in inflight.items():
+                        for indices in pending.values():
+                            for i in indices:
+                                jobs[i] = self._error_record(
+                                    uploaded_files[i],
+                                    "Timed out waiting for processing.",
+                                    **batch_ids[process_id],
+                                )
+                    break
+                # One shared schedule: back off per round, restarting the fast
+                # polls once any request moves from queued to processing.
+                if round_phase != last_round_phase:
+                    attempt, last_round_phase = 0, round_phase
+                delay = polling.next_delay(round_phase, attempt, remaining)
+                for process_id in inflight:
+                    poll_stats[process_id].waited += delay
+                attempt += 1
+                time.sleep(delay)
+
+            # Every input gets a record, so results stay aligned with inputs.
+            results: List[Dict[str, Any]] = []
+            for i, job in enumerate(jobs):
+                if job is None:
+                    job = self._error_record(
+                        uploaded_files[i], "No result was produced for this document.", **ids
+                    )
+                elif job.get("process_id") in poll_stats:
+                    job["polling"] = poll_stats[job["process_id"]].as_dict()
+                results.append(job)
+            return results
         finally:
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
-            try:
-                os.rmdir(tmp_dir)
-            except OSError:
-                pass
+            for tmp_dir, tmp_path in staged:
+                self._cleanup_upload(tmp_dir, tmp_path)
+
+    @staticmethod
+    def _batch_timings(
+        setup_timings: Dict[str, float],
+        ingest: Tuple[float, float],
+        finished_at: float,
+        started: float,
+    ) -> Dict[str, float]:
+        """``timings`` for one :meth:`process_many` document, recording its own stages."""
+        ingest_seconds, accepted_at = ingest
+        now = time.monotonic()
+        processing, download = finished_at - accepted_at, now - finished_at
+        STAGE_SECONDS.observe(processing, stage=STAGE_PROCESSING)
+        STAGE_SECONDS.observe(download, stage=STAGE_DOWNLOAD)
+        return dict(
+            setup_timings,
+            ingest=round(ingest_seconds, 4),
+            processing=round(processing, 4),
+            download=round(download, 4),
+            total=round(now - started, 4),
+        )
+
+    def _finish_batch_document(
+        self,
+        uploaded_file,
+        phase: str,
+        doc: Any,
+        **ids: Any,
+    ) -> Dict[str, Any]:
+        """Download and validate one finished batch document into a job record."""
+        document_id = getattr(doc, "document_id", None)
+        if phase != "complete":
+            message = getattr(doc, "status_message", None) or getattr(doc, "status", None)
+            return self._error_record(
+                uploaded_file,
+                f"Document processing failed: {message or 'unknown error'}.",
+                document_id=document_id,
+                **ids,
+            )
+        try:
+            extracted_data = self.download_extract(document_id)
+            quality = self._validate_extract(document_id, extracted_data)
+        except Exception as exc:
+            return self._error_record(
+                uploaded_file, str(exc), document_id=document_id, **ids
+            )
+        return self._job_record(
+            uploaded_file,
+            **ids,
+            document_id=document_id,
+            extracted_data=extracted_data,
+            quality=quality,
+        )
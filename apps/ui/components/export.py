@@ -0,0 +1,280 @@
+"""
+Streaming bulk export of stored submissions.
+
+Walks :class:`SubmissionStore` in index order (see
+:meth:`SubmissionStore.iter_summaries`) and loads one full record at a time,
+so an export of any size holds a single record — plus one Parquet row group —
+in memory. Supported formats:
+
+* ``jsonl`` — one full record per line, ``extracted_data`` included
+* ``csv`` / ``parquet`` — one row per submission: :data:`META_COLUMNS` followed
+  by one column per extracted field
+
+Field columns come from each schema's ``statement.fields`` (nested groups
+become dotted paths such as ``charges.total``), in schema order, unioned over
+every schema the export covers. Values that are lists or objects are written
+as JSON text. Parquet needs the optional ``pyarrow`` package.
+"""
+
+import csv
+import json
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Union
+
+from apps.ui.components.submission_store import SubmissionStore
+from apps.ui.components.yaml_manager import YAMLManager
+
+FORMATS = ("jsonl", "csv", "parquet")
+
+MIME_TYPES = {
+    "jsonl": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# Submission fields written before the extracted-field columns.
+META_COLUMNS = (
+    "id",
+    "created_at",
+    "filename",
+    "yaml_file",
+    "status",
+    "document_id",
+    "filled",
+    "leaves",
+    "error",
+)
+_INT_COLUMNS = {"filled", "leaves"}
+
+# Records per Parquet row group (and per index page).
+BATCH_SIZE = 500
+
+
+class ExportError(RuntimeError):
+    """Raised when an export cannot be produced (bad filter or missing dependency)."""
+
+
+def schema_columns(schema: Optional[Dict[str, Any]]) -> List[str]:
+    """Dotted field paths declared under ``statement.fields``, in schema order."""
+    fields = ((schema or {}).get("statement") or {}).get("fields") or {}
+    return _group_columns(fields, "")
+
+
+def _group_columns(fields: Dict[str, Any], prefix: str) -> List[str]:
+    columns: List[str] = []
+    for name, spec in fields.items():
+        children = spec.get("fields") if isinstance(spec, dict) else None
+        if isinstance(children, dict) and "prompt" not in spec:
+            columns.extend(_group_columns(children, f"{prefix}{name}."))
+        else:
+            columns.append(f"{prefix}{name}")
+    return columns
+
+
+def field_columns(yaml_files: Iterable[str], prompts_dir: str = "prompts") -> List[str]:
+    """Union of :func:`schema_columns` over ``yaml_files``, first-seen order."""
+    manager = YAMLManager(yaml_dir=prompts_dir)
+    columns: Dict[str, None] = {}
+    for yaml_file in yaml_files:
+        for column in schema_columns(manager.load_content(yaml_file)):
+            columns.setdefault(column)
+    return list(columns)
+
+
+_MISSING = object()
+
+
+def _lookup(data: Any, path: str) -> Any:
+    """Value at dotted ``path`` in ``data``; extracts nested under ``statement`` also match."""
+    for root in (data, data.get("statement") if isinstance(data, dict) else None):
+        value = root
+        for part in path.split("."):
+            if not isinstance(value, dict) or part not in value:
+                value = _MISSING
+                break
+            value = value[part]
+        if value is not _MISSING:
+            return value
+    return None
+
+
+def _cell(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str, ensure_ascii=False)
+    return str(value)
+
+
+def flatten(record: Dict[str, Any], columns: Sequence[str]) -> Dict[str, Any]:
+    """One export row for ``record``: meta columns, then ``columns`` from its extract."""
+    quality = record.get("quality") or {}
+    row: Dict[str, Any] = {}
+    for column in META_COLUMNS:
+        value = quality.get(column) if column in _INT_COLUMNS else record.get(column)
+        row[column] = value if column in _INT_COLUMNS else _cell(value)
+    data = record.get("extracted_data")
+    for column in columns:
+        row[column] = _cell(_lookup(data, column))
+    return row
+
+
+def date_bounds(
+    since: Optional[Union[str, date]], until: Optional[Union[str, date]]
+) -> tuple:
+    """ISO ``(since, until)`` bounds for the index; a bare ``until`` date is inclusive."""
+
+    def parse(value, end: bool) -> Optional[str]:
+        if value in (None, ""):
+            return None
+        if isinstance(value, datetime):
+            return value.isoformat()
+        if isinstance(value, date):
+            return (value + timedelta(days=1) if end else value).isoformat()
+        try:
+            day = date.fromisoformat(value)
+        except ValueError:
+            try:
+                return datetime.fromisoformat(value).isoformat()
+            except ValueError as exc:
+                raise ExportError(f"Not an ISO date or timestamp: {value!r}") from exc
+        return (day + timedelta(days=1) if end else day).isoformat()
+
+    return parse(since, end=False), parse(until, end=True)
+
+
+def _pyarrow():
+    """``(pyarrow, pyarrow.parquet)``; Parquet is the only format needing an extra package."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise ExportError(
+            "Parquet export needs the 'pyarrow' package (pip install pyarrow)."
+        ) from exc
+    return pyarrow, pyarrow.parquet
+
+
+class Exporter:
+    """Streams the submissions matching a set of filters in one format."""
+
+    def __init__(
+        self,
+        store: Optional[SubmissionStore] = None,
+        status: Optional[Union[str, Sequence[str]]] = None,
+        since: Optional[Union[str, date]] = None,
+        until: Optional[Union[str, date]] = None,
+        schema: Optional[str] = None,
+        prompts_dir: str = "prompts",
+    ):
+        """Filter by status, creation date range (``until`` inclusive) and schema name."""
+        self.store = store or SubmissionStore()
+        self.status = status or None
+        self.since, self.until = date_bounds(since, until)
+        if schema and not schema.endswith((".yaml", ".yml")):
+            schema = f"{schema}.yaml"
+        self.yaml_file = schema or None
+        self.prompts_dir = prompts_dir
+
+    def count(self) -> int:
+        """Number of submissions the export will contain."""
+        return self.store.count(
+            status=self.status, since=self.since, until=self.until, yaml_file=self.yaml_file
+        )
+
+    def _summaries(self) -> Iterator[Dict[str, Any]]:
+        return self.store.iter_summaries(
+            status=self.status,
+            since=self.since,
+            until=self.until,
+            yaml_file=self.yaml_file,
+            batch_size=BATCH_SIZE,
+        )
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """Full matching records, oldest first, loaded one at a time."""
+        for summary in self._summaries():
+            record = self.store.get(summary["id"])
+            if record is not None:
+                yield record
+
+    def columns(self) -> List[str]:
+        """Extracted-field columns for the schemas this export covers."""
+        if self.yaml_file:
+            yaml_files = [self.yaml_file]
+        else:
+            yaml_files = self.store.yaml_files(
+                status=self.status, since=self.since, until=self.until
+            )
+        return field_columns(yaml_files, self.prompts_dir)
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        columns = self.columns()
+        for record in self.records():
+            yield flatten(record, columns)
+
+    # -- writers -------------------------------------------------------------
+
+    def write(self, fmt: str, out) -> int:
+        """Write every matching submission to ``out``; return how many.
+
+        ``out`` is a text stream for ``jsonl`` / ``csv`` and a binary stream
+        or path for ``parquet``.
+        """
+        if fmt == "jsonl":
+            return self.write_jsonl(out)
+        if fmt == "csv":
+            return self.write_csv(out)
+        if fmt == "parquet":
+            return self.write_parquet(out)
+        raise ExportError(f"Unknown export format {fmt!r}; expected one of {FORMATS}.")
+
+    def write_jsonl(self, out: TextIO) -> int:
+        count = 0
+        for record in self.records():
+            out.write(json.dumps(record, default=str, ensure_ascii=False) + "\n")
+            count += 1
+        return count
+
+    def write_csv(self, out: TextIO) -> int:
+        columns = list(META_COLUMNS) + self.columns()
+        writer = csv.DictWriter(out, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        count = 0
+        for row in self.rows():
+            writer.writerow(row)
+            count += 1
+        return count
+
+    def write_parquet(self, out) -> int:
+        pa, pq = _pyarrow()
+
+        fields = self.columns()
+        schema = pa.schema(
+            [
+                pa.field(c, pa.int64() if c in _INT_COLUMNS else pa.string())
+                for c in list(META_COLUMNS) + fields
+            ]
+        )
+        count = 0
+        batch: List[Dict[str, Any]] = []
+        with pq.ParquetWriter(out, schema) as writer:
+            for row in self.rows():
+                batch.append(row)
+                if len(batch) >= BATCH_SIZE:
+                    writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                    count += len(batch)
+                    batch = []
+            if batch or not count:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+        return count
+
+    def write_file(self, fmt: str, path: str) -> int:
+        """Write the export to ``path`` (opened in the mode ``fmt`` needs)."""
+        if fmt == "parquet":
+            _pyarrow()  # fail before creating an empty file
+            with open(path, "wb") as f:
+                return self.write_parquet(f)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            return self.write(fmt, f)
@@ -0,0 +1,83 @@
+"""
+Fill-quality summary of an extraction payload.
+
+GroundX returns a schema skeleton filled with ``null`` / ``""`` when the
+layout/extract LLM calls fail, so "did the extract populate anything" is
+checked on every job. Rather than re-walking ``extracted_data`` on each
+render, the summary is computed once when the job record is built and stored
+as its ``quality`` block::
+
+    {"has_values": true, "filled": 4, "leaves": 5,
+     "fields": {"account_number": [1, 1], "charges": [3, 4]}}
+
+``fields`` maps each top-level field to ``[filled, leaves]``. Walks use an
+explicit stack, so deeply nested payloads can't hit the recursion limit.
+"""
+
+from typing import Any, Dict, Optional
+
+
+def is_filled(value: Any) -> bool:
+    """True for a non-empty scalar leaf (not ``None`` and not a blank string)."""
+    if value is None:
+        return False
+    if isinstance(value, str):
+        return bool(value.strip())
+    return True
+
+
+def _children(value: Any):
+    return value.values() if isinstance(value, dict) else value
+
+
+def has_values(data: Any) -> bool:
+    """True when ``data`` contains at least one filled leaf; stops at the first."""
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (dict, list)):
+            stack.extend(_children(value))
+        elif is_filled(value):
+            return True
+    return False
+
+
+def _count(data: Any) -> list:
+    """``[filled, leaves]`` over every scalar under ``data``."""
+    filled = leaves = 0
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (dict, list)):
+            stack.extend(_children(value))
+            continue
+        leaves += 1
+        if is_filled(value):
+            filled += 1
+    return [filled, leaves]
+
+
+def summarize(data: Any) -> Dict[str, Any]:
+    """Compute the ``quality`` block for an extraction payload."""
+    if isinstance(data, dict):
+        fields = {str(k): _count(v) for k, v in data.items()}
+        filled = sum(f for f, _ in fields.values())
+        leaves = sum(n for _, n in fields.values())
+    else:
+        fields = {}
+        filled, leaves = _count(data) if data is not None else (0, 0)
+    return {
+        "has_values": filled > 0,
+        "filled": filled,
+        "leaves": leaves,
+        "fields": fields,
+    }
+
+
+def quality_of(record: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """A record's stored ``quality`` block, computed for records written before it existed."""
+    record = record or {}
+    quality = record.get("quality")
+    if isinstance(quality, dict) and "has_values" in quality:
+        return quality
+    return summarize(record.get("extracted_data"))
@@ -0,0 +1,172 @@
+"""
+Content-addressed cache of completed extractions.
+
+Re-uploading an identical document against an unchanged schema would pay the
+full GroundX ingest + LLM extraction again. Completed extractions are stored
+under ``sha256(file bytes)`` + ``sha256(schema YAML)`` so a repeat upload can
+return the stored ``extracted_data`` and ``document_id`` immediately. Keys also
+cover the GroundX account (deployment URL plus an API-key hash), since the
+stored ids and extracts belong to the account that produced them.
+
+Entries are JSON files under ``EXTRACT_CACHE_DIR`` (default
+``<SUBMISSIONS_DIR>/.state/extract-cache``). An entry expires
+``EXTRACT_CACHE_MAX_AGE_DAYS`` (default 30) after its ``cached_at`` time, however
+often it is read. Hits refresh the file's mtime, which only orders eviction:
+on every write the least recently used entries are evicted beyond
+``EXTRACT_CACHE_MAX_BYTES`` (default 256 MiB).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+_LOCK = threading.Lock()
+
+# Job record fields replayed on a cache hit.
+CACHED_FIELDS = (
+    "bucket_id",
+    "workflow_id",
+    "process_id",
+    "document_id",
+    "extracted_data",
+    "quality",
+)
+
+
+def _default_dir() -> str:
+    submissions_dir = os.getenv("SUBMISSIONS_DIR", "submissions")
+    return os.getenv(
+        "EXTRACT_CACHE_DIR", os.path.join(submissions_dir, ".state", "extract-cache")
+    )
+
+
+def file_hash(path: str, chunk_size: int = 1024 * 1024) -> Optional[str]:
+    """sha256 hex digest of the file at ``path``, or None if it can't be read."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """File-backed extraction cache with size- and age-based eviction."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_age_days: Optional[float] = None,
+    ):
+        """Initialize the cache; limits default to the environment settings."""
+        self.cache_dir = cache_dir or _default_dir()
+        self.max_bytes = (
+            max_bytes
+            if max_bytes is not None
+            else int(os.getenv("EXTRACT_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+        )
+        self.max_age = 86400 * (
+            max_age_days
+            if max_age_days is not None
+            else float(os.getenv("EXTRACT_CACHE_MAX_AGE_DAYS", "30"))
+        )
+
+    @staticmethod
+    def key(file_sha256: str, schema_sha256: str, account: str) -> str:
+        """Cache key for a document's bytes extracted with a given schema in ``account``.
+
+        ``account`` identifies the GroundX deployment and API key (see
+        :meth:`WorkflowRegistry.account`).
+        """
+        return hashlib.sha256(
+            f"{file_sha256}:{schema_sha256}:{account}".encode()
+        ).hexdigest()
+
+    def _expired(self, cached_at: Any, mtime: float) -> bool:
+        try:
+            created = datetime.fromisoformat(cached_at).timestamp()
+        except (TypeError, ValueError):
+            created = mtime
+        return time.time() - created > self.max_age
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for ``key``, or None on a miss or expired entry."""
+        path = self._path(key)
+        try:
+            mtime = os.path.getmtime(path)
+            with open(path) as f:
+                entry = json.load(f)
+            if self._expired(entry.get("cached_at"), mtime):
+                self.invalidate(key)
+                return None
+            # Touch so eviction treats the entry as recently used.
+            os.utime(path)
+        except (OSError, ValueError, AttributeError):
+            return None
+        return entry
+
+    def put(self, key: str, job: Dict[str, Any]) -> None:
+        """Store the reusable fields of a completed ``job`` under ``key``."""
+        entry = {k: job.get(k) for k in CACHED_FIELDS}
+        entry["cached_at"] = datetime.now(timezone.utc).isoformat()
+        with _LOCK:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=".entry-", dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(entry, f, default=str)
+                os.replace(tmp_path, self._path(key))
+            except OSError:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            self._evict()
+
+    def invalidate(self, key: str) -> None:
+        """Drop the entry for ``key`` if present."""
+        try:
+            os.unlink(self._path(key))
+        except OSError:
+            pass
+
+    def _evict(self) -> None:
+        """Remove expired entries, then the least recently used beyond ``max_bytes``."""
+        now = time.time()
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            # mtime never predates cached_at, so this only drops expired entries;
+            # expired entries that are still being read go on their next get().
+            if now - st.st_mtime > self.max_age:
+                self.invalidate(name[: -len(".json")])
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                pass
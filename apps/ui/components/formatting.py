@@ -1,45 +1,240 @@
-from typing import Dict, Any
-
-
-def format_json(json_data: Dict[str, Any], indent: int = 0) -> str:
-    """Recursively format JSON data as an HTML string with color-coded syntax spans."""
-    if isinstance(json_data, dict):
-        formatted = "{\n"
-        for i, (key, value) in enumerate(json_data.items()):
-            formatted += "  " * (indent + 1) + f'<span class="json-key">"{key}"</span>: '
-            if isinstance(value, (dict, list)):
-                formatted += format_json(value, indent + 1)
-            else:
-                formatted += _format_scalar(value)
-            if i < len(json_data) - 1:
-                formatted += ","
-            formatted += "\n"
-        formatted += "  " * indent + "}"
-        return formatted
-    elif isinstance(json_data, list):
-        formatted = "[\n"
-        for i, item in enumerate(json_data):
-            formatted += "  " * (indent + 1)
-            if isinstance(item, (dict, list)):
-                formatted += format_json(item, indent + 1)
-            else:
-                formatted += _format_scalar(item)
-            if i < len(json_data) - 1:
-                formatted += ","
-            formatted += "\n"
-        formatted += "  " * indent + "]"
-        return formatted
-    return _format_scalar(json_data)
+import hashlib
+import html
+import json
+import threading
+from collections import OrderedDict
+from itertools import islice
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+# Rendering budget: past either limit the remaining items of every open
+# container are collapsed into a "… N more" marker.
+DEFAULT_MAX_NODES = 5000
+DEFAULT_MAX_BYTES = 1024 * 1024
+
+_CACHE_SIZE = 32
+_cache: "OrderedDict[Hashable, str]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+_tables: "OrderedDict[Hashable, FlatTable]" = OrderedDict()
+_tables_lock = threading.Lock()
+
+
+class _Frame:
+    """An open dict/list being rendered by :func:`format_json`."""
+
+    __slots__ = ("items", "is_dict", "total", "index", "level", "after")
+
+    def __init__(self, value: Any, level: int, after: str):
+        self.is_dict = isinstance(value, dict)
+        self.items = iter(value.items()) if self.is_dict else iter(value)
+        self.total = len(value)
+        self.index = 0
+        self.level = level
+        self.after = after
+
+
+def format_json(
+    json_data: Dict[str, Any],
+    indent: int = 0,
+    max_nodes: int = DEFAULT_MAX_NODES,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+) -> str:
+    """Format JSON data as an HTML string with color-coded syntax spans.
+
+    Fragments are appended to a list and joined once (linear in the output
+    size), the tree is walked with an explicit stack (no recursion limit), and
+    keys/strings are HTML-escaped. Once ``max_nodes`` values or roughly
+    ``max_bytes`` of output have been rendered, the rest of each open
+    container is replaced by a "… N more" marker.
+    """
+    if not isinstance(json_data, (dict, list)):
+        return _format_scalar(json_data)
+
+    out: List[str] = ["{\n" if isinstance(json_data, dict) else "[\n"]
+    append = out.append
+    size = 2
+    nodes = 0
+    exhausted = False
+    escape = html.escape
+
+    stack = [_Frame(json_data, indent, "")]
+    while stack:
+        frame = stack[-1]
+
+        if frame.index < frame.total and not exhausted:
+            exhausted = nodes >= max_nodes or size >= max_bytes
+
+        if frame.index >= frame.total or exhausted:
+            remaining = frame.total - frame.index
+            if remaining:
+                append(
+                    f'{"  " * (frame.level + 1)}<span class="json-truncated">… '
+                    f'{remaining} more {"key" if frame.is_dict else "item"}(s) '
+                    "not shown</span>\n"
+                )
+            stack.pop()
+            append("  " * frame.level + ("}" if frame.is_dict else "]") + frame.after)
+            continue
+
+        item = next(frame.items)
+        frame.index += 1
+        nodes += 1
+        sep = ",\n" if frame.index < frame.total else "\n"
+        pad = "  " * (frame.level + 1)
+        if frame.is_dict:
+            key, value = item
+            prefix = f'{pad}<span class="json-key">"{escape(str(key))}"</span>: '
+        else:
+            value = item
+            prefix = pad
+
+        if isinstance(value, (dict, list)):
+            fragment = prefix + ("{\n" if isinstance(value, dict) else "[\n")
+            stack.append(_Frame(value, frame.level + 1, sep))
+        else:
+            fragment = prefix + _format_scalar(value) + sep
+        append(fragment)
+        size += len(fragment)
+
+    return "".join(out)
+
+
+def format_json_cached(
+    key: Optional[Hashable],
+    json_data: Dict[str, Any],
+    max_nodes: int = DEFAULT_MAX_NODES,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    version: Optional[Hashable] = None,
+) -> str:
+    """:func:`format_json` memoized by ``key`` and ``version`` (see :func:`cache_identity`).
+
+    Reruns of the same view reuse the rendered HTML; a record updated under
+    the same id (a retry, a re-extract) has a new ``version`` and is rendered
+    afresh.
+    """
+    cache_key = (cache_identity(key, version, json_data), max_nodes, max_bytes)
+    with _cache_lock:
+        if cache_key in _cache:
+            _cache.move_to_end(cache_key)
+            return _cache[cache_key]
+    rendered = format_json(json_data, max_nodes=max_nodes, max_bytes=max_bytes)
+    with _cache_lock:
+        _cache[cache_key] = rendered
+        while len(_cache) > _CACHE_SIZE:
+            _cache.popitem(last=False)
+    return rendered
+
+
+def cache_identity(
+    key: Optional[Hashable], version: Optional[Hashable], json_data: Any
+) -> Tuple[Hashable, ...]:
+    """Cache key for ``json_data``: ``(key, version)`` when the caller has both.
+
+    Callers pass a submission id and its ``updated_at``, which costs nothing
+    per rerun. Without them the data's :func:`content_fingerprint` is used,
+    which serializes and hashes the whole payload.
+    """
+    if key is not None and version is not None:
+        return ("record", key, version)
+    return ("content", content_fingerprint(json_data))
+
+
+def content_fingerprint(json_data: Any) -> str:
+    """SHA-256 of ``json_data`` serialized with sorted keys."""
+    payload = json.dumps(json_data, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
 
 def _format_scalar(value: Any) -> str:
     """Wrap a scalar value in a styled HTML span based on its Python type."""
     if isinstance(value, str):
-        return f'<span class="json-string">"{value}"</span>'
-    elif isinstance(value, (int, float)):
-        return f'<span class="json-number">{value}</span>'
+        return f'<span class="json-string">"{html.escape(value)}"</span>'
     elif isinstance(value, bool):
         return f'<span class="json-boolean">{str(value).lower()}</span>'
+    elif isinstance(value, (int, float)):
+        return f'<span class="json-number">{value}</span>'
     elif value is None:
         return f'<span class="json-null">null</span>'
-    return str(value)
+    return html.escape(str(value))
+
+
+def iter_leaves(data: Any, prefix: str = "") -> Iterator[Tuple[str, Any]]:
+    """Yield ``(field_path, value)`` for every scalar in a nested extract.
+
+    Paths look like ``charges[0].amount``. Walks with an explicit stack, so
+    arbitrarily deep nesting can't hit the recursion limit; empty containers
+    yield nothing.
+    """
+    if not isinstance(data, (dict, list)):
+        yield prefix, data
+        return
+    is_dict = isinstance(data, dict)
+    stack = [(prefix, iter(data.items()) if is_dict else enumerate(data), is_dict)]
+    while stack:
+        path, items, is_dict = stack[-1]
+        item = next(items, None)
+        if item is None:
+            stack.pop()
+            continue
+        k, v = item
+        if is_dict:
+            key = f"{path}.{k}" if path else str(k)
+        else:
+            key = f"{path}[{k}]"
+        if isinstance(v, dict):
+            stack.append((key, iter(v.items()), True))
+        elif isinstance(v, list):
+            stack.append((key, enumerate(v), False))
+        else:
+            yield key, v
+
+
+class FlatTable:
+    """Field/Value/Type rows of an extract, materialized one window at a time.
+
+    Rows are produced lazily by :func:`iter_leaves`; only the requested window
+    is stringified. The walker is kept between calls, so paging forward
+    resumes where the previous page stopped instead of re-flattening from
+    the start.
+    """
+
+    def __init__(self, data: Any):
+        self.data = data
+        self._total: Optional[int] = None
+        self._leaves: Optional[Iterator[Tuple[str, Any]]] = None
+        self._position = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        if self._total is None:
+            self._total = sum(1 for _ in iter_leaves(self.data))
+        return self._total
+
+    def rows(self, start: int, stop: int) -> List[Dict[str, str]]:
+        """Return rows ``[start, stop)`` as ``{"Field", "Value", "Type"}`` dicts."""
+        with self._lock:
+            if self._leaves is None or start < self._position:
+                self._leaves = iter_leaves(self.data)
+                self._position = 0
+            window = islice(self._leaves, start - self._position, stop - self._position)
+            rows = [
+                {"Field": key, "Value": str(value), "Type": type(value).__name__}
+                for key, value in window
+            ]
+            self._position = start + len(rows)
+            return rows
+
+
+def flat_table_cached(
+    key: Optional[Hashable], json_data: Any, version: Optional[Hashable] = None
+) -> FlatTable:
+    """A :class:`FlatTable` for ``json_data``, shared per :func:`cache_identity`."""
+    cache_key = cache_identity(key, version, json_data)
+    with _tables_lock:
+        table = _tables.get(cache_key)
+        if table is None:
+            table = _tables[cache_key] = FlatTable(json_data)
+        _tables.move_to_end(cache_key)
+        while len(_tables) > _CACHE_SIZE:
+            _tables.popitem(last=False)
+        return table
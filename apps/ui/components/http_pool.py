@@ -0,0 +1,190 @@
+"""
+Shared, pooled HTTP transport for every GroundX client the app builds.
+
+Without an explicit ``httpx_client`` the GroundX SDK gives each ``GroundX``
+instance its own connection pool, and the infrastructure checker opened a
+fresh ``urllib`` connection per probe, so TCP/TLS handshakes were repeated
+across processors, checks and reruns. :func:`shared_client` returns one
+process-wide keep-alive ``httpx.Client`` that all of them use instead.
+
+Pool limits and timeouts come from the environment:
+
+* ``GROUNDX_HTTP_MAX_CONNECTIONS`` (default 50) — open connections in total
+* ``GROUNDX_HTTP_MAX_KEEPALIVE`` (default 20) — idle connections kept open
+* ``GROUNDX_HTTP_KEEPALIVE_EXPIRY`` (default 30s) — idle connection lifetime
+* ``GROUNDX_HTTP_CONNECT_TIMEOUT`` (default 10s) and ``GROUNDX_HTTP_TIMEOUT``
+  (default 60s, the SDK's own default) for reads, writes and pool waits
+* ``GROUNDX_HTTP2`` — ``auto`` (default) negotiates HTTP/2 via ALPN when the
+  optional ``h2`` package is installed; ``0`` forces HTTP/1.1
+
+Connection reuse is counted by a transport that hooks httpcore's ``trace``
+extension: every request is counted, and so is every new TCP connection, so
+``requests - connections_opened`` went over an already open connection. The
+totals are exported as ``billing_http_requests_total`` and
+``billing_http_connections_opened_total`` and returned by :func:`pool_stats`.
+
+``httpx.AsyncClient`` connections are bound to the event loop that opened
+them, so :func:`build_async_client` builds a client per caller with the same
+limits, timeouts and counters rather than sharing one.
+"""
+
+import atexit
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import httpx
+
+from apps.ui.components.metrics import REGISTRY
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "billing_http_requests_total", "HTTP requests sent through the shared GroundX transport."
+)
+HTTP_CONNECTIONS = REGISTRY.counter(
+    "billing_http_connections_opened_total",
+    "New TCP connections opened by the shared GroundX transport.",
+)
+
+# httpcore trace events marking a freshly opened connection.
+_CONNECT_EVENTS = (
+    "connection.connect_tcp.complete",
+    "connection.connect_unix_socket.complete",
+)
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name) or default)
+    except ValueError:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name) or default)
+    except ValueError:
+        return default
+
+
+def http2_enabled() -> bool:
+    """True when HTTP/2 is allowed by ``GROUNDX_HTTP2`` and ``h2`` is installed."""
+    if (os.getenv("GROUNDX_HTTP2") or "auto").lower() in ("0", "false", "no", "off"):
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=_env_int("GROUNDX_HTTP_MAX_CONNECTIONS", 50),
+        max_keepalive_connections=_env_int("GROUNDX_HTTP_MAX_KEEPALIVE", 20),
+        keepalive_expiry=_env_float("GROUNDX_HTTP_KEEPALIVE_EXPIRY", 30.0),
+    )
+
+
+def pool_timeout() -> httpx.Timeout:
+    return httpx.Timeout(
+        _env_float("GROUNDX_HTTP_TIMEOUT", 60.0),
+        connect=_env_float("GROUNDX_HTTP_CONNECT_TIMEOUT", 10.0),
+    )
+
+
+def _chain(trace, on_event):
+    """Combine an existing ``trace`` extension with our counter."""
+
+    def traced(event: str, info: Dict[str, Any]) -> None:
+        on_event(event)
+        if trace is not None:
+            trace(event, info)
+
+    return traced
+
+
+def _achain(trace, on_event):
+    async def traced(event: str, info: Dict[str, Any]) -> None:
+        on_event(event)
+        if trace is not None:
+            await trace(event, info)
+
+    return traced
+
+
+def _count_event(event: str) -> None:
+    if event in _CONNECT_EVENTS:
+        HTTP_CONNECTIONS.inc()
+
+
+class CountingTransport(httpx.HTTPTransport):
+    """``HTTPTransport`` that counts requests and newly opened connections."""
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        HTTP_REQUESTS.inc()
+        request.extensions["trace"] = _chain(request.extensions.get("trace"), _count_event)
+        return super().handle_request(request)
+
+
+class AsyncCountingTransport(httpx.AsyncHTTPTransport):
+    """Async counterpart of :class:`CountingTransport`."""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        HTTP_REQUESTS.inc()
+        request.extensions["trace"] = _achain(request.extensions.get("trace"), _count_event)
+        return await super().handle_async_request(request)
+
+
+def _client_options() -> Dict[str, Any]:
+    return {"timeout": pool_timeout(), "follow_redirects": True}
+
+
+def build_client() -> httpx.Client:
+    """A new pooled keep-alive client configured from the environment."""
+    transport = CountingTransport(limits=pool_limits(), http2=http2_enabled())
+    return httpx.Client(transport=transport, **_client_options())
+
+
+def build_async_client() -> httpx.AsyncClient:
+    """A pooled ``AsyncClient`` with the shared limits, timeouts and counters."""
+    transport = AsyncCountingTransport(limits=pool_limits(), http2=http2_enabled())
+    return httpx.AsyncClient(transport=transport, **_client_options())
+
+
+_CLIENT: Optional[httpx.Client] = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def shared_client() -> httpx.Client:
+    """The process-wide pooled client, created on first use."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None or _CLIENT.is_closed:
+            _CLIENT = build_client()
+        return _CLIENT
+
+
+def close_shared_client() -> None:
+    """Close the shared client's connections (a new one is built on next use)."""
+    global _CLIENT
+    with _CLIENT_LOCK:
+        client, _CLIENT = _CLIENT, None
+    if client is not None:
+        client.close()
+
+
+atexit.register(close_shared_client)
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Requests sent, connections opened and how many requests reused one."""
+    requests = int(HTTP_REQUESTS.value())
+    opened = int(HTTP_CONNECTIONS.value())
+    reused = max(requests - opened, 0)
+    return {
+        "requests": requests,
+        "connections_opened": opened,
+        "reused": reused,
+        "reuse_ratio": round(reused / requests, 4) if requests else 0.0,
+        "http2": http2_enabled(),
+    }
@@ -3,19 +3,27 @@ Infrastructure readiness checks for the Billing Extraction demo.
 
 Validates the local app dependencies and GroundX connectivity required to run
 Upload & Process — without requiring cluster-admin access from the UI pod.
+
+Checks run concurrently, each under its own deadline, and share one
+``DocumentProcessor`` (and so one GroundX client). A run's results are cached
+for ``INFRA_CHECK_TTL`` seconds (default 30) per configuration, and concurrent
+runs for the same configuration wait for the one in flight, so repeated clicks
+and several users don't each hit GroundX.
 """
 
 from __future__ import annotations
 
 import os
 import tempfile
-from dataclasses import dataclass
-from typing import List, Optional
-from urllib.error import HTTPError, URLError
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
-from urllib.request import Request, urlopen
 
-from apps.ui.components.document_processor import DocumentProcessor, GROUNDX_AVAILABLE
+from apps.ui.components.document_processor import DocumentProcessor, load_sdk
+from apps.ui.components.processor_cache import ProcessorCache, get_processor
 from apps.ui.components.yaml_manager import YAMLManager
 
 
@@ -27,6 +35,25 @@ class CheckResult:
     ok: bool
     detail: str
     required: bool = True
+    duration: float = 0.0  # seconds
+
+
+# Deadline per check (seconds) for local checks; network checks get the
+# checker's request_timeout plus this much slack.
+LOCAL_CHECK_TIMEOUT = 5.0
+NETWORK_CHECK_SLACK = 2.0
+
+# (checked_at wall-clock time, results) per configuration key.
+_RESULTS: Dict[Tuple, Tuple[float, List[CheckResult]]] = {}
+_RUN_LOCKS: Dict[Tuple, threading.Lock] = {}
+_RESULTS_LOCK = threading.Lock()
+
+
+def _default_ttl() -> float:
+    try:
+        return float(os.getenv("INFRA_CHECK_TTL") or 30)
+    except ValueError:
+        return 30.0
 
 
 class InfraChecker:
@@ -37,35 +64,123 @@ class InfraChecker:
         prompts_dir: str = "prompts",
         submissions_dir: Optional[str] = None,
         request_timeout: float = 10.0,
+        cache_ttl: Optional[float] = None,
     ):
         self.prompts_dir = prompts_dir
         self.submissions_dir = submissions_dir or os.getenv(
             "SUBMISSIONS_DIR", "submissions"
         )
         self.request_timeout = request_timeout
+        self.cache_ttl = _default_ttl() if cache_ttl is None else cache_ttl
+        # Wall-clock time the results last returned by run_all were produced.
+        self.checked_at: Optional[float] = None
+        self._processor: Optional[DocumentProcessor] = None
+        self._processor_lock = threading.Lock()
+
+    def _checks(self) -> List[Tuple[str, Callable[[], CheckResult], float]]:
+        """``(name, check, deadline)`` for every check, in display order.
+
+        The name is only used when a check times out or raises.
+        """
+        network = self.request_timeout + NETWORK_CHECK_SLACK
+        return [
+            ("GroundX Python SDK", self.check_groundx_sdk, network),
+            ("GROUNDX_API_KEY", self.check_api_key, LOCAL_CHECK_TIMEOUT),
+            ("GROUNDX_BASE_URL", self.check_base_url_configured, LOCAL_CHECK_TIMEOUT),
+            ("Prompts directory", self.check_prompts_directory, LOCAL_CHECK_TIMEOUT),
+            ("Default schema (simple.yaml)", self.check_default_schema, LOCAL_CHECK_TIMEOUT),
+            ("Submissions storage", self.check_submissions_writable, LOCAL_CHECK_TIMEOUT),
+            ("GroundX HTTP reachability", self.check_groundx_http, network),
+            ("GroundX API (list buckets)", self.check_groundx_api, network),
+        ]
+
+    def _cache_key(self) -> Tuple:
+        return ProcessorCache.key(self.prompts_dir, "simple") + (
+            self.submissions_dir,
+            self.request_timeout,
+        )
+
+    def run_all(self, use_cache: bool = True) -> List[CheckResult]:
+        """Return every check's result in display order.
+
+        Results younger than ``cache_ttl`` are reused unless ``use_cache`` is
+        False; otherwise the checks run concurrently (see :meth:`run_checks`).
+        """
+        key = self._cache_key()
+        with _RESULTS_LOCK:
+            run_lock = _RUN_LOCKS.setdefault(key, threading.Lock())
+        with run_lock:
+            with _RESULTS_LOCK:
+                cached = _RESULTS.get(key)
+            if use_cache and cached and time.time() - cached[0] < self.cache_ttl:
+                self.checked_at = cached[0]
+                return list(cached[1])
+
+            checked_at = time.time()
+            results = self.run_checks()
+            if self.cache_ttl > 0:
+                with _RESULTS_LOCK:
+                    _RESULTS[key] = (checked_at, results)
+            self.checked_at = checked_at
+            return list(results)
+
+    def run_checks(self) -> List[CheckResult]:
+        """Run every check concurrently, each bounded by its own deadline.
 
-    def run_all(self) -> List[CheckResult]:
-        """Execute every check and return results in display order."""
-        results: List[CheckResult] = []
-        results.append(self.check_groundx_sdk())
-        results.append(self.check_api_key())
-        results.append(self.check_base_url_configured())
-        results.append(self.check_prompts_directory())
-        results.append(self.check_default_schema())
-        results.append(self.check_submissions_writable())
-        results.append(self.check_groundx_http())
-        results.append(self.check_groundx_api())
-        return results
+        A check that misses its deadline is reported as failed; its thread is
+        left to finish in the background rather than holding up the page.
+        """
+        checks = self._checks()
+        pool = ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="infra-check")
+        try:
+            started = time.monotonic()
+            futures = [
+                (pool.submit(self._timed, name, check), name, timeout)
+                for name, check, timeout in checks
+            ]
+            results = []
+            for future, name, timeout in futures:
+                remaining = max(started + timeout - time.monotonic(), 0.0)
+                try:
+                    results.append(future.result(timeout=remaining))
+                except FutureTimeoutError:
+                    results.append(
+                        CheckResult(
+                            name=name,
+                            ok=False,
+                            detail=f"Timed out after {timeout:.0f}s.",
+                            duration=timeout,
+                        )
+                    )
+            return results
+        finally:
+            pool.shutdown(wait=False)
+
+    @staticmethod
+    def _timed(name: str, check: Callable[[], CheckResult]) -> CheckResult:
+        started = time.monotonic()
+        try:
+            result = check()
+        except Exception as exc:
+            result = CheckResult(name=name, ok=False, detail=f"Check failed: {exc}")
+        return replace(result, duration=round(time.monotonic() - started, 3))
+
+    def processor(self) -> DocumentProcessor:
+        """The processor shared by this run's GroundX checks."""
+        with self._processor_lock:
+            if self._processor is None:
+                self._processor = get_processor(prompts_dir=self.prompts_dir)
+            return self._processor
 
     def check_groundx_sdk(self) -> CheckResult:
         """Verify groundx[extract] and the prompt manager import cleanly."""
-        if GROUNDX_AVAILABLE:
+        if load_sdk():
             return CheckResult(
                 name="GroundX Python SDK",
                 ok=True,
                 detail="groundx[extract] and ExtractPromptManager are importable.",
             )
-        processor = DocumentProcessor()
+        processor = self.processor()
         return CheckResult(
             name="GroundX Python SDK",
             ok=False,
@@ -186,7 +301,7 @@ class InfraChecker:
             return CheckResult(
                 name="GroundX HTTP reachability",
                 ok=True,
-                detail=f"Reached {base_url} (HTTP {status}).",
+                detail=f"Reached {base_url} (HTTP {status}). {self._pool_summary()}",
             )
         except Exception as exc:
             return CheckResult(
@@ -196,19 +311,34 @@ class InfraChecker:
             )
 
     def _http_status(self, url: str) -> int:
-        """Return an HTTP status code for ``url`` (errors with a code still count)."""
-        request = Request(url, method="GET")
+        """Return an HTTP status code for ``url`` (errors with a code still count).
+
+        Goes through the shared keep-alive pool, so the probe warms (or reuses)
+        the connection the GroundX clients send their requests over.
+        """
+        import httpx
+
+        from apps.ui.components.http_pool import shared_client
+
         try:
-            with urlopen(request, timeout=self.request_timeout) as response:
-                return int(response.status)
-        except HTTPError as exc:
-            return int(exc.code)
-        except URLError as exc:
-            raise RuntimeError(exc.reason) from exc
+            return shared_client().get(url, timeout=self.request_timeout).status_code
+        except httpx.HTTPError as exc:
+            raise RuntimeError(str(exc) or type(exc).__name__) from exc
+
+    @staticmethod
+    def _pool_summary() -> str:
+        from apps.ui.components.http_pool import pool_stats
+
+        stats = pool_stats()
+        protocol = "HTTP/2 allowed" if stats["http2"] else "HTTP/1.1"
+        return (
+            f"Shared pool: {stats['requests']} request(s) over "
+            f"{stats['connections_opened']} connection(s), {stats['reused']} reused ({protocol})."
+        )
 
     def check_groundx_api(self) -> CheckResult:
         """Authenticate and list buckets via the GroundX SDK."""
-        processor = DocumentProcessor()
+        processor = self.processor()
         if not processor.is_ready:
             return CheckResult(
                 name="GroundX API (list buckets)",
@@ -218,7 +348,12 @@ class InfraChecker:
             )
 
         try:
-            result = processor.gx_client.buckets.list()
+            result = processor.gx_client.buckets.list(
+                request_options={
+                    "timeout_in_seconds": int(max(self.request_timeout, 1)),
+                    "max_retries": 0,
+                }
+            )
             buckets = list(getattr(result, "buckets", None) or [])
             return CheckResult(
                 name="GroundX API (list buckets)",
@@ -0,0 +1,294 @@
+"""
+Background job queue for document extraction.
+
+``upload_page`` used to run ``DocumentProcessor.process`` inline, freezing the
+user's session for the whole ingest and losing the job if the browser
+reconnected or the script reran. Instead, "Process Document" enqueues a job:
+a ``queued`` submission is written through :class:`SubmissionStore` right
+away and a worker thread from a process-wide pool moves it through
+``ingesting`` → ``processing`` → ``complete`` (or ``error``). Job History reads
+the live state from the store.
+
+The pool size comes from ``BILLING_WORKERS`` (default 4). Jobs live in this
+Streamlit server process, and each submission the queue enqueues records its
+``owner`` (``host:pid``). When the pool starts, only this host's submissions
+that are still active and whose owning process is gone (or was this pid in a
+previous container run) are marked as errors; batch runs (:mod:`apps.batch`)
+and jobs owned by other replicas or live processes sharing the store are left
+alone.
+Starting the queue also starts the background retention pruner
+(:mod:`apps.ui.components.retention`). Jobs submitted with ``auto_schema``
+first run the local schema classifier
+(:mod:`apps.ui.components.schema_classifier`) on the worker, so a document
+is extracted with the schema its first page matches.
+"""
+
+import os
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Set
+
+from apps.ui.components.document_processor import (
+    STAGE_DOWNLOAD,
+    STAGE_INGEST,
+    STAGE_PROCESSING,
+)
+from apps.ui.components.metrics import JOB_SECONDS, JOBS
+from apps.ui.components.processor_cache import get_processor
+from apps.ui.components.retention import start_pruner
+from apps.ui.components.schema_classifier import classify
+from apps.ui.components.submission_store import SubmissionStore
+from apps.ui.components.uploads import local_path, spool_to
+
+# Submission states while a job is owned by a worker.
+QUEUED = "queued"
+INGESTING = "ingesting"
+PROCESSING = "processing"
+ACTIVE_STATES = (QUEUED, INGESTING, PROCESSING)
+
+# Identifies the queue that enqueued a submission, so a restart only fails its own jobs.
+_HOST = socket.gethostname()
+
+
+def queue_owner() -> str:
+    """``host:pid`` of this process, stored as the ``owner`` of queued submissions."""
+    return f"{_HOST}:{os.getpid()}"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Exists but belongs to another user.
+        return True
+    return True
+
+
+# Submissions enqueued by any JobQueue in this process and not yet finished.
+_RUNNING: Set[str] = set()
+_RUNNING_LOCK = threading.Lock()
+
+
+def _interrupted(submission_id: str, owner: Optional[str]) -> bool:
+    """True when ``owner`` is a queue on this host whose process no longer runs the job."""
+    host, _, pid = (owner or "").rpartition(":")
+    if host != _HOST or not pid.isdigit():
+        return False
+    if int(pid) != os.getpid():
+        return not _pid_alive(int(pid))
+    # A restarted container often reuses the pid, so our own pid only means
+    # a live job if this process enqueued it.
+    with _RUNNING_LOCK:
+        return submission_id not in _RUNNING
+
+
+# Pipeline stage → submission state shown in Job History.
+_STAGE_STATES = {
+    STAGE_INGEST: INGESTING,
+    STAGE_PROCESSING: PROCESSING,
+    STAGE_DOWNLOAD: PROCESSING,
+}
+
+
+class QueuedFile:
+    """Disk-backed snapshot of an upload, detached from the Streamlit session.
+
+    Streamlit's ``UploadedFile`` belongs to the script run that produced it, so
+    the queue spools it (in chunks) to its own temp file. ``path`` lets the
+    processor ingest that file directly; ``name`` / ``size`` / ``getvalue()``
+    match the interface the rest of the pipeline expects.
+    """
+
+    def __init__(self, uploaded_file):
+        self.name = uploaded_file.name
+        self._dir = tempfile.mkdtemp(prefix="billing-queue-")
+        self.path = os.path.join(self._dir, os.path.basename(self.name))
+        try:
+            self.size = spool_to(uploaded_file, self.path)
+        except OSError:
+            self.discard()
+            raise
+
+    def getvalue(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def discard(self) -> None:
+        """Delete the spooled copy once the job no longer needs it."""
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+        try:
+            os.rmdir(self._dir)
+        except OSError:
+            pass
+
+
+class JobQueue:
+    """Worker pool that runs extraction jobs and records their progress."""
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        store: Optional[SubmissionStore] = None,
+    ):
+        """Start the pool; ``max_workers`` defaults to ``BILLING_WORKERS``."""
+        if max_workers is None:
+            max_workers = int(os.getenv("BILLING_WORKERS", "4"))
+        self.store = store or SubmissionStore()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="billing-worker"
+        )
+        self._futures: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._recover_interrupted()
+        # Retention runs beside the workers that write submissions.
+        start_pruner()
+
+    def _recover_interrupted(self) -> None:
+        """Fail this host's submissions left active by a previous server process."""
+        for summary in self.store.list(status=ACTIVE_STATES):
+            record = self.store.get(summary["id"]) or {}
+            if not _interrupted(summary["id"], record.get("owner")):
+                continue
+            self.store.update(
+                record["id"],
+                status="error",
+                error="Interrupted by a server restart before it finished.",
+            )
+
+    def submit(
+        self,
+        uploaded_file,
+        yaml_file: str,
+        use_cache: bool = True,
+        refresh_cache: bool = False,
+        auto_schema: bool = False,
+    ) -> Dict[str, Any]:
+        """Enqueue ``uploaded_file`` for extraction with the ``yaml_file`` schema.
+
+        ``use_cache`` / ``refresh_cache`` are passed to
+        :meth:`DocumentProcessor.process`. With ``auto_schema`` the worker
+        classifies the document first and uses the schema it matches,
+        keeping ``yaml_file`` when unsure. Returns the ``queued`` submission
+        record immediately.
+        """
+        # Files already on disk (samples) outlive the session as they are;
+        # in-memory uploads are spooled so the worker can ingest by path.
+        job_file = uploaded_file if local_path(uploaded_file) else QueuedFile(uploaded_file)
+        with _RUNNING_LOCK:
+            record = self.store.record(
+                {
+                    "filename": job_file.name,
+                    "file_size": job_file.size,
+                    "yaml_file": yaml_file,
+                    "status": QUEUED,
+                    "owner": queue_owner(),
+                }
+            )
+            _RUNNING.add(record["id"])
+        future = self._executor.submit(
+            self._run,
+            record["id"],
+            job_file,
+            yaml_file,
+            use_cache,
+            refresh_cache,
+            auto_schema,
+            time.monotonic(),
+        )
+        with self._lock:
+            self._futures[record["id"]] = future
+        future.add_done_callback(lambda _: self._forget(record["id"]))
+        return record
+
+    def _forget(self, submission_id: str) -> None:
+        with self._lock:
+            self._futures.pop(submission_id, None)
+        with _RUNNING_LOCK:
+            _RUNNING.discard(submission_id)
+
+    def pending(self) -> int:
+        """Number of jobs queued or running in this process."""
+        with self._lock:
+            return len(self._futures)
+
+    def _run(
+        self,
+        submission_id: str,
+        job_file,
+        yaml_file: str,
+        use_cache: bool,
+        refresh_cache: bool,
+        auto_schema: bool,
+        submitted_at: float,
+    ) -> None:
+        """Worker body: run the pipeline and persist each state transition."""
+        state = {"current": QUEUED}
+        queue_wait = round(time.monotonic() - submitted_at, 4)
+        pre_timings = {"queue": queue_wait}
+
+        def on_stage(stage: str) -> None:
+            new_state = _STAGE_STATES.get(stage)
+            if new_state and new_state != state["current"]:
+                state["current"] = new_state
+                self.store.update(submission_id, status=new_state)
+
+        def on_status(msg: str) -> None:
+            self.store.update(submission_id, progress=msg)
+
+        try:
+            if auto_schema:
+                classification = classify(job_file, yaml_file)
+                yaml_file = classification.schema
+                pre_timings["classify"] = round(classification.elapsed, 4)
+                self.store.update(
+                    submission_id, yaml_file=yaml_file, classification=classification.as_dict()
+                )
+            processor = get_processor(os.path.splitext(yaml_file)[0])
+            job = processor.process(
+                job_file,
+                on_status=on_status,
+                on_stage=on_stage,
+                use_cache=use_cache,
+                refresh_cache=refresh_cache,
+            )
+        except Exception as exc:
+            timings = dict(getattr(exc, "timings", None) or {}, **pre_timings)
+            self._observe("error", timings)
+            self.store.update(
+                submission_id, status="error", error=str(exc), timings=timings
+            )
+            return
+        finally:
+            if isinstance(job_file, QueuedFile):
+                job_file.discard()
+
+        job["timings"] = dict(job.get("timings") or {}, **pre_timings)
+        self._observe("complete", job["timings"])
+        job.update(yaml_file=yaml_file, status="complete", progress=None)
+        self.store.update(submission_id, **job)
+
+    @staticmethod
+    def _observe(status: str, timings: Dict[str, float]) -> None:
+        JOBS.inc(status=status)
+        JOB_SECONDS.observe(timings.get("total", 0.0) + timings["queue"])
+
+
+_QUEUE: Optional[JobQueue] = None
+_QUEUE_LOCK = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Return the process-wide job queue, starting it on first use."""
+    global _QUEUE
+    with _QUEUE_LOCK:
+        if _QUEUE is None:
+            _QUEUE = JobQueue()
+        return _QUEUE
@@ -0,0 +1,267 @@
+"""
+Prometheus-style metrics for the extraction pipeline.
+
+A small in-process registry of counters and histograms, rendered in the
+Prometheus text exposition format (no client library needed). The pipeline
+records:
+
+* ``billing_jobs_total{status}`` — finished jobs by final status
+* ``billing_job_duration_seconds`` — end-to-end job time
+* ``billing_stage_duration_seconds{stage}`` — time spent in each pipeline stage
+* ``billing_status_polls_total{phase}`` — ``get_processing_status_by_id`` calls
+* ``billing_upload_bytes_total`` — bytes handed to GroundX ingest
+* ``billing_submission_bytes_written_total`` / ``..._saved_total`` — submission
+  record bytes written to disk, and bytes saved by compressing them
+* ``billing_submissions_pruned_total`` / ``billing_submissions_reclaimed_bytes_total``
+  — submissions archived by retention pruning, and record bytes it freed
+
+:func:`start_metrics_server` serves ``/metrics`` from a daemon thread next to
+the Streamlit server, on ``METRICS_PORT`` (default 9102; ``0`` disables it).
+"""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Seconds; spans a cached replay (milliseconds) up to the 900s processing timeout.
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 900)
+
+LabelValues = Tuple[str, ...]
+
+
+def _labels(names: Sequence[str], values: LabelValues, extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, k)} {_number(v)}" for k, v in items]
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum and count per label set."""
+
+    kind = "histogram"
+
+    def __init__(self, *args, buckets: Sequence[float] = DEFAULT_BUCKETS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [bucket counts..., +Inf count, sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.setdefault(key, [0] * (len(self.buckets) + 1) + [0.0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+            state[len(self.buckets)] += 1
+            state[-1] += value
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        lines = []
+        for key, state in items:
+            for bound, count in zip(self.buckets, state):
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, key, le)} {count}")
+            count = state[len(self.buckets)]
+            inf = _labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{inf} {count}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(state[-1])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {count}")
+        return lines
+
+
+class Registry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: List[_Metric] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._add(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._add(Histogram(name, documentation, labelnames, buckets=buckets))
+
+    def _add(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """The whole registry in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+JOBS = REGISTRY.counter("billing_jobs_total", "Extraction jobs by final status.", ("status",))
+JOB_SECONDS = REGISTRY.histogram(
+    "billing_job_duration_seconds",
+    "End-to-end extraction job time in seconds, including queue wait.",
+)
+STAGE_SECONDS = REGISTRY.histogram(
+    "billing_stage_duration_seconds", "Time spent in each pipeline stage in seconds.", ("stage",)
+)
+STATUS_POLLS = REGISTRY.counter(
+    "billing_status_polls_total", "GroundX processing-status polls by phase.", ("phase",)
+)
+UPLOAD_BYTES = REGISTRY.counter(
+    "billing_upload_bytes_total", "Bytes of documents handed to GroundX ingest."
+)
+SUBMISSION_BYTES_WRITTEN = REGISTRY.counter(
+    "billing_submission_bytes_written_total", "Bytes of submission records written to disk."
+)
+SUBMISSION_BYTES_SAVED = REGISTRY.counter(
+    "billing_submission_bytes_saved_total",
+    "Bytes saved by gzip-compressing large submission records.",
+)
+SUBMISSIONS_PRUNED = REGISTRY.counter(
+    "billing_submissions_pruned_total", "Submissions archived and deleted by retention."
+)
+SUBMISSIONS_RECLAIMED_BYTES = REGISTRY.counter(
+    "billing_submissions_reclaimed_bytes_total",
+    "Bytes of submission records deleted by retention pruning.",
+)
+
+
+class StageClock:
+    """Times consecutive pipeline stages and records them in ``STAGE_SECONDS``.
+
+    Call :meth:`enter` as each stage starts; :meth:`finish` closes the last one
+    and returns ``{stage: seconds, ..., "total": seconds}`` for the job record.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self._stage: Optional[str] = None
+        self._entered = self.started
+        self.timings: Dict[str, float] = {}
+
+    def enter(self, stage: str) -> None:
+        self._close()
+        self._stage = stage
+
+    def _close(self) -> None:
+        now = time.monotonic()
+        if self._stage is not None:
+            elapsed = now - self._entered
+            self.timings[self._stage] = round(self.timings.get(self._stage, 0.0) + elapsed, 4)
+            STAGE_SECONDS.observe(elapsed, stage=self._stage)
+        self._stage = None
+        self._entered = now
+
+    def finish(self) -> Dict[str, float]:
+        self._close()
+        return dict(self.timings, total=round(self._entered - self.started, 4))
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = REGISTRY.render().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+_SERVER: Optional[ThreadingHTTPServer] = None
+_SERVER_LOCK = threading.Lock()
+
+
+def start_metrics_server(port: Optional[int] = None, host: str = "0.0.0.0") -> Optional[int]:
+    """Serve ``/metrics`` on a daemon thread once per process; return the port.
+
+    Returns None when disabled (``METRICS_PORT=0``) or when the port is taken,
+    e.g. by another Streamlit server process on the same host.
+    """
+    global _SERVER
+    if port is None:
+        port = int(os.getenv("METRICS_PORT", "9102"))
+    if port <= 0:
+        return None
+    with _SERVER_LOCK:
+        if _SERVER is None:
+            try:
+                _SERVER = ThreadingHTTPServer((host, port), _MetricsHandler)
+            except OSError:
+                return None
+            _SERVER.daemon_threads = True
+            threading.Thread(
+                target=_SERVER.serve_forever, name="metrics-server", daemon=True
+            ).start()
+        return _SERVER.server_address[1]
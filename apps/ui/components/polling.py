@@ -0,0 +1,121 @@
+"""
+Polling strategies for GroundX processing-status checks.
+
+``DocumentProcessor.wait_for_completion`` used to sleep a fixed 5 s between
+``get_processing_status_by_id`` calls, which delays small bills and floods the
+API with status requests for long multi-page PDFs. A strategy decides how long
+to wait before the next poll from the current status phase (queued vs
+processing), how many polls that phase has used, and how much of the deadline
+is left.
+"""
+
+import random
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+QUEUED = "queued"
+PROCESSING = "processing"
+
+
+def status_phase(status: str) -> str:
+    """Map a GroundX ingest status onto the polling phase it is scheduled under."""
+    return QUEUED if status in ("", "queued") else PROCESSING
+
+
+class PollingStrategy(ABC):
+    """Decides the delay before the next status poll."""
+
+    @abstractmethod
+    def next_delay(self, phase: str, attempt: int, remaining: float) -> float:
+        """Return seconds to sleep after the ``attempt``-th poll (0-based) of ``phase``.
+
+        ``remaining`` is the time left before the caller's deadline; the result
+        must not exceed it.
+        """
+
+
+@dataclass(frozen=True)
+class FixedPolling(PollingStrategy):
+    """Constant interval between polls (the original behavior)."""
+
+    interval: float = 5.0
+
+    def next_delay(self, phase: str, attempt: int, remaining: float) -> float:
+        return max(0.0, min(self.interval, remaining))
+
+
+@dataclass(frozen=True)
+class PhaseSchedule:
+    """Backoff schedule for one status phase.
+
+    The first ``fast_polls`` polls (at least the first one) wait ``initial``
+    seconds; after that the delay grows by ``factor`` per poll up to
+    ``max_delay``.
+    """
+
+    initial: float
+    max_delay: float
+    factor: float = 2.0
+    fast_polls: int = 0
+
+    def delay(self, attempt: int) -> float:
+        fast_polls = max(1, self.fast_polls)
+        if attempt < fast_polls:
+            return self.initial
+        return min(self.max_delay, self.initial * self.factor ** (attempt - fast_polls + 1))
+
+
+def _default_schedules() -> Dict[str, PhaseSchedule]:
+    # Small bills often leave the queue and finish within a second, so both
+    # phases start with a few sub-second polls; queued jobs then back off
+    # further, since a busy queue can hold them for minutes.
+    return {
+        QUEUED: PhaseSchedule(initial=0.5, max_delay=15.0, factor=1.5, fast_polls=3),
+        PROCESSING: PhaseSchedule(initial=0.5, max_delay=10.0, factor=1.6, fast_polls=3),
+    }
+
+
+@dataclass(frozen=True)
+class AdaptivePolling(PollingStrategy):
+    """Fast initial polls, then exponential backoff with jitter per status phase.
+
+    ``jitter`` spreads each delay by up to ±``jitter`` (fractional) so many
+    concurrent jobs don't poll in lock-step. Delays are capped by the time
+    remaining before the deadline so the final poll lands on it.
+    """
+
+    schedules: Dict[str, PhaseSchedule] = field(default_factory=_default_schedules)
+    jitter: float = 0.2
+    min_delay: float = 0.1
+
+    def next_delay(self, phase: str, attempt: int, remaining: float) -> float:
+        schedule = self.schedules.get(phase) or self.schedules[PROCESSING]
+        delay = schedule.delay(attempt)
+        if self.jitter:
+            delay *= 1.0 + random.uniform(-self.jitter, self.jitter)
+        return max(0.0, min(max(delay, self.min_delay), remaining))
+
+
+@dataclass
+class PollStats:
+    """Counters describing how a job's status polling went."""
+
+    polls: int = 0
+    by_phase: Dict[str, int] = field(default_factory=dict)
+    waited: float = 0.0
+
+    def record(self, phase: str, delay: Optional[float] = None) -> None:
+        """Count one poll in ``phase`` and, when given, the delay that followed."""
+        self.polls += 1
+        self.by_phase[phase] = self.by_phase.get(phase, 0) + 1
+        if delay:
+            self.waited += delay
+
+    def as_dict(self) -> Dict[str, object]:
+        """Compact summary suitable for a submission record."""
+        return {
+            "polls": self.polls,
+            "by_phase": dict(self.by_phase),
+            "waited_s": round(self.waited, 3),
+        }
@@ -0,0 +1,116 @@
+"""
+Process-wide cache of ready :class:`DocumentProcessor` instances.
+
+Building a processor creates a ``GroundX`` client, a ``Logger`` and an
+``ExtractPromptManager`` that loads and parses the schema YAML — work that
+Streamlit used to repeat on every rerun (each widget interaction), plus once
+more per infrastructure check and background job. Processors are instead
+shared per ``(prompts_dir, schema, API key, base URL, upload API)``; the API
+key is only kept as a hash.
+
+An entry is rebuilt when its schema file changes: the file's mtime and size
+are checked on every lookup, and its SHA-256 is recomputed only when those
+moved, so touching a file without editing it keeps the cached processor.
+
+Sharing is safe across sessions and worker threads. The GroundX client is
+thread-safe; the bucket cache, workflow registry and extraction cache lock
+their own state; and ``ExtractPromptManager`` serializes the SDK's schema
+reloads, its renders and its schema-hash memo behind one per-manager lock,
+since the SDK ``PromptManager`` itself does no locking. Per-job state (poll
+stats, staged uploads) is never stored on the processor. Lookups
+for the same key are single-flight, so concurrent sessions build one
+processor rather than one each. Processors that failed to initialize are
+returned but not cached, so a fixed configuration is picked up next time.
+"""
+
+import hashlib
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+from apps.ui.components.document_processor import DocumentProcessor
+from apps.ui.components.extraction_cache import file_hash
+
+CacheKey = Tuple[str, str, str, Optional[str], Optional[str]]
+# (mtime_ns, size, sha256) of the schema file; None when it can't be read.
+Signature = Optional[Tuple[int, int, Optional[str]]]
+
+
+class ProcessorCache:
+    """Thread-safe map of configuration → shared :class:`DocumentProcessor`."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[CacheKey, Tuple[DocumentProcessor, Signature]] = {}
+        self._key_locks: Dict[CacheKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(prompts_dir: str, file_name: str) -> CacheKey:
+        """Cache key for ``file_name`` under the current GroundX environment."""
+        api_key = os.getenv("GROUNDX_API_KEY") or ""
+        return (
+            prompts_dir,
+            file_name,
+            hashlib.sha256(api_key.encode()).hexdigest(),
+            os.getenv("GROUNDX_BASE_URL") or None,
+            os.getenv("GROUNDX_UPLOAD_API") or None,
+        )
+
+    @staticmethod
+    def _signature(schema_path: str, previous: Signature) -> Signature:
+        try:
+            st = os.stat(schema_path)
+        except OSError:
+            return None
+        if previous is not None and previous[:2] == (st.st_mtime_ns, st.st_size):
+            return previous
+        return (st.st_mtime_ns, st.st_size, file_hash(schema_path))
+
+    def get(self, file_name: str = "simple", prompts_dir: str = "prompts") -> DocumentProcessor:
+        """Return the shared processor for ``file_name``, building it if needed."""
+        key = self.key(prompts_dir, file_name)
+        schema_path = os.path.join(prompts_dir, f"{file_name}.yaml")
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._lock:
+                entry = self._entries.get(key)
+            previous = entry[1] if entry else None
+            signature = self._signature(schema_path, previous)
+            if entry is not None and self._same_schema(previous, signature):
+                if signature is not previous:
+                    with self._lock:
+                        self._entries[key] = (entry[0], signature)
+                return entry[0]
+
+            processor = DocumentProcessor(prompts_dir=prompts_dir, file_name=file_name)
+            with self._lock:
+                if processor.is_ready:
+                    self._entries[key] = (processor, signature)
+                else:
+                    self._entries.pop(key, None)
+            return processor
+
+    @staticmethod
+    def _same_schema(previous: Signature, current: Signature) -> bool:
+        if previous is None or current is None:
+            return previous == current
+        return previous[2] is not None and previous[2] == current[2]
+
+    def invalidate(self, file_name: Optional[str] = None) -> None:
+        """Drop cached processors for ``file_name`` (every schema when None)."""
+        with self._lock:
+            for key in [k for k in self._entries if file_name is None or k[1] == file_name]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        self.invalidate()
+
+
+PROCESSOR_CACHE = ProcessorCache()
+
+
+def get_processor(file_name: str = "simple", prompts_dir: str = "prompts") -> DocumentProcessor:
+    """Shared :class:`DocumentProcessor` for ``file_name`` (see :class:`ProcessorCache`)."""
+    return PROCESSOR_CACHE.get(file_name=file_name, prompts_dir=prompts_dir)
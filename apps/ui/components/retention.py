@@ -0,0 +1,454 @@
+"""
+Retention, pruning and archival for the submissions directory.
+
+Without retention every job ever run stays in ``SUBMISSIONS_DIR`` until the
+volume fills up. A :class:`RetentionPolicy` decides which *finished*
+submissions (``complete`` or ``error``; running jobs are never touched)
+expire, from the environment:
+
+* ``SUBMISSIONS_MAX_AGE_DAYS`` — expire submissions older than this
+* ``SUBMISSIONS_KEEP_ERRORS_DAYS`` — age limit for ``error`` submissions
+  instead of ``SUBMISSIONS_MAX_AGE_DAYS`` (shorter or longer)
+* ``SUBMISSIONS_MAX_COUNT`` — keep only the newest this-many submissions
+
+Unset or ``0`` disables a limit; with none set nothing expires.
+
+:func:`prune` moves expired records into compressed per-month archive
+bundles — ``archive/<YYYY-MM>.jsonl.gz`` under the submissions directory,
+one gzip member appended per batch — and records each archived id in an
+``archived`` table of the submission index, so :class:`Archive` can still
+list months, stream a month's records or fetch one record by id on demand.
+Only once a batch is durably archived are its record files and index rows
+deleted — and only those of records that were actually written to the bundle;
+a record file that cannot be read is logged, counted as ``skipped`` and left
+in place for an operator. A crash in between leaves a duplicate that readers
+ignore. Each
+bundle's committed size is tracked too, and a bundle is truncated back to it
+before the next append, so a member torn by a crash never hides later ones.
+
+Pruning is rate-limited: records are handled ``SUBMISSIONS_PRUNE_BATCH``
+(default 100) at a time with a ``SUBMISSIONS_PRUNE_PAUSE`` (default 0.2s)
+sleep between batches, so request handling keeps getting disk and index
+time. :func:`start_pruner` runs it on a daemon thread every
+``SUBMISSIONS_PRUNE_INTERVAL`` seconds (default 3600; ``0`` disables), once
+per process, and an exclusive lock file keeps server processes sharing the
+volume from pruning concurrently. Each run's report (records archived,
+bytes reclaimed, months touched) goes to the log, to the
+``billing_submissions_pruned_total`` and
+``billing_submissions_reclaimed_bytes_total`` metrics and to
+``.state/retention.json``, which :func:`last_report` reads back.
+"""
+
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from apps.ui.components.metrics import SUBMISSIONS_PRUNED, SUBMISSIONS_RECLAIMED_BYTES
+from apps.ui.components.submission_store import SubmissionStore
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: no cross-process lock
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_ARCHIVE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS archived (
+    id TEXT PRIMARY KEY,
+    month TEXT,
+    created_at TEXT,
+    status TEXT,
+    filename TEXT,
+    yaml_file TEXT,
+    archived_at TEXT
+);
+CREATE INDEX IF NOT EXISTS archived_month ON archived (month);
+CREATE TABLE IF NOT EXISTS archive_bundles (month TEXT PRIMARY KEY, size INTEGER);
+"""
+
+
+def _env_number(name: str, cast, default):
+    raw = os.getenv(name)
+    if not raw:
+        return default
+    try:
+        return cast(raw)
+    except ValueError:
+        return default
+
+
+def _limit(name: str, cast) -> Optional[Any]:
+    """A positive retention limit from ``name``; unset, ``0`` or invalid disables it."""
+    value = _env_number(name, cast, None)
+    return value if value is not None and value > 0 else None
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Which finished submissions expire; ``None`` disables a limit."""
+
+    max_age_days: Optional[float] = None
+    max_count: Optional[int] = None
+    keep_errors_days: Optional[float] = None
+
+    @classmethod
+    def from_env(cls) -> "RetentionPolicy":
+        return cls(
+            max_age_days=_limit("SUBMISSIONS_MAX_AGE_DAYS", float),
+            max_count=_limit("SUBMISSIONS_MAX_COUNT", int),
+            keep_errors_days=_limit("SUBMISSIONS_KEEP_ERRORS_DAYS", float),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return any(
+            v is not None for v in (self.max_age_days, self.max_count, self.keep_errors_days)
+        )
+
+    def cutoffs(self, now: Optional[datetime] = None) -> Dict[str, Optional[str]]:
+        """``status -> ISO timestamp`` before which a finished submission is expired."""
+        now = now or datetime.now(timezone.utc)
+
+        def before(days: Optional[float]) -> Optional[str]:
+            return None if days is None else (now - timedelta(days=days)).isoformat()
+
+        error_days = self.max_age_days if self.keep_errors_days is None else self.keep_errors_days
+        return {"complete": before(self.max_age_days), "error": before(error_days)}
+
+
+def _month(record: Dict[str, Any]) -> str:
+    created = str(record.get("created_at") or "")
+    return created[:7] if len(created) >= 7 and created[4] == "-" else "unknown"
+
+
+class Archive:
+    """Compressed per-month bundles of expired submissions, queryable on demand."""
+
+    def __init__(self, store: SubmissionStore):
+        self.store = store
+        self.archive_dir = os.path.join(store.base_dir, "archive")
+        with closing(self._connect()) as conn, conn:
+            conn.executescript(_ARCHIVE_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.store.index_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _bundle(self, month: str) -> str:
+        return os.path.join(self.archive_dir, f"{month}.jsonl.gz")
+
+    # -- writes --------------------------------------------------------------
+
+    def add(self, records: List[Dict[str, Any]]) -> int:
+        """Durably append ``records`` to their month bundles; return bytes appended."""
+        by_month: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            by_month.setdefault(_month(record), []).append(record)
+        os.makedirs(self.archive_dir, exist_ok=True)
+        archived_at = datetime.now(timezone.utc).isoformat()
+        written = 0
+        with closing(self._connect()) as conn, conn:
+            sizes = dict(conn.execute("SELECT month, size FROM archive_bundles").fetchall())
+            for month, batch in by_month.items():
+                lines = "".join(
+                    json.dumps(r, separators=(",", ":"), default=str) + "\n" for r in batch
+                )
+                member = gzip.compress(lines.encode("utf-8"), compresslevel=9, mtime=0)
+                size = self._append(month, sizes.get(month, 0), member)
+                conn.execute(
+                    "INSERT OR REPLACE INTO archive_bundles (month, size) VALUES (?, ?)",
+                    (month, size),
+                )
+                written += len(member)
+            conn.executemany(
+                "INSERT OR REPLACE INTO archived "
+                "(id, month, created_at, status, filename, yaml_file, archived_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        r["id"],
+                        _month(r),
+                        r.get("created_at"),
+                        r.get("status"),
+                        r.get("filename"),
+                        r.get("yaml_file"),
+                        archived_at,
+                    )
+                    for r in records
+                ),
+            )
+        return written
+
+    def _append(self, month: str, committed: int, member: bytes) -> int:
+        """Write ``member`` after the ``committed`` bytes of a bundle; return its new size."""
+        path = self._bundle(month)
+        with open(path, "r+b" if os.path.exists(path) else "wb") as f:
+            f.truncate(committed)  # drop a member torn by an earlier crash
+            f.seek(committed)
+            f.write(member)
+            f.flush()
+            os.fsync(f.fileno())
+        return committed + len(member)
+
+    # -- reads ---------------------------------------------------------------
+
+    def months(self) -> List[Dict[str, Any]]:
+        """``[{month, count, bytes}]`` for every bundle, newest month first."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT a.month, COUNT(*) AS count, b.size FROM archived a "
+                "LEFT JOIN archive_bundles b ON b.month = a.month "
+                "GROUP BY a.month ORDER BY a.month DESC"
+            ).fetchall()
+        return [
+            {"month": row["month"], "count": row["count"], "bytes": row["size"] or 0}
+            for row in rows
+        ]
+
+    def count(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM archived").fetchone()[0]
+
+    def _scan(self, month: str) -> Iterator[Dict[str, Any]]:
+        """Every record in a bundle, in append order; stops at a torn final member."""
+        try:
+            f = gzip.open(self._bundle(month), "rt", encoding="utf-8")
+        except OSError:
+            return
+        with f:
+            try:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(record, dict):
+                        yield record
+            except (EOFError, OSError, zlib.error):
+                return
+
+    def records(self, month: str, status: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Archived records from ``month`` (``YYYY-MM``), optionally one status only."""
+        seen = set()
+        for record in self._scan(month):
+            if record.get("id") in seen:
+                continue  # re-archived after a crash between archive and delete
+            seen.add(record.get("id"))
+            if status is None or record.get("status") == status:
+                yield record
+
+    def get(self, submission_id: str) -> Optional[Dict[str, Any]]:
+        """One archived record by id, or None."""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT month FROM archived WHERE id = ?", (submission_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        for record in self._scan(row["month"]):
+            if record.get("id") == submission_id:
+                return record
+        return None
+
+
+def prune(
+    store: Optional[SubmissionStore] = None,
+    policy: Optional[RetentionPolicy] = None,
+    dry_run: bool = False,
+    batch_size: Optional[int] = None,
+    pause: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Archive and delete every expired submission; return what was reclaimed.
+
+    The report has ``expired`` (records past retention), ``archived`` /
+    ``deleted`` (0 on a dry run), ``skipped`` (unreadable records left in
+    place), ``bytes_reclaimed`` (record files removed),
+    ``archive_bytes`` (compressed bytes added to bundles), ``months`` touched
+    and ``duration`` in seconds.
+    """
+    store = store or SubmissionStore()
+    policy = policy or RetentionPolicy.from_env()
+    batch_size = batch_size or max(_env_number("SUBMISSIONS_PRUNE_BATCH", int, 100), 1)
+    if pause is None:
+        pause = max(_env_number("SUBMISSIONS_PRUNE_PAUSE", float, 0.2), 0.0)
+    started = time.monotonic()
+    report: Dict[str, Any] = {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "dry_run": dry_run,
+        "expired": 0,
+        "archived": 0,
+        "deleted": 0,
+        "skipped": 0,
+        "bytes_reclaimed": 0,
+        "archive_bytes": 0,
+        "months": [],
+    }
+    if policy.enabled:
+        cutoffs = policy.cutoffs()
+        if dry_run:
+            expired = store.expired(cutoffs, keep=policy.max_count)
+            report["expired"] = len(expired)
+            report["months"] = sorted({_month(s) for s in expired})
+        else:
+            _prune_batches(store, cutoffs, policy.max_count, batch_size, pause, report)
+    report["duration"] = round(time.monotonic() - started, 3)
+    return report
+
+
+def _prune_batches(
+    store: SubmissionStore,
+    cutoffs: Dict[str, Optional[str]],
+    keep: Optional[int],
+    batch_size: int,
+    pause: float,
+    report: Dict[str, Any],
+) -> None:
+    archive = Archive(store)
+    months = set()
+    # Unreadable records stay in the index, so later queries skip past them.
+    skipped: set = set()
+    while True:
+        # Deleted rows drop out of the query, so each batch is the next oldest.
+        limit = batch_size + len(skipped)
+        rows = store.expired(cutoffs, keep=keep, limit=limit)
+        batch = [s for s in rows if s["id"] not in skipped]
+        if not batch:
+            break
+        records, unreadable = [], []
+        for summary in batch:
+            record = store.get(summary["id"])
+            if record is None:
+                unreadable.append(summary["id"])
+            else:
+                records.append(record)
+        if unreadable:
+            logger.warning(
+                "Not archiving %d unreadable submission(s); left in place: %s",
+                len(unreadable),
+                ", ".join(unreadable),
+            )
+            skipped.update(unreadable)
+        report["expired"] += len(batch)
+        report["skipped"] += len(unreadable)
+        if records:
+            report["archive_bytes"] += archive.add(records)
+            # Only records now in a bundle may be deleted.
+            freed = store.delete([r["id"] for r in records])
+            report["archived"] += len(records)
+            report["deleted"] += len(records)
+            report["bytes_reclaimed"] += freed
+            months.update(_month(r) for r in records)
+            SUBMISSIONS_PRUNED.inc(len(records))
+            SUBMISSIONS_RECLAIMED_BYTES.inc(freed)
+        if len(rows) < limit:
+            break
+        time.sleep(pause)
+    report["months"] = sorted(months)
+
+
+# -- background pruning ------------------------------------------------------
+
+
+def _state_path(store: SubmissionStore, name: str) -> str:
+    return os.path.join(store.base_dir, ".state", name)
+
+
+def last_report(store: Optional[SubmissionStore] = None) -> Optional[Dict[str, Any]]:
+    """The report of the most recent background or CLI prune, if any."""
+    store = store or SubmissionStore()
+    try:
+        with open(_state_path(store, "retention.json")) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _save_report(store: SubmissionStore, report: Dict[str, Any]) -> None:
+    path = _state_path(store, "retention.json")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=".retention-", dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(report, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def run_exclusive(
+    store: Optional[SubmissionStore] = None, **kwargs: Any
+) -> Optional[Dict[str, Any]]:
+    """:func:`prune` unless another process is already pruning this directory.
+
+    Returns the report (also saved for :func:`last_report`), or None when the
+    lock is held elsewhere.
+    """
+    store = store or SubmissionStore()
+    lock_path = _state_path(store, "prune.lock")
+    os.makedirs(os.path.dirname(lock_path), exist_ok=True)
+    with open(lock_path, "a") as lock:
+        if fcntl is not None:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return None
+        report = prune(store, **kwargs)
+    if not report["dry_run"]:
+        _save_report(store, report)
+    return report
+
+
+_PRUNER: Optional[threading.Thread] = None
+_PRUNER_LOCK = threading.Lock()
+
+
+def _pruner_loop(interval: float) -> None:
+    while True:
+        try:
+            report = run_exclusive()
+            if report and report["expired"]:
+                logger.info(
+                    "Pruned %d submission(s) into %s; reclaimed %d bytes in %.1fs",
+                    report["deleted"],
+                    ", ".join(report["months"]) or "no months",
+                    report["bytes_reclaimed"],
+                    report["duration"],
+                )
+        except Exception:
+            logger.exception("Submission pruning failed")
+        time.sleep(interval)
+
+
+def start_pruner(interval: Optional[float] = None) -> bool:
+    """Prune on a daemon thread every ``interval`` seconds, once per process.
+
+    Returns False when pruning is disabled (``SUBMISSIONS_PRUNE_INTERVAL=0``
+    or no retention limit configured).
+    """
+    global _PRUNER
+    if interval is None:
+        interval = _env_number("SUBMISSIONS_PRUNE_INTERVAL", float, 3600.0)
+    if interval <= 0 or not RetentionPolicy.from_env().enabled:
+        return False
+    with _PRUNER_LOCK:
+        if _PRUNER is None:
+            _PRUNER = threading.Thread(
+                target=_pruner_loop, args=(interval,), name="submission-pruner", daemon=True
+            )
+            _PRUNER.start()
+    return True
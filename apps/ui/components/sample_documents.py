@@ -41,7 +41,8 @@ class SampleDocument:
     Exposes ``name``, ``size``, and ``getvalue()`` so
     :class:`~apps.ui.components.document_processor.DocumentProcessor` and
     :class:`~apps.ui.components.client.BillingClient` can treat samples the
-    same as user uploads.
+    same as user uploads. ``path`` lets the processor ingest the file in place
+    instead of reading it into memory and copying it back to disk.
     """
 
     def __init__(self, path: str):
@@ -49,6 +50,10 @@ class SampleDocument:
         self.name = os.path.basename(path)
         self._bytes: Optional[bytes] = None
 
+    @property
+    def path(self) -> str:
+        return self._path
+
     @property
     def size(self) -> int:
         return os.path.getsize(self._path)
@@ -0,0 +1,259 @@
+"""
+Local pre-ingest classifier that picks the extraction schema for a document.
+
+Running a document through GroundX with the wrong schema costs a full ingest
+and extraction that comes back empty. Before a job is handed to
+:meth:`DocumentProcessor.process`, :func:`classify` reads only the first
+page's text layer (via the optional ``pypdf`` package) and scores it against
+a fingerprint of every schema in ``prompts/*.yaml``:
+
+* keywords — each field's ``identifiers`` (the labels printed on the bill,
+  e.g. "Account Number") plus the field name itself ("amount due"); the
+  keyword score is the fraction of a schema's keywords found on the page as
+  whole words (so "tax" does not match "syntax")
+* providers — optional company names per schema, listed in a sidecar
+  ``prompts/fingerprints.json`` (``{"<schema>": {"providers": [...],
+  "keywords": [...]}}``); a provider match adds ``PROVIDER_WEIGHT``
+
+The best schema is used when its score reaches ``CLASSIFIER_MIN_CONFIDENCE``
+(default 0.5) and beats the runner-up by ``CLASSIFIER_MIN_MARGIN`` (default
+0.1). Otherwise — and for images, scans without a text layer or when
+``pypdf`` is missing — the caller's selected schema is kept. Every result
+carries its confidence, per-schema scores, the keywords that matched and how
+long classification took; the time is also recorded as the ``classify``
+stage in ``billing_stage_duration_seconds``.
+
+Fingerprints are derived from the parsed schemas, which :class:`YAMLManager`
+caches by mtime and size, so classifying a document costs one first-page text
+extraction and a few substring checks.
+"""
+
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from apps.ui.components.metrics import STAGE_SECONDS
+from apps.ui.components.uploads import local_path
+from apps.ui.components.yaml_manager import YAMLManager
+
+STAGE_CLASSIFY = "classify"
+
+# Score added when one of a schema's provider names is on the page.
+PROVIDER_WEIGHT = 0.5
+
+FINGERPRINTS_FILE = "fingerprints.json"
+
+_SPACE = re.compile(r"\s+")
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name) or default)
+    except ValueError:
+        return default
+
+
+def _normalize(text: str) -> str:
+    return _SPACE.sub(" ", text.replace("\xa0", " ")).strip().lower()
+
+
+@lru_cache(maxsize=4096)
+def _term_pattern(term: str) -> "re.Pattern[str]":
+    """Matches ``term`` only where it is not part of a longer word."""
+    return re.compile(r"(?<!\w)" + re.escape(term) + r"(?!\w)")
+
+
+def _contains(text: str, term: str) -> bool:
+    return _term_pattern(term).search(text) is not None
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """Keywords and provider names that identify documents for one schema."""
+
+    schema: str
+    keywords: Tuple[str, ...] = ()
+    providers: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class Classification:
+    """Schema chosen for a document and how sure the classifier was."""
+
+    schema: str
+    confidence: float
+    fallback: bool
+    reason: str
+    elapsed: float
+    scores: Dict[str, float] = field(default_factory=dict)
+    matched: Tuple[str, ...] = ()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Compact summary suitable for a submission record."""
+        return {
+            "schema": self.schema,
+            "confidence": round(self.confidence, 3),
+            "fallback": self.fallback,
+            "reason": self.reason,
+            "elapsed_ms": round(self.elapsed * 1000, 2),
+            "scores": {k: round(v, 3) for k, v in self.scores.items()},
+            "matched": list(self.matched),
+        }
+
+
+def _field_keywords(fields: Dict[str, Any]) -> List[str]:
+    keywords: List[str] = []
+    for name, spec in fields.items():
+        if not isinstance(spec, dict):
+            continue
+        prompt = spec.get("prompt")
+        if isinstance(prompt, dict):
+            keywords.append(name.replace("_", " "))
+            identifiers = prompt.get("identifiers") or []
+            if isinstance(identifiers, str):
+                identifiers = [identifiers]
+            keywords.extend(str(i) for i in identifiers)
+        if isinstance(spec.get("fields"), dict):
+            keywords.extend(_field_keywords(spec["fields"]))
+    return keywords
+
+
+def schema_fingerprint(
+    schema: str, content: Optional[Dict[str, Any]], extra: Optional[Dict[str, Any]] = None
+) -> Fingerprint:
+    """Fingerprint of ``schema`` from its parsed YAML plus optional sidecar entries."""
+    keywords: List[str] = []
+    if not isinstance(content, dict):
+        content = {}
+    for group in content.values():
+        if isinstance(group, dict) and isinstance(group.get("fields"), dict):
+            keywords.extend(_field_keywords(group["fields"]))
+    extra = extra or {}
+    keywords.extend(str(k) for k in extra.get("keywords") or [])
+    unique = dict.fromkeys(k for k in (_normalize(k) for k in keywords) if k)
+    providers = tuple(
+        dict.fromkeys(_normalize(str(p)) for p in extra.get("providers") or [] if p)
+    )
+    return Fingerprint(schema=schema, keywords=tuple(unique), providers=providers)
+
+
+def _sidecar(prompts_dir: str) -> Dict[str, Any]:
+    try:
+        with open(os.path.join(prompts_dir, FINGERPRINTS_FILE)) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def fingerprints(prompts_dir: str = "prompts") -> List[Fingerprint]:
+    """Fingerprints of every ``*.yaml`` schema under ``prompts_dir``, by file name."""
+    try:
+        names = sorted(n for n in os.listdir(prompts_dir) if n.endswith((".yaml", ".yml")))
+    except OSError:
+        return []
+    manager = YAMLManager(yaml_dir=prompts_dir)
+    sidecar = _sidecar(prompts_dir)
+    result = []
+    for name in names:
+        stem = os.path.splitext(name)[0]
+        extra = sidecar.get(stem) or sidecar.get(name)
+        if not isinstance(extra, dict):
+            extra = None
+        result.append(schema_fingerprint(name, manager.load_content(name), extra))
+    return result
+
+
+def first_page_text(uploaded_file) -> Optional[str]:
+    """Text layer of a PDF's first page; None for images or when ``pypdf`` is missing.
+
+    Returns an empty string for a PDF without a text layer (e.g. a scan).
+    In-memory uploads are read through their own stream (pypdf seeks to the
+    first page's objects) and rewound afterwards, rather than copied.
+    """
+    if not uploaded_file.name.lower().endswith(".pdf"):
+        return None
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        return None
+    path = local_path(uploaded_file)
+    if path is None and not callable(getattr(uploaded_file, "seek", None)):
+        return ""
+    position = None if path else uploaded_file.tell()
+    try:
+        if path is None:
+            uploaded_file.seek(0)
+        reader = PdfReader(path or uploaded_file)
+        if not reader.pages:
+            return ""
+        return reader.pages[0].extract_text() or ""
+    except Exception:
+        # Malformed or encrypted PDFs are left to GroundX.
+        return ""
+    finally:
+        if position is not None:
+            uploaded_file.seek(position)
+
+
+def score(text: str, fingerprint: Fingerprint) -> Tuple[float, List[str]]:
+    """``(score, matched terms)`` of normalized page ``text`` against one schema."""
+    matched = [k for k in fingerprint.keywords if _contains(text, k)]
+    value = len(matched) / len(fingerprint.keywords) if fingerprint.keywords else 0.0
+    providers = [p for p in fingerprint.providers if _contains(text, p)]
+    if providers:
+        value += PROVIDER_WEIGHT
+        matched.extend(providers)
+    return min(value, 1.0), matched
+
+
+def classify(
+    uploaded_file,
+    fallback: str,
+    prompts_dir: str = "prompts",
+) -> Classification:
+    """Pick the schema for ``uploaded_file``, keeping ``fallback`` when unsure."""
+    started = time.perf_counter()
+
+    def result(schema: str, confidence: float, reason: str, **kwargs: Any) -> Classification:
+        elapsed = time.perf_counter() - started
+        STAGE_SECONDS.observe(elapsed, stage=STAGE_CLASSIFY)
+        return Classification(
+            schema=schema,
+            confidence=confidence,
+            fallback=reason != "matched",
+            reason=reason,
+            elapsed=elapsed,
+            **kwargs,
+        )
+
+    text = first_page_text(uploaded_file)
+    if text is None:
+        if uploaded_file.name.lower().endswith(".pdf"):
+            return result(fallback, 0.0, "pypdf is not installed")
+        return result(fallback, 0.0, "no text layer (image)")
+    text = _normalize(text)
+    if not text:
+        return result(fallback, 0.0, "no text layer on the first page")
+
+    candidates = fingerprints(prompts_dir)
+    scored = sorted(
+        ((*score(text, fp), fp.schema) for fp in candidates),
+        key=lambda s: s[0],
+        reverse=True,
+    )
+    scores = {schema: value for value, _, schema in scored}
+    if not scored:
+        return result(fallback, 0.0, "no schemas found", scores=scores)
+
+    best, matched, schema = scored[0]
+    runner_up = scored[1][0] if len(scored) > 1 else 0.0
+    if best < _env_float("CLASSIFIER_MIN_CONFIDENCE", 0.5):
+        return result(fallback, best, "low confidence", scores=scores, matched=tuple(matched))
+    if best - runner_up < _env_float("CLASSIFIER_MIN_MARGIN", 0.1):
+        return result(fallback, best, "ambiguous", scores=scores, matched=tuple(matched))
+    return result(schema, best, "matched", scores=scores, matched=tuple(matched))
@@ -8,26 +8,290 @@ job can be tracked and revisited later.
 Records are written as one JSON file per submission under ``SUBMISSIONS_DIR``
 (default ``submissions/`` locally, ``/app/data/submissions`` in the container),
 which is backed by a persistent volume in the OpenShift deployment.
+
+A SQLite index (WAL mode, ``.index.sqlite3`` in the same directory, overridable
+with ``SUBMISSIONS_INDEX``) holds one lightweight summary row per submission, so
+listing, filtering and paginating Job History never opens the JSON payloads.
+The full record — including ``extracted_data`` — is only loaded by :meth:`get`.
+JSON files written before the index existed are imported on first use.
+
+Record files are written compactly to a temp file in the same directory,
+fsynced and atomically renamed over ``<id>.json``, so a crash mid-write leaves
+the previous version (or nothing) rather than a truncated file. Encodings of
+at least ``SUBMISSIONS_COMPRESS_THRESHOLD`` bytes (default 64 KiB; ``0``
+disables compression) are gzipped — large ``extracted_data`` payloads shrink
+severalfold — and reads detect gzip by its magic bytes, so plain, compressed
+and older pretty-printed files all load the same way. Bytes written and bytes
+saved by compression are exported as ``billing_submission_bytes_written_total``
+and ``billing_submission_bytes_saved_total``; :meth:`SubmissionStore.compact`
+rewrites existing files in the current encoding and reports what it reclaimed.
 """
 
+import gzip
 import json
 import os
+import sqlite3
+import tempfile
+import threading
 import uuid
+from contextlib import closing
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from apps.ui.components.extract_quality import quality_of
+from apps.ui.components.metrics import SUBMISSION_BYTES_SAVED, SUBMISSION_BYTES_WRITTEN
+
+# Serializes read-modify-write updates from background workers in this process.
+_UPDATE_LOCK = threading.Lock()
+
+# Index files whose schema/migration check already ran in this process; the
+# store is constructed on every Streamlit rerun.
+_INITIALIZED: set = set()
+_INIT_LOCK = threading.Lock()
+
+_GZIP_MAGIC = b"\x1f\x8b"
+
+# Suffix of in-flight temp files; never matches ``*.json``, so readers skip them.
+_TMP_SUFFIX = ".tmp"
+
+_FILE_MODE: Optional[int] = None
+_FILE_MODE_READ = False
+
+
+def _file_mode() -> Optional[int]:
+    """Mode a plain ``open()`` would give new files, read once from the umask.
+
+    mkstemp creates 0600 files. The umask is read from ``/proc/self/status``
+    rather than set-and-restored with ``os.umask``, which would briefly change
+    it for every thread in the server. Where that isn't available, None keeps
+    mkstemp's mode.
+    """
+    global _FILE_MODE, _FILE_MODE_READ
+    if not _FILE_MODE_READ:
+        try:
+            with open("/proc/self/status") as f:
+                for line in f:
+                    if line.startswith("Umask:"):
+                        _FILE_MODE = 0o666 & ~int(line.split()[1], 8)
+                        break
+        except (OSError, ValueError, IndexError):
+            pass
+        _FILE_MODE_READ = True
+    return _FILE_MODE
+
+
+def _compress_threshold() -> int:
+    try:
+        return int(os.getenv("SUBMISSIONS_COMPRESS_THRESHOLD") or 64 * 1024)
+    except ValueError:
+        return 64 * 1024
+
+
+def _encode(record: Dict[str, Any], threshold: int) -> Tuple[bytes, int]:
+    """``(stored bytes, uncompressed size)`` for ``record``."""
+    data = json.dumps(record, separators=(",", ":"), default=str).encode("utf-8")
+    if 0 < threshold <= len(data):
+        return gzip.compress(data, compresslevel=6, mtime=0), len(data)
+    return data, len(data)
+
+
+def encode_record(record: Dict[str, Any], threshold: Optional[int] = None) -> bytes:
+    """Compact JSON for ``record``, gzipped when it is at least ``threshold`` bytes."""
+    return _encode(record, _compress_threshold() if threshold is None else threshold)[0]
+
+
+def decode_record(data: bytes) -> Any:
+    """Inverse of :func:`encode_record`; also reads pretty-printed legacy files."""
+    if data[:2] == _GZIP_MAGIC:
+        data = gzip.decompress(data)
+    return json.loads(data)
+
+
+def _read_record(path: str) -> Any:
+    with open(path, "rb") as f:
+        return decode_record(f.read())
+
+
+def _fsync_dir(directory: str) -> None:
+    """Make a rename in ``directory`` durable (a no-op where unsupported)."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+# Record fields mirrored into the index (everything Job History lists/filters on).
+SUMMARY_FIELDS = (
+    "id",
+    "created_at",
+    "updated_at",
+    "filename",
+    "file_size",
+    "yaml_file",
+    "status",
+    "bucket_id",
+    "workflow_id",
+    "process_id",
+    "document_id",
+    "error",
+    "cache_hit",
+)
+
+# Totals from the record's ``quality`` block, indexed so Job History and bulk
+# reports can spot empty extracts without loading payloads.
+QUALITY_FIELDS = ("has_values", "filled", "leaves")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    id TEXT PRIMARY KEY,
+    created_at TEXT,
+    updated_at TEXT,
+    filename TEXT,
+    file_size INTEGER,
+    yaml_file TEXT,
+    status TEXT,
+    bucket_id,
+    workflow_id TEXT,
+    process_id TEXT,
+    document_id TEXT,
+    error TEXT,
+    cache_hit INTEGER,
+    has_values INTEGER,
+    filled INTEGER,
+    leaves INTEGER
+);
+CREATE INDEX IF NOT EXISTS submissions_created ON submissions (created_at DESC);
+CREATE INDEX IF NOT EXISTS submissions_status ON submissions (status, created_at DESC);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
 
 
 class SubmissionStore:
-    """File-backed store of extraction submissions."""
+    """File-backed store of extraction submissions with a SQLite summary index."""
 
-    def __init__(self, base_dir: Optional[str] = None):
-        """Initialize the store, creating the submissions directory if needed."""
+    def __init__(self, base_dir: Optional[str] = None, index_path: Optional[str] = None):
+        """Initialize the store, creating the submissions directory and index if needed."""
         self.base_dir = base_dir or os.getenv("SUBMISSIONS_DIR", "submissions")
         os.makedirs(self.base_dir, exist_ok=True)
+        self.index_path = index_path or os.getenv(
+            "SUBMISSIONS_INDEX", os.path.join(self.base_dir, ".index.sqlite3")
+        )
+        self.compress_threshold = _compress_threshold()
+        self._init_index()
 
     def _path(self, submission_id: str) -> str:
         return os.path.join(self.base_dir, f"{submission_id}.json")
 
+    # -- index ---------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_index(self) -> None:
+        """Create/upgrade the index once per index file and process."""
+        key = os.path.abspath(self.index_path)
+        with _INIT_LOCK:
+            if key in _INITIALIZED and os.path.exists(self.index_path):
+                return
+            self._create_index()
+            _INITIALIZED.add(key)
+
+    def _create_index(self) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(submissions)")}
+            added = [c for c in QUALITY_FIELDS if c not in columns]
+            for column in added:
+                conn.execute(f"ALTER TABLE submissions ADD COLUMN {column} INTEGER")
+            migrated = conn.execute(
+                "SELECT value FROM meta WHERE key = 'migrated_json'"
+            ).fetchone()
+        if migrated is None or added:
+            # New columns are backfilled from the JSON files.
+            self.migrate()
+
+    @staticmethod
+    def _summary_row(record: Dict[str, Any]) -> List[Any]:
+        row = []
+        for field in SUMMARY_FIELDS:
+            value = record.get(field)
+            if field == "cache_hit":
+                value = 1 if value else 0
+            elif value is not None and not isinstance(value, (str, int, float)):
+                value = str(value)
+            row.append(value)
+        if record.get("extracted_data") is None and record.get("quality") is None:
+            row.extend([None] * len(QUALITY_FIELDS))
+        else:
+            quality = quality_of(record)
+            row.extend(int(quality[field]) for field in QUALITY_FIELDS)
+        return row
+
+    def _index(self, conn: sqlite3.Connection, records: Iterable[Dict[str, Any]]) -> None:
+        columns = SUMMARY_FIELDS + QUALITY_FIELDS
+        placeholders = ", ".join("?" for _ in columns)
+        conn.executemany(
+            f"INSERT OR REPLACE INTO submissions ({', '.join(columns)}) "
+            f"VALUES ({placeholders})",
+            (self._summary_row(r) for r in records),
+        )
+
+    @staticmethod
+    def _row_to_summary(row: sqlite3.Row) -> Dict[str, Any]:
+        summary = {k: row[k] for k in SUMMARY_FIELDS if row[k] is not None}
+        summary["cache_hit"] = bool(row["cache_hit"])
+        if not summary["cache_hit"]:
+            del summary["cache_hit"]
+        if row["has_values"] is not None:
+            summary["quality"] = {
+                "has_values": bool(row["has_values"]),
+                "filled": row["filled"],
+                "leaves": row["leaves"],
+            }
+        return summary
+
+    def migrate(self) -> int:
+        """Import every JSON submission file into the index; return how many.
+
+        Safe to re-run: rows are upserted from the JSON files, which stay the
+        source of truth. Records are streamed into the index one file at a
+        time, so memory use does not grow with the number of submissions.
+        """
+        count = 0
+
+        def records() -> Iterator[Dict[str, Any]]:
+            nonlocal count
+            with os.scandir(self.base_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".json"):
+                        continue
+                    try:
+                        record = _read_record(entry.path)
+                    except (OSError, ValueError, EOFError):
+                        continue
+                    if isinstance(record, dict) and record.get("id"):
+                        count += 1
+                        yield record
+
+        with closing(self._connect()) as conn, conn:
+            self._index(conn, records())
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('migrated_json', ?)",
+                (datetime.now(timezone.utc).isoformat(),),
+            )
+        return count
+
+    # -- writes --------------------------------------------------------------
+
     def record(self, job: Dict[str, Any]) -> Dict[str, Any]:
         """Persist a completed job and return the stored record (with id/timestamp).
 
@@ -41,30 +305,280 @@ class SubmissionStore:
         record.setdefault("created_at", datetime.now(timezone.utc).isoformat())
         record.setdefault("status", "complete")
 
-        with open(self._path(record["id"]), "w") as f:
-            json.dump(record, f, indent=2, default=str)
+        self._write(record)
         return record
 
-    def list(self) -> List[Dict[str, Any]]:
-        """Return all submissions, newest first."""
-        records: List[Dict[str, Any]] = []
-        if not os.path.isdir(self.base_dir):
-            return records
-        for name in os.listdir(self.base_dir):
-            if not name.endswith(".json"):
-                continue
+    def _write(self, record: Dict[str, Any]) -> None:
+        self._write_file(self._path(record["id"]), record)
+        with closing(self._connect()) as conn, conn:
+            self._index(conn, [record])
+
+    def _write_file(self, path: str, record: Dict[str, Any]) -> int:
+        """Atomically replace ``path`` with the encoded record; return bytes written."""
+        data, raw_size = _encode(record, self.compress_threshold)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=".submission-", suffix=_TMP_SUFFIX, dir=self.base_dir
+        )
+        try:
+            mode = _file_mode()
+            if mode is not None:
+                os.chmod(tmp_path, mode)
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except OSError:
             try:
-                with open(os.path.join(self.base_dir, name)) as f:
-                    records.append(json.load(f))
-            except (OSError, json.JSONDecodeError):
-                continue
-        records.sort(key=lambda r: r.get("created_at", ""), reverse=True)
-        return records
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        _fsync_dir(self.base_dir)
+        SUBMISSION_BYTES_WRITTEN.inc(len(data))
+        SUBMISSION_BYTES_SAVED.inc(max(raw_size - len(data), 0))
+        return len(data)
+
+    def update(self, submission_id: str, **fields: Any) -> Optional[Dict[str, Any]]:
+        """Merge ``fields`` into an existing submission and persist it.
+
+        Used by background workers to move a job through its states. Returns
+        the updated record, or None if the submission doesn't exist.
+        """
+        with _UPDATE_LOCK:
+            record = self.get(submission_id)
+            if record is None:
+                return None
+            record.update(fields)
+            record["updated_at"] = datetime.now(timezone.utc).isoformat()
+            self._write(record)
+            return record
+
+    # -- reads ---------------------------------------------------------------
+
+    @staticmethod
+    def _filters(
+        status: Optional[Union[str, Sequence[str]]],
+        since: Optional[str],
+        until: Optional[str] = None,
+        yaml_file: Optional[str] = None,
+    ) -> tuple:
+        clauses, params = [], []
+        if status:
+            statuses = [status] if isinstance(status, str) else list(status)
+            clauses.append(f"status IN ({', '.join('?' for _ in statuses)})")
+            params.extend(statuses)
+        if since:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        if until:
+            clauses.append("created_at < ?")
+            params.append(until)
+        if yaml_file:
+            clauses.append("yaml_file = ?")
+            params.append(yaml_file)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def list(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        status: Optional[Union[str, Sequence[str]]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return submission summaries, newest first.
+
+        Summaries carry the :data:`SUMMARY_FIELDS` plus the ``quality`` totals
+        (without per-field counts) — call :meth:`get` for the full record with
+        ``extracted_data``.
+
+        Args:
+            limit: Maximum number of rows (all when None).
+            offset: Rows to skip, for pagination.
+            status: Only submissions in this status (or any of these statuses).
+            since: Only submissions created at or after this ISO-8601 timestamp.
+            until: Only submissions created before this ISO-8601 timestamp.
+        """
+        where, params = self._filters(status, since, until)
+        sql = f"SELECT * FROM submissions {where} ORDER BY created_at DESC"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [self._row_to_summary(row) for row in rows]
+
+    def count(
+        self,
+        status: Optional[Union[str, Sequence[str]]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        yaml_file: Optional[str] = None,
+    ) -> int:
+        """Number of submissions matching the same filters as :meth:`iter_summaries`."""
+        where, params = self._filters(status, since, until, yaml_file)
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                f"SELECT COUNT(*) FROM submissions {where}", params
+            ).fetchone()[0]
+
+    def iter_summaries(
+        self,
+        status: Optional[Union[str, Sequence[str]]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        yaml_file: Optional[str] = None,
+        batch_size: int = 500,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield matching summaries oldest first, reading ``batch_size`` rows at a time.
+
+        Pages by ``(created_at, id)`` rather than OFFSET, so each batch is an
+        index range scan and rows written during the walk don't shift it.
+        ``until`` is an exclusive upper bound on ``created_at``.
+        """
+        where, params = self._filters(status, since, until, yaml_file)
+        cursor: Optional[tuple] = None
+        while True:
+            clause, page_params = where, list(params)
+            if cursor is not None:
+                clause += (" AND " if clause else "WHERE ") + "(created_at, id) > (?, ?)"
+                page_params.extend(cursor)
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    f"SELECT * FROM submissions {clause} ORDER BY created_at, id LIMIT ?",
+                    page_params + [batch_size],
+                ).fetchall()
+            for row in rows:
+                yield self._row_to_summary(row)
+            if len(rows) < batch_size:
+                return
+            cursor = (rows[-1]["created_at"], rows[-1]["id"])
+
+    def yaml_files(
+        self,
+        status: Optional[Union[str, Sequence[str]]] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> List[str]:
+        """Distinct schema files among submissions matching the same filters."""
+        where, params = self._filters(status, since, until)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT DISTINCT yaml_file FROM submissions {where} ORDER BY yaml_file", params
+            ).fetchall()
+        return [row[0] for row in rows if row[0]]
+
+    def expired(
+        self,
+        cutoffs: Dict[str, str],
+        keep: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Summaries of submissions past retention, oldest first.
+
+        Args:
+            cutoffs: ``status -> ISO timestamp``; a submission in one of these
+                statuses created before its status' timestamp is expired.
+                Submissions in other statuses (e.g. still running) never are.
+            keep: Also expire all but the newest ``keep`` submissions in the
+                ``cutoffs`` statuses.
+            limit: Maximum number of rows (all when None).
+        """
+        if not cutoffs:
+            return []
+        statuses = list(cutoffs)
+        in_statuses = f"status IN ({', '.join('?' for _ in statuses)})"
+        clauses, params = [], []
+        for status, cutoff in cutoffs.items():
+            if cutoff:
+                clauses.append("(status = ? AND created_at < ?)")
+                params.extend([status, cutoff])
+        if keep is not None:
+            clauses.append(
+                f"id IN (SELECT id FROM submissions WHERE {in_statuses} "
+                "ORDER BY created_at DESC, id DESC LIMIT -1 OFFSET ?)"
+            )
+            params.extend(statuses + [keep])
+        if not clauses:
+            return []
+        sql = (
+            f"SELECT * FROM submissions WHERE {in_statuses} AND ({' OR '.join(clauses)}) "
+            "ORDER BY created_at, id"
+        )
+        params = statuses + params
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [self._row_to_summary(row) for row in rows]
 
     def get(self, submission_id: str) -> Optional[Dict[str, Any]]:
         """Load a single submission by id, or None if it doesn't exist."""
         try:
-            with open(self._path(submission_id)) as f:
-                return json.load(f)
-        except (OSError, json.JSONDecodeError):
+            return _read_record(self._path(submission_id))
+        except (OSError, ValueError, EOFError):
             return None
+
+    # -- maintenance ---------------------------------------------------------
+
+    def delete(self, submission_ids: Iterable[str]) -> int:
+        """Remove submissions' files and index rows; return the bytes freed on disk.
+
+        A row is only removed once its file is gone (or was already missing),
+        so a file that can't be unlinked stays visible in Job History.
+        """
+        removed = []
+        freed = 0
+        for submission_id in submission_ids:
+            path = self._path(submission_id)
+            try:
+                size = os.path.getsize(path)
+                os.unlink(path)
+            except FileNotFoundError:
+                size = 0
+            except OSError:
+                continue
+            removed.append(submission_id)
+            freed += size
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("DELETE FROM submissions WHERE id = ?", ((i,) for i in removed))
+        return freed
+
+    def compact(self) -> Dict[str, int]:
+        """Rewrite every record file in the current encoding; report what it reclaimed.
+
+        Converts pretty-printed files from before compact encoding and
+        (de)compresses files on either side of the threshold. Files that would
+        not change are left alone, as are files that can't be parsed. Temp
+        files left behind by a crash mid-write are removed.
+        """
+        stats = {"files": 0, "rewritten": 0, "bytes_before": 0, "bytes_after": 0}
+        with _UPDATE_LOCK:
+            for name in os.listdir(self.base_dir):
+                path = os.path.join(self.base_dir, name)
+                if name.startswith(".submission-") and name.endswith(_TMP_SUFFIX):
+                    try:
+                        os.unlink(path)
+                    except OSError:
+                        pass
+                    continue
+                if not name.endswith(".json"):
+                    continue
+                try:
+                    with open(path, "rb") as f:
+                        raw = f.read()
+                    record = decode_record(raw)
+                except (OSError, ValueError, EOFError):
+                    continue
+                stats["files"] += 1
+                stats["bytes_before"] += len(raw)
+                if encode_record(record, self.compress_threshold) == raw:
+                    stats["bytes_after"] += len(raw)
+                    continue
+                stats["bytes_after"] += self._write_file(path, record)
+                stats["rewritten"] += 1
+        stats["bytes_saved"] = stats["bytes_before"] - stats["bytes_after"]
+        return stats
@@ -0,0 +1,67 @@
+"""
+Helpers for handing uploads to the pipeline without copying them around.
+
+Documents that already live on disk (the ``test-docs/`` samples, batch inputs,
+queued uploads) expose a ``path`` and are ingested from there directly.
+In-memory uploads (Streamlit ``UploadedFile``, a ``BytesIO``) are read through a
+``memoryview`` of their buffer and written/hashed in ``UPLOAD_CHUNK_SIZE``
+slices, so no second full-size ``bytes`` object is ever built.
+"""
+
+import hashlib
+import os
+from typing import Iterator, Optional
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def local_path(uploaded_file) -> Optional[str]:
+    """Return the on-disk path backing ``uploaded_file``, if it has one."""
+    path = getattr(uploaded_file, "path", None)
+    if isinstance(path, str) and os.path.isfile(path):
+        return path
+    return None
+
+
+def iter_chunks(uploaded_file, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Iterator[memoryview]:
+    """Yield the upload's bytes as zero-copy ``memoryview`` slices."""
+    path = local_path(uploaded_file)
+    if path is not None:
+        with open(path, "rb") as f:
+            buf = bytearray(chunk_size)
+            view = memoryview(buf)
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    return
+                yield view[:n]
+
+    getbuffer = getattr(uploaded_file, "getbuffer", None)
+    if callable(getbuffer):
+        # BytesIO.getbuffer() exposes the existing buffer without copying it.
+        with getbuffer() as view:
+            for start in range(0, len(view), chunk_size):
+                yield view[start : start + chunk_size]
+        return
+
+    data = uploaded_file.getvalue()
+    view = memoryview(data)
+    for start in range(0, len(view), chunk_size):
+        yield view[start : start + chunk_size]
+
+
+def spool_to(uploaded_file, path: str, chunk_size: int = UPLOAD_CHUNK_SIZE) -> int:
+    """Write the upload to ``path`` chunk by chunk; return the bytes written."""
+    written = 0
+    with open(path, "wb") as f:
+        for chunk in iter_chunks(uploaded_file, chunk_size):
+            written += f.write(chunk)
+    return written
+
+
+def upload_sha256(uploaded_file, chunk_size: int = UPLOAD_CHUNK_SIZE) -> str:
+    """sha256 hex digest of the upload, computed chunk by chunk."""
+    digest = hashlib.sha256()
+    for chunk in iter_chunks(uploaded_file, chunk_size):
+        digest.update(chunk)
+    return digest.hexdigest()
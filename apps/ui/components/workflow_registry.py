@@ -0,0 +1,138 @@
+"""
+Persistent registry of GroundX extraction workflows.
+
+Creating a workflow is an API round trip, and creating one per processed
+document leaves thousands of identical workflows in the account. The registry
+maps each schema (per GroundX account: deployment URL plus a hash of the API
+key) to the workflow built from it along with a fingerprint of the rendered
+steps + extract config, so a workflow is only created or updated when the
+schema actually changed.
+
+Creating a workflow is a lookup → create → add-to-account → register
+sequence; :meth:`WorkflowRegistry.lock` hands out one lock per registry
+entry so concurrent jobs on a cold schema wait for a single create and then
+reuse its workflow.
+
+The mapping is a small JSON file under ``WORKFLOW_REGISTRY_PATH`` (default
+``<SUBMISSIONS_DIR>/.state/workflows.json``) so it lives on the same
+persistent volume as the submissions and survives pod restarts.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+# Serializes read-modify-write cycles between sessions in this process.
+_LOCK = threading.Lock()
+
+# One lock per (registry file, key), held while a workflow is created.
+_KEY_LOCKS: Dict[Tuple[str, str], threading.Lock] = {}
+
+
+def _default_path() -> str:
+    submissions_dir = os.getenv("SUBMISSIONS_DIR", "submissions")
+    return os.getenv(
+        "WORKFLOW_REGISTRY_PATH",
+        os.path.join(submissions_dir, ".state", "workflows.json"),
+    )
+
+
+def _jsonable(obj: Any) -> Any:
+    """Convert SDK (pydantic) models into plain JSON-compatible structures."""
+    for attr in ("model_dump", "dict"):
+        dump = getattr(obj, attr, None)
+        if callable(dump):
+            return dump()
+    return obj
+
+
+def workflow_fingerprint(name: str, steps: Any, extract: Any) -> str:
+    """Return a stable sha256 of a workflow's name, rendered steps and extract config."""
+    payload = json.dumps(
+        {"name": name, "steps": _jsonable(steps), "extract": _jsonable(extract)},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class WorkflowRegistry:
+    """File-backed mapping of schema → (fingerprint, workflow_id)."""
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize the registry; the backing file is created on first write."""
+        self.path = path or _default_path()
+
+    @staticmethod
+    def account(base_url: Optional[str], api_key: Optional[str]) -> str:
+        """Account id for ``api_key`` on ``base_url``; the key is only kept as a hash."""
+        key_hash = hashlib.sha256((api_key or "").encode()).hexdigest()
+        return f"{base_url or 'default'}|{key_hash}"
+
+    @staticmethod
+    def key(account: str, schema: str) -> str:
+        """Registry key for ``schema`` in ``account`` (see :meth:`account`)."""
+        return f"{account}|{schema}"
+
+    def lock(self, key: str) -> threading.Lock:
+        """Lock serializing workflow creation for ``key`` within this process."""
+        with _LOCK:
+            return _KEY_LOCKS.setdefault((os.path.abspath(self.path), key), threading.Lock())
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {"schemas": {}, "account_default": {}}
+        data.setdefault("schemas", {})
+        data.setdefault("account_default", {})
+        return data
+
+    def _save(self, data: Dict[str, Any]) -> None:
+        # Write-then-rename so a crash never leaves a truncated registry.
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".workflows-", dir=directory)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the ``{"fingerprint", "workflow_id", "updated_at"}`` entry for ``key``."""
+        with _LOCK:
+            return self._load()["schemas"].get(key)
+
+    def put(self, key: str, fingerprint: str, workflow_id: str) -> None:
+        """Record that ``workflow_id`` implements the schema rendered as ``fingerprint``."""
+        with _LOCK:
+            data = self._load()
+            data["schemas"][key] = {
+                "fingerprint": fingerprint,
+                "workflow_id": workflow_id,
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+            }
+            self._save(data)
+
+    def account_default(self, account: str) -> Optional[str]:
+        """Workflow last assigned as the default of ``account``, if known."""
+        with _LOCK:
+            return self._load()["account_default"].get(account)
+
+    def set_account_default(self, account: str, workflow_id: str) -> None:
+        """Remember the workflow assigned as the default of ``account``."""
+        with _LOCK:
+            data = self._load()
+            data["account_default"][account] = workflow_id
+            self._save(data)
@@ -1,6 +1,32 @@
+import copy
 import os
+import threading
 import yaml
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
+
+# libyaml's C loader parses several times faster; same safe subset of YAML.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Shared across instances and sessions: absolute path -> (mtime_ns, size, raw
+# text, parsed content or _UNPARSED). An entry is reused while the file's
+# mtime and size are unchanged; writes through this class drop it.
+_UNPARSED = object()
+_CACHE: Dict[str, Tuple[int, int, str, Any]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _signature(path: str) -> Tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def invalidate(path: Optional[str] = None) -> None:
+    """Forget the cached copy of ``path`` (every file when None)."""
+    with _CACHE_LOCK:
+        if path is None:
+            _CACHE.clear()
+        else:
+            _CACHE.pop(os.path.abspath(path), None)
 
 
 class YAMLManager:
@@ -77,6 +103,8 @@ class YAMLManager:
         except Exception as e:
             print(f"Error creating YAML file: {str(e)}")
             return False
+        finally:
+            invalidate(file_path)
 
     @staticmethod
     def validate_filename(name: str) -> Tuple[bool, str]:
@@ -87,22 +115,37 @@ class YAMLManager:
             return False, "File name must end with .yaml or .yml"
         return True, ""
 
+    def _cached(self, file_name: str, parse: bool) -> Any:
+        """Raw text (or parsed content when ``parse``) of ``file_name``, from the cache if fresh."""
+        path = os.path.abspath(os.path.join(self.yaml_dir, file_name))
+        signature = _signature(path)
+        with _CACHE_LOCK:
+            entry = _CACHE.get(path)
+        if entry is None or entry[:2] != signature:
+            with open(path) as f:
+                raw = f.read()
+            entry = (*signature, raw, _UNPARSED)
+        if parse and entry[3] is _UNPARSED:
+            entry = entry[:3] + (yaml.load(entry[2], Loader=SafeLoader),)
+        with _CACHE_LOCK:
+            _CACHE[path] = entry
+        return entry[3] if parse else entry[2]
+
     def load_content(self, file_name: str) -> Optional[Dict]:
-        """Load and parse a YAML file by name from the configured directory."""
-        file_path = os.path.join(self.yaml_dir, file_name)
+        """Load and parse a YAML file by name from the configured directory.
+
+        Returns a copy, so callers may modify it without affecting the cache.
+        """
         try:
-            with open(file_path) as f:
-                return yaml.safe_load(f)
+            return copy.deepcopy(self._cached(file_name, parse=True))
         except Exception as e:
             print(f"Error loading YAML file: {str(e)}")
             return None
 
     def load_raw(self, file_name: str) -> Optional[str]:
         """Return the raw text of a YAML file, or ``None`` if it cannot be read."""
-        file_path = os.path.join(self.yaml_dir, file_name)
         try:
-            with open(file_path) as f:
-                return f.read()
+            return self._cached(file_name, parse=False)
         except Exception as e:
             print(f"Error reading YAML file: {str(e)}")
             return None
@@ -117,11 +160,13 @@ class YAMLManager:
         except Exception as e:
             print(f"Error saving YAML file: {str(e)}")
             return False
+        finally:
+            invalidate(file_path)
 
     def edit_and_save(self, file_name: str, yaml_text: str) -> Tuple[bool, str]:
         """Parse a YAML text string and persist it to the file. Returns success status and a message."""
         try:
-            parsed = yaml.safe_load(yaml_text)
+            parsed = yaml.load(yaml_text, Loader=SafeLoader)
             if self.save_content(file_name, parsed):
                 return True, f"Successfully saved changes to {file_name}"
             return False, "Failed to save YAML file"
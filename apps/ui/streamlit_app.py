@@ -1,23 +1,23 @@
 """Main entry point for the Billing Extraction Streamlit application."""
 
+import importlib
+
 import streamlit as st
 
-from apps.ui.views.upload import upload_page
-from apps.ui.views.view_data import view_data_page
-from apps.ui.views.submissions import submissions_page
-from apps.ui.views.docs import docs_page
-from apps.ui.views.infra import infra_page
+from apps.ui.components.metrics import start_metrics_server
 
 # --- Session state ---
 # Initialize all session keys to None to avoid KeyError on first access
 for key in (
     "uploaded_file",
     "extracted_data",
+    "extracted_version",
     "bucket_id",
     "workflow_id",
     "process_id",
     "document_id",
     "submission_id",
+    "quality",
     "sample_doc_filename",
 ):
     if key not in st.session_state:
@@ -29,6 +29,9 @@ if "selected_yaml_file" not in st.session_state:
 if "uploader_key" not in st.session_state:
     st.session_state.uploader_key = 0
 
+# Prometheus /metrics alongside the Streamlit server (once per process; METRICS_PORT).
+start_metrics_server()
+
 # --- Page config ---
 st.set_page_config(page_title="Billing Extraction", layout="wide")
 
@@ -40,26 +43,35 @@ st.markdown(
     .json-number { color: #8B4513; }
     .json-boolean { color: #9932CC; }
     .json-null { color: #CD5C5C; }
+    .json-truncated { color: #808080; font-style: italic; }
     </style>""",
     unsafe_allow_html=True,
 )
 
-# Map page labels to their render functions
+# Map page labels to "module:function" of their render functions. Page modules
+# are imported on first visit, so opening Documentation doesn't pay for the
+# GroundX SDK, the job queue or SQLite (see benchmarks/import_time.py).
 PAGES = {
-    "Documentation": docs_page,
-    "Infrastructure Check": infra_page,
-    "Upload & Process": upload_page,
-    "View Extracted Data": view_data_page,
-    "Job History": submissions_page,
+    "Documentation": "apps.ui.views.docs:docs_page",
+    "Infrastructure Check": "apps.ui.views.infra:infra_page",
+    "Upload & Process": "apps.ui.views.upload:upload_page",
+    "View Extracted Data": "apps.ui.views.view_data:view_data_page",
+    "Job History": "apps.ui.views.submissions:submissions_page",
 }
 
 
+def load_page(label):
+    """Import the page module for ``label`` (cached in sys.modules) and return its renderer."""
+    module_name, func_name = PAGES[label].split(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
 def main():
     """Render the sidebar navigation and route to the selected page."""
     st.title("Billing Extraction Application")
     st.sidebar.header("Navigation")
     page_label = st.sidebar.radio("Go to", list(PAGES.keys()))
-    PAGES[page_label]()
+    load_page(page_label)()
 
 
 if __name__ == "__main__":
@@ -1,3 +1,5 @@
+import time
+
 import streamlit as st
 
 from apps.ui.components.infra_checker import InfraChecker
@@ -12,8 +14,14 @@ def infra_page():
         "writable job storage, and GroundX API connectivity."
     )
 
-    if st.button("Run checks", type="primary"):
+    run_col, refresh_col = st.columns([1, 4])
+    if run_col.button("Run checks", type="primary"):
         st.session_state["infra_checks_ran"] = True
+    refresh = refresh_col.button(
+        "Re-run now",
+        help="Ignore recently cached results and check again.",
+        disabled=not st.session_state.get("infra_checks_ran"),
+    )
 
     if not st.session_state.get("infra_checks_ran"):
         st.info("Click **Run checks** to validate the demo environment.")
@@ -21,7 +29,14 @@ def infra_page():
 
     checker = InfraChecker()
     with st.spinner("Running infrastructure checks…"):
-        results = checker.run_all()
+        results = checker.run_all(use_cache=not refresh)
+
+    age = time.time() - (checker.checked_at or time.time())
+    slowest = max((r.duration for r in results), default=0.0)
+    st.caption(
+        f"Checked {age:.0f}s ago; checks run in parallel, slowest took {slowest:.2f}s. "
+        f"Results are reused for {checker.cache_ttl:.0f}s."
+    )
 
     all_ok, passed, total = InfraChecker.summary(results)
     if all_ok:
@@ -37,7 +52,7 @@ def infra_page():
         label = result.name
         if not result.required:
             label = f"{label} (optional)"
-        with st.expander(f"{icon} {label}", expanded=not result.ok):
+        with st.expander(f"{icon} {label} · {result.duration:.2f}s", expanded=not result.ok):
             st.markdown(result.detail)
 
     st.divider()
@@ -1,36 +1,178 @@
 import json
+import os
+import tempfile
 
 import streamlit as st
 
-from apps.ui.components.document_processor import DocumentProcessor
+from apps.ui.components.export import FORMATS, MIME_TYPES, Exporter, ExportError
+from apps.ui.components.extract_quality import quality_of
+from apps.ui.components.job_queue import ACTIVE_STATES
+from apps.ui.components.retention import Archive, last_report, start_pruner
 from apps.ui.components.submission_store import SubmissionStore
 
 
-def submissions_page():
-    """Job History — list stored submissions and the data extracted by each job."""
-    st.header("Job History")
-    st.caption("Every processed document is stored here with the data it extracted.")
-
-    store = SubmissionStore()
-    submissions = store.list()
-    if not submissions:
-        st.info("No submissions yet. Process a document to create one.")
-        return
-
-    # Summary table of every job.
+def _summary_table(submissions) -> None:
+    """Summary table of every job."""
     st.table(
         [
             {
                 "Submission": s.get("id", ""),
                 "Created": s.get("created_at", ""),
                 "File": s.get("filename", ""),
-                "Status": s.get("status", ""),
+                "Status": s.get("status", "")
+                + (" (cached)" if s.get("cache_hit") else ""),
+                "Filled": (
+                    f"{s['quality']['filled']}/{s['quality']['leaves']}"
+                    if s.get("quality")
+                    else "—"
+                ),
                 "Document ID": s.get("document_id", "") or "—",
             }
             for s in submissions
         ]
     )
 
+
+# Rows per Job History page.
+PAGE_SIZE = 50
+
+
+@st.fragment(run_every=3)
+def _live_summary_table(limit: int, offset: int, status) -> None:
+    """Summary table that refreshes while background jobs are still running."""
+    store = SubmissionStore()
+    active = store.count(status=ACTIVE_STATES)
+    if active:
+        st.caption(f"{active} job(s) in progress — refreshing automatically.")
+    _summary_table(store.list(limit=limit, offset=offset, status=status))
+
+
+def _export_panel(store: SubmissionStore) -> None:
+    """Bulk export of every submission matching a status / date / schema filter."""
+    with st.expander("Export submissions"):
+        col_format, col_status, col_schema = st.columns(3)
+        with col_format:
+            fmt = st.selectbox("Format", FORMATS, key="export_format")
+        with col_status:
+            status = st.selectbox("Status", ["All", "complete", "error"], key="export_status")
+        with col_schema:
+            schema = st.selectbox("Schema", ["All", *store.yaml_files()], key="export_schema")
+        dates = st.date_input("Created between", value=(), key="export_dates")
+        since = dates[0] if len(dates) > 0 else None
+        until = dates[1] if len(dates) > 1 else since
+
+        exporter = Exporter(
+            store,
+            status=None if status == "All" else status,
+            since=since,
+            until=until,
+            schema=None if schema == "All" else schema,
+        )
+        st.caption(
+            f"{exporter.count()} submission(s) match. Records are streamed to a "
+            "temporary file; for very large exports use `python -m apps.export`."
+        )
+
+        # The file is written record by record, then handed to the download button.
+        if st.button("Prepare export"):
+            previous = st.session_state.get("export_file")
+            if previous:
+                try:
+                    os.unlink(previous[0])
+                except OSError:
+                    pass
+            fd, path = tempfile.mkstemp(prefix="billing-export-", suffix=f".{fmt}")
+            os.close(fd)
+            try:
+                with st.spinner("Exporting…"):
+                    count = exporter.write_file(fmt, path)
+            except ExportError as exc:
+                os.unlink(path)
+                st.session_state.export_file = None
+                st.error(str(exc))
+                return
+            st.session_state.export_file = (path, fmt, count)
+
+        prepared = st.session_state.get("export_file")
+        if prepared and os.path.exists(prepared[0]):
+            path, prepared_fmt, count = prepared
+            with open(path, "rb") as f:
+                st.download_button(
+                    label=f"Download {count} submission(s) ({prepared_fmt.upper()})",
+                    data=f,
+                    file_name=f"submissions.{prepared_fmt}",
+                    mime=MIME_TYPES[prepared_fmt],
+                )
+
+
+def _archive_panel(store: SubmissionStore) -> None:
+    """Retention status and on-demand lookups in the monthly archive bundles."""
+    archive = Archive(store)
+    months = archive.months()
+    report = last_report(store)
+    if not months and not report:
+        return
+    with st.expander(f"Archive ({archive.count()} submission(s))"):
+        if report:
+            st.caption(
+                f"Last pruned {report['started_at'][:19].replace('T', ' ')} UTC: "
+                f"{report['deleted']} submission(s) archived, "
+                f"{report['bytes_reclaimed'] / 1024:,.1f} KiB reclaimed."
+            )
+        if not months:
+            return
+        st.table(
+            [
+                {"Month": m["month"], "Submissions": m["count"], "Bundle KiB": m["bytes"] // 1024}
+                for m in months
+            ]
+        )
+        submission_id = st.text_input("Look up an archived submission by id").strip()
+        if submission_id:
+            record = archive.get(submission_id)
+            if record is None:
+                st.warning(f"No archived submission {submission_id}.")
+            else:
+                st.json(record)
+
+
+def submissions_page():
+    """Job History — list stored submissions and the data extracted by each job."""
+    st.header("Job History")
+    st.caption("Every processed document is stored here with the data it extracted.")
+
+    store = SubmissionStore()
+    start_pruner()
+    if not store.count():
+        st.info("No submissions yet. Process a document to create one.")
+        _archive_panel(store)
+        return
+
+    _export_panel(store)
+    _archive_panel(store)
+
+    col_status, col_page = st.columns(2)
+    with col_status:
+        status = st.selectbox("Status", ["All", "complete", "error", *ACTIVE_STATES])
+    status = None if status == "All" else status
+    total = store.count(status=status)
+    pages = max(1, -(-total // PAGE_SIZE))
+    with col_page:
+        page = st.number_input("Page", min_value=1, max_value=pages, value=1, step=1)
+    offset = (int(page) - 1) * PAGE_SIZE
+    st.caption(f"{total} submission(s) · page {int(page)} of {pages}")
+
+    # Only the visible page of summaries is read from the index.
+    submissions = store.list(limit=PAGE_SIZE, offset=offset, status=status)
+    if not submissions:
+        st.info("No submissions match this filter.")
+        return
+
+    if store.count(status=ACTIVE_STATES):
+        _live_summary_table(PAGE_SIZE, offset, status)
+    else:
+        _summary_table(submissions)
+
     # Detail view for a selected job.
     ids = [s.get("id", "") for s in submissions]
     selected = st.selectbox("Inspect a submission", ids)
@@ -52,18 +194,27 @@ def submissions_page():
                 "workflow_id",
                 "process_id",
                 "document_id",
+                "cache_hit",
+                "timings",
             )
             if record.get(k) is not None
         }
     )
 
+    if record.get("status") in ACTIVE_STATES:
+        st.info(
+            f"This job is **{record['status']}**"
+            + (f" — {record['progress']}" if record.get("progress") else "")
+            + "."
+        )
+
     if record.get("error"):
         st.error(record["error"])
 
     extracted = record.get("extracted_data")
     if extracted:
         st.markdown("### Extracted Data")
-        if not DocumentProcessor.extract_has_values(extracted):
+        if not quality_of(record)["has_values"]:
             st.warning(
                 "All extracted fields are null/blank. This usually means the "
                 "extract LLM failed (check `GROUNDX_AGENT_API_KEY`) rather than "
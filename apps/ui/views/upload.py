@@ -3,7 +3,9 @@ import os
 import streamlit as st
 
 from apps.ui.components.client import BillingClient
-from apps.ui.components.document_processor import DocumentProcessor, DocumentProcessorError
+from apps.ui.components.extract_quality import quality_of
+from apps.ui.components.job_queue import ACTIVE_STATES, get_job_queue
+from apps.ui.components.processor_cache import get_processor
 from apps.ui.components.sample_documents import available_samples, load_sample
 from apps.ui.components.submission_store import SubmissionStore
 from apps.ui.components.yaml_manager import YAMLManager
@@ -90,12 +92,13 @@ def _render_document_preview(uploaded_file) -> None:
 
 
 def upload_page():
-    """Upload page — validates the file and runs the GroundX extraction pipeline.
+    """Upload page — validates the file and queues the GroundX extraction pipeline.
 
     This drives the same steps as ``get_started.ipynb``: create a bucket, create
     the extraction workflow from the selected YAML schema, ingest the document,
-    poll for completion, and download the extractions. Each run is stored as a
-    submission so the extracted data can be tracked by job.
+    poll for completion, and download the extractions. The pipeline runs on a
+    background worker; each run is stored as a submission whose state moves
+    from ``queued`` to ``complete`` so the extracted data can be tracked by job.
     """
     st.header("Upload & Process Billing Documents")
 
@@ -111,9 +114,10 @@ def upload_page():
         3. Schema selection for data extraction
         4. Extraction and preview of results
 
-        **Important Note:** This will work with the existing documents, but may not 
-        work with new documents because the schema is used may not match 
-        the new document.
+        **Important Note:** With automatic schema selection on, the first page of a PDF
+        is matched against every schema in `prompts/`; when no schema matches clearly
+        (or the document is an image or a scan), the selected schema is used and may
+        not match a new kind of document.
         """
     )
 
@@ -139,7 +143,8 @@ def upload_page():
 
     _render_document_preview(uploaded_file)
 
-    processor = DocumentProcessor(file_name=file_name)
+    # Shared across reruns and sessions; rebuilt only when the schema changes.
+    processor = get_processor(file_name)
     st.json(processor.get_file_details(uploaded_file))
 
     if not processor.is_ready:
@@ -149,52 +154,118 @@ def upload_page():
         )
         return
 
-    if not st.button("Process Document"):
+    use_cache = st.checkbox(
+        "Reuse the stored extraction if this exact document was already processed",
+        value=True,
+        help="Identical file bytes with an unchanged schema skip GroundX entirely.",
+    )
+    refresh_cache = use_cache and st.checkbox(
+        "Refresh the stored extraction (re-run GroundX and overwrite it)",
+        value=False,
+    )
+
+    auto_schema = st.checkbox(
+        "Pick the schema from the document's first page",
+        value=True,
+        help=f"Falls back to {selected_yaml} when no schema matches clearly.",
+    )
+
+    if st.button("Process Document"):
+        # Hand the job to the background workers; the session stays responsive.
+        record = get_job_queue().submit(
+            uploaded_file,
+            selected_yaml,
+            use_cache=use_cache,
+            refresh_cache=refresh_cache,
+            auto_schema=auto_schema,
+        )
+        st.session_state.submission_id = record["id"]
+        for key in (
+            "extracted_data",
+            "extracted_version",
+            "quality",
+            "bucket_id",
+            "workflow_id",
+            "process_id",
+            "document_id",
+        ):
+            st.session_state[key] = None
+
+    submission_id = st.session_state.get("submission_id")
+    if submission_id:
+        _render_job(submission_id)
+
+
+def _render_job(submission_id: str) -> None:
+    """Show the live state of the session's latest job, or its result once done."""
+    record = SubmissionStore().get(submission_id)
+    if record is None:
+        return
+    if record.get("status") in ACTIVE_STATES:
+        _render_active_job(submission_id)
+        return
+    _render_finished_job(record)
+
+
+@st.fragment(run_every=2)
+def _render_active_job(submission_id: str) -> None:
+    """Poll the submission store until the background job leaves its active states."""
+    record = SubmissionStore().get(submission_id) or {}
+    status = record.get("status", "")
+    if status not in ACTIVE_STATES:
+        # Rerun the whole page so the finished result renders outside the fragment.
+        st.rerun()
+    st.info(
+        f"Submission `{submission_id}` is **{status}**"
+        + (f" — {record['progress']}" if record.get("progress") else "")
+        + ". You can keep using the app; progress is also shown in **Job History**."
+    )
+    _render_classification(record)
+
+
+def _render_classification(record) -> None:
+    """Caption with the schema the classifier picked for this submission, if it ran."""
+    result = record.get("classification")
+    if not result:
         return
+    outcome = (
+        f"kept **{result['schema']}** ({result['reason']})"
+        if result.get("fallback")
+        else f"matched **{result['schema']}**"
+    )
+    st.caption(
+        f"Schema classifier {outcome}, confidence {result['confidence']:.0%}, "
+        f"in {result['elapsed_ms']:.1f} ms."
+    )
 
-    # Run the pipeline, surfacing each step as live status.
-    with st.status("Processing document…", expanded=True) as status:
-        def on_status(msg: str) -> None:
-            status.write(msg)
-
-        try:
-            job = processor.process(uploaded_file, on_status=on_status)
-        except DocumentProcessorError as exc:
-            status.update(label="Processing failed", state="error")
-            st.error(str(exc))
-            # Record the failed attempt so it still shows up in job history.
-            SubmissionStore().record(
-                {
-                    "filename": uploaded_file.name,
-                    "file_size": uploaded_file.size,
-                    "yaml_file": selected_yaml,
-                    "status": "error",
-                    "error": str(exc),
-                }
-            )
-            return
 
-        record = SubmissionStore().record(job)
-        status.update(label="Extraction complete", state="complete")
+def _render_finished_job(record) -> None:
+    """Report a finished job and load its identifiers into session state."""
+    if record.get("status") == "error":
+        st.error(f"Processing failed: {record.get('error', 'unknown error')}")
+        return
 
     # Populate session state (mirrors the notebook's tracked identifiers).
-    st.session_state.bucket_id = job["bucket_id"]
-    st.session_state.workflow_id = job["workflow_id"]
-    st.session_state.process_id = job["process_id"]
-    st.session_state.document_id = job["document_id"]
-    st.session_state.extracted_data = job["extracted_data"]
-    st.session_state.submission_id = record["id"]
-
+    st.session_state.bucket_id = record.get("bucket_id")
+    st.session_state.workflow_id = record.get("workflow_id")
+    st.session_state.process_id = record.get("process_id")
+    st.session_state.document_id = record.get("document_id")
+    st.session_state.extracted_data = record.get("extracted_data")
+    st.session_state.extracted_version = record.get("updated_at")
+    st.session_state.quality = quality_of(record)
+
+    cached = " (reused a cached extraction)" if record.get("cache_hit") else ""
     st.success(
-        f"Document processed and stored as submission `{record['id']}`. "
+        f"Document processed and stored as submission `{record['id']}`{cached}. "
         "See **View Extracted Data** or **Job History**."
     )
+    _render_classification(record)
     st.json(
         {
             "submission_id": record["id"],
-            "bucket_id": job["bucket_id"],
-            "workflow_id": job["workflow_id"],
-            "process_id": job["process_id"],
-            "document_id": job["document_id"],
+            "bucket_id": record.get("bucket_id"),
+            "workflow_id": record.get("workflow_id"),
+            "process_id": record.get("process_id"),
+            "document_id": record.get("document_id"),
         }
     )
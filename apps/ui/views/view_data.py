@@ -2,31 +2,42 @@ import json
 
 import streamlit as st
 
-from apps.ui.components.document_processor import DocumentProcessor
-from apps.ui.components.formatting import format_json
+from apps.ui.components.extract_quality import quality_of, summarize
+from apps.ui.components.formatting import flat_table_cached, format_json_cached
+from apps.ui.components.submission_store import SubmissionStore
 
 
-def _flatten(data, prefix=""):
-    """Flatten a (possibly nested) extraction dict into Field/Value/Type rows."""
-    rows = []
-    if isinstance(data, dict):
-        for k, v in data.items():
-            key = f"{prefix}.{k}" if prefix else str(k)
-            if isinstance(v, (dict, list)):
-                rows.extend(_flatten(v, key))
-            else:
-                rows.append({"Field": key, "Value": str(v), "Type": type(v).__name__})
-    elif isinstance(data, list):
-        for i, item in enumerate(data):
-            rows.extend(_flatten(item, f"{prefix}[{i}]"))
-    else:
-        rows.append({"Field": prefix, "Value": str(data), "Type": type(data).__name__})
-    return rows
+TABLE_PAGE_SIZES = (50, 100, 250, 1000)
+
+
+def _table_view(table):
+    """Render one page of the flattened Field/Value/Type rows."""
+    total = len(table)
+    if total == 0:
+        st.info("The extract has no fields to tabulate.")
+        return
+    col_size, col_page = st.columns(2)
+    page_size = col_size.selectbox("Rows per page", TABLE_PAGE_SIZES, index=1)
+    pages = max(1, -(-total // page_size))
+    page = col_page.number_input("Page", min_value=1, max_value=pages, value=1, step=1)
+    start = (int(page) - 1) * page_size
+    rows = table.rows(start, start + page_size)
+    st.caption(f"Rows {start + 1}–{start + len(rows)} of {total}")
+    st.dataframe(rows, hide_index=True, use_container_width=True)
 
 
 def view_data_page():
     """Display extracted billing data in raw JSON and tabular views, with download support."""
     st.header("View Extracted Data")
+    if not st.session_state.extracted_data and st.session_state.submission_id:
+        # The job ran on a background worker; pick up its result once complete.
+        record = SubmissionStore().get(st.session_state.submission_id) or {}
+        if record.get("status") == "complete":
+            for key in ("bucket_id", "workflow_id", "process_id", "document_id"):
+                st.session_state[key] = record.get(key)
+            st.session_state.extracted_data = record.get("extracted_data")
+            st.session_state.extracted_version = record.get("updated_at")
+            st.session_state.quality = quality_of(record)
     if not st.session_state.extracted_data:
         st.warning("No extracted data available. Please process a document first.")
         return
@@ -43,7 +54,9 @@ def view_data_page():
         st.caption("Produced by job:")
         st.json(ids)
 
-    if not DocumentProcessor.extract_has_values(data):
+    # Computed once when the job was recorded; older sessions fall back to a walk.
+    quality = st.session_state.get("quality") or summarize(data)
+    if not quality["has_values"]:
         st.error(
             "This extract is an empty schema (all null/blank fields). "
             "Ingest completed, but the layout/extract LLM did not populate values. "
@@ -52,14 +65,19 @@ def view_data_page():
         )
 
     st.subheader("Extracted Billing Information")
+    if quality["leaves"]:
+        st.caption(f"{quality['filled']} of {quality['leaves']} extracted values are populated.")
     st.markdown("### Raw Data:")
-    formatted = format_json(data)
+    # Rendered once per submission version; reruns reuse the cached HTML and rows.
+    submission_id = st.session_state.get("submission_id")
+    version = st.session_state.get("extracted_version")
+    formatted = format_json_cached(submission_id, data, version=version)
     st.markdown(
         f'<pre style="background-color:#f0f0f0;padding:10px;border-radius:5px;">{formatted}</pre>',
         unsafe_allow_html=True,
     )
     st.markdown("### Tabular View:")
-    st.table(_flatten(data))
+    _table_view(flat_table_cached(submission_id, data, version=version))
 
     st.download_button(
         label="Download Extracted Data",
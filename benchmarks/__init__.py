@@ -0,0 +1 @@
+"""Performance benchmarks for the Billing Extraction application."""
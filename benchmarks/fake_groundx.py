@@ -0,0 +1,387 @@
+"""
+Local stand-in for the GroundX HTTP API, for benchmarking the pipeline offline.
+
+Implements the calls :class:`~apps.ui.components.document_processor.DocumentProcessor`
+makes through the SDK — buckets, workflows, the presigned upload used by
+``ingest`` for local files, ingest, processing status, ``get_extract`` and
+document detail — with configurable per-endpoint latency, document
+processing time and failure rates. Every request is counted per endpoint so
+runs can report API calls per document.
+
+Point the app at it with::
+
+    GROUNDX_API_KEY=anything
+    GROUNDX_BASE_URL=http://127.0.0.1:8765/api
+    GROUNDX_UPLOAD_API=http://127.0.0.1:8765/upload/file
+
+Usage::
+
+    python -m benchmarks.fake_groundx [--port 8765] [--processing-time 2]
+        [--latency ingest=0.2 --latency status=0.02] [--failure-rate extract=0.05]
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# Endpoint names used for latency/failure configuration and call counts.
+ENDPOINTS = (
+    "bucket_list",
+    "bucket_create",
+    "workflow_create",
+    "workflow_get",
+    "workflow_update",
+    "workflow_account",
+    "upload_presign",
+    "upload_put",
+    "ingest",
+    "status",
+    "extract",
+    "document",
+)
+
+_ROUTES: List[Tuple[str, "re.Pattern[str]", str]] = [
+    ("GET", re.compile(r"^/api/v1/bucket$"), "bucket_list"),
+    ("POST", re.compile(r"^/api/v1/bucket$"), "bucket_create"),
+    ("POST", re.compile(r"^/api/v1/workflow$"), "workflow_create"),
+    ("POST", re.compile(r"^/api/v1/workflow/relationship$"), "workflow_account"),
+    ("GET", re.compile(r"^/api/v1/workflow/(?P<id>[^/]+)$"), "workflow_get"),
+    ("PUT", re.compile(r"^/api/v1/workflow/(?P<id>[^/]+)$"), "workflow_update"),
+    ("GET", re.compile(r"^/upload/file$"), "upload_presign"),
+    ("PUT", re.compile(r"^/upload/objects/(?P<id>[^/]+)/.+$"), "upload_put"),
+    ("POST", re.compile(r"^/api/v1/ingest/documents/remote$"), "ingest"),
+    ("GET", re.compile(r"^/api/v1/ingest/document/extract/(?P<id>[^/]+)$"), "extract"),
+    ("GET", re.compile(r"^/api/v1/ingest/document/(?P<id>[^/]+)$"), "document"),
+    ("GET", re.compile(r"^/api/v1/ingest/(?P<id>[^/]+)$"), "status"),
+]
+
+DEFAULT_EXTRACT: Dict[str, Any] = {
+    "account_number": "287-1234-5678",
+    "amount_due": 142.37,
+    "due_date": "2025-07-15",
+    "provider_name": "Example Wireless",
+    "service_address": "100 Main St, Springfield",
+}
+
+
+@dataclass
+class FakeConfig:
+    """Behaviour of the fake service.
+
+    ``latency`` and ``failure_rate`` are keyed by endpoint name (see
+    :data:`ENDPOINTS`); failures return HTTP 500, which the SDK retries.
+    Documents stay ``queued`` for ``queue_time`` seconds, then ``processing``
+    for ``processing_time`` seconds, and end in ``error`` with probability
+    ``document_failure_rate``.
+    """
+
+    latency: Dict[str, float] = field(default_factory=dict)
+    failure_rate: Dict[str, float] = field(default_factory=dict)
+    queue_time: float = 0.5
+    processing_time: float = 2.0
+    document_failure_rate: float = 0.0
+    extract: Dict[str, Any] = field(default_factory=lambda: dict(DEFAULT_EXTRACT))
+    seed: Optional[int] = None
+
+
+class FakeGroundX:
+    """In-memory GroundX state served over HTTP on a background thread."""
+
+    def __init__(self, config: Optional[FakeConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or FakeConfig()
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._buckets: Dict[int, str] = {}
+        self._workflows: Dict[str, Dict[str, Any]] = {}
+        self._processes: Dict[str, List[Dict[str, Any]]] = {}
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        self.calls: Dict[str, int] = {name: 0 for name in ENDPOINTS}
+        self.failures: Dict[str, int] = {name: 0 for name in ENDPOINTS}
+        self._server = ThreadingHTTPServer((host, port), _handler_for(self))
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    # -- lifecycle -----------------------------------------------------------
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def base_url(self) -> str:
+        """Value for ``GROUNDX_BASE_URL``."""
+        return f"{self.url}/api"
+
+    @property
+    def upload_api(self) -> str:
+        """Value for ``GROUNDX_UPLOAD_API``."""
+        return f"{self.url}/upload/file"
+
+    def start(self) -> "FakeGroundX":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeGroundX":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def reset_counts(self) -> None:
+        with self._lock:
+            for name in ENDPOINTS:
+                self.calls[name] = 0
+                self.failures[name] = 0
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            return {k: v for k, v in self.calls.items() if v}
+
+    # -- request handling ----------------------------------------------------
+
+    def handle(
+        self, method: str, path: str, query: Dict[str, List[str]], body: Any
+    ) -> Tuple[int, Any]:
+        """Dispatch one request; returns ``(status, json_body)``."""
+        for route_method, pattern, name in _ROUTES:
+            match = pattern.match(path) if route_method == method else None
+            if match is None:
+                continue
+            with self._lock:
+                self.calls[name] += 1
+                failed = self._random.random() < self.config.failure_rate.get(name, 0.0)
+                if failed:
+                    self.failures[name] += 1
+            delay = self.config.latency.get(name, 0.0)
+            if delay:
+                time.sleep(delay)
+            if failed:
+                return 500, {"message": f"injected failure on {name}"}
+            return getattr(self, f"_{name}")(match.groupdict().get("id"), query, body)
+        return 404, {"message": f"no route for {method} {path}"}
+
+    def _bucket_list(self, _id, query, body):
+        with self._lock:
+            buckets = [{"bucketId": k, "name": v} for k, v in self._buckets.items()]
+        return 200, {"buckets": buckets, "count": len(buckets), "total": len(buckets)}
+
+    def _bucket_create(self, _id, query, body):
+        name = (body or {}).get("name", "")
+        with self._lock:
+            bucket_id = len(self._buckets) + 1
+            self._buckets[bucket_id] = name
+        return 200, {"bucket": {"bucketId": bucket_id, "name": name}}
+
+    def _workflow_create(self, _id, query, body):
+        workflow_id = uuid.uuid4().hex
+        with self._lock:
+            self._workflows[workflow_id] = dict(body or {})
+        return 200, {"workflow": {"workflowId": workflow_id, "name": (body or {}).get("name")}}
+
+    def _workflow_get(self, workflow_id, query, body):
+        with self._lock:
+            workflow = self._workflows.get(workflow_id)
+        if workflow is None:
+            return 404, {"message": "workflow not found"}
+        return 200, {"workflow": {"workflowId": workflow_id, "name": workflow.get("name")}}
+
+    def _workflow_update(self, workflow_id, query, body):
+        with self._lock:
+            if workflow_id not in self._workflows:
+                return 404, {"message": "workflow not found"}
+            self._workflows[workflow_id].update(body or {})
+        return 200, {"workflow": {"workflowId": workflow_id}}
+
+    def _workflow_account(self, _id, query, body):
+        return 200, {"message": "OK"}
+
+    def _upload_presign(self, _id, query, body):
+        name = (query.get("name") or ["file"])[0]
+        return 200, {"URL": f"{self.url}/upload/objects/{uuid.uuid4().hex}/{name}", "Method": "PUT"}
+
+    def _upload_put(self, _id, query, body):
+        return 200, None
+
+    def _ingest(self, _id, query, body):
+        documents = (body or {}).get("documents") or []
+        process_id = uuid.uuid4().hex
+        now = time.monotonic()
+        docs = []
+        with self._lock:
+            for d in documents:
+                if d.get("bucketId") not in self._buckets:
+                    return 400, {"message": f"bucket {d.get('bucketId')} does not exist"}
+            for d in documents:
+                doc = {
+                    "documentId": uuid.uuid4().hex,
+                    "fileName": d.get("fileName"),
+                    "bucketId": d.get("bucketId"),
+                    "processId": process_id,
+                    "started": now,
+                    "fails": self._random.random() < self.config.document_failure_rate,
+                }
+                docs.append(doc)
+                self._documents[doc["documentId"]] = doc
+            self._processes[process_id] = docs
+        return 200, {"ingest": {"processId": process_id, "status": "queued"}}
+
+    def _document_status(self, doc: Dict[str, Any], now: float) -> str:
+        elapsed = now - doc["started"]
+        if elapsed < self.config.queue_time:
+            return "queued"
+        if elapsed < self.config.queue_time + self.config.processing_time:
+            return "processing"
+        return "error" if doc["fails"] else "complete"
+
+    def _status(self, process_id, query, body):
+        with self._lock:
+            docs = self._processes.get(process_id)
+        if docs is None:
+            return 404, {"message": "process not found"}
+        now = time.monotonic()
+        groups: Dict[str, List[Dict[str, Any]]] = {
+            "queued": [], "processing": [], "complete": [], "errors": []
+        }
+        for doc in docs:
+            status = self._document_status(doc, now)
+            groups["errors" if status == "error" else status].append(
+                {
+                    "documentId": doc["documentId"],
+                    "fileName": doc["fileName"],
+                    "bucketId": doc["bucketId"],
+                    "processId": process_id,
+                    "status": status,
+                    "statusMessage": "injected processing failure" if status == "error" else None,
+                }
+            )
+        if groups["queued"] and not (groups["processing"] or groups["complete"] or groups["errors"]):
+            status = "queued"
+        elif groups["queued"] or groups["processing"]:
+            status = "processing"
+        elif groups["complete"]:
+            status = "complete"
+        else:
+            status = "error"
+        progress = {
+            k: {"total": len(v), "documents": v} for k, v in groups.items() if v
+        }
+        return 200, {"ingest": {"processId": process_id, "status": status, "progress": progress}}
+
+    def _extract(self, document_id, query, body):
+        with self._lock:
+            doc = self._documents.get(document_id)
+        if doc is None:
+            return 404, {"message": "document not found"}
+        return 200, self.config.extract
+
+    def _document(self, document_id, query, body):
+        with self._lock:
+            doc = self._documents.get(document_id)
+        if doc is None:
+            return 404, {"message": "document not found"}
+        return 200, {
+            "document": {
+                "documentId": document_id,
+                "fileName": doc["fileName"],
+                "bucketId": doc["bucketId"],
+                "status": self._document_status(doc, time.monotonic()),
+            }
+        }
+
+
+def _handler_for(fake: FakeGroundX):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _dispatch(self) -> None:
+            parsed = urlparse(self.path)
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            body = None
+            if raw and "json" in (self.headers.get("Content-Type") or ""):
+                try:
+                    body = json.loads(raw)
+                except ValueError:
+                    body = None
+            status, payload = fake.handle(
+                self.command, parsed.path, parse_qs(parsed.query), body
+            )
+            data = b"" if payload is None else json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
+
+
+def _pairs(values: List[str]) -> Dict[str, float]:
+    parsed = {}
+    for item in values:
+        name, _, value = item.partition("=")
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"unknown endpoint '{name}' (one of {', '.join(ENDPOINTS)})")
+        parsed[name] = float(value)
+    return parsed
+
+
+def add_config_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the :class:`FakeConfig` options on ``parser``."""
+    parser.add_argument("--latency", action="append", default=[], metavar="ENDPOINT=SECONDS")
+    parser.add_argument("--failure-rate", action="append", default=[], metavar="ENDPOINT=RATE")
+    parser.add_argument("--queue-time", type=float, default=0.5)
+    parser.add_argument("--processing-time", type=float, default=2.0)
+    parser.add_argument("--document-failure-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def config_from_args(args: argparse.Namespace) -> FakeConfig:
+    return FakeConfig(
+        latency=_pairs(args.latency),
+        failure_rate=_pairs(args.failure_rate),
+        queue_time=args.queue_time,
+        processing_time=args.processing_time,
+        document_failure_rate=args.document_failure_rate,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    fake = FakeGroundX(config_from_args(args), host=args.host, port=args.port).start()
+    print(f"GROUNDX_BASE_URL={fake.base_url}")
+    print(f"GROUNDX_UPLOAD_API={fake.upload_api}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        fake.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark for the Raw Data JSON renderer (``apps.ui.components.formatting``).
+
+Compares the streaming :func:`format_json` against the previous recursive
+``formatted += ...`` implementation on synthetic extracts with a growing number
+of itemized line items, and reports how render time scales.
+
+Usage::
+
+    python -m benchmarks.format_json_bench [--items 100 1000 5000 20000] [--json out.json]
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from apps.ui.components.formatting import _format_scalar, format_json
+
+
+def legacy_format_json(json_data: Any, indent: int = 0) -> str:
+    """The pre-streaming renderer, kept here as the baseline."""
+    if isinstance(json_data, dict):
+        formatted = "{\n"
+        for i, (key, value) in enumerate(json_data.items()):
+            formatted += "  " * (indent + 1) + f'<span class="json-key">"{key}"</span>: '
+            if isinstance(value, (dict, list)):
+                formatted += legacy_format_json(value, indent + 1)
+            else:
+                formatted += _format_scalar(value)
+            if i < len(json_data) - 1:
+                formatted += ","
+            formatted += "\n"
+        formatted += "  " * indent + "}"
+        return formatted
+    elif isinstance(json_data, list):
+        formatted = "[\n"
+        for i, item in enumerate(json_data):
+            formatted += "  " * (indent + 1)
+            if isinstance(item, (dict, list)):
+                formatted += legacy_format_json(item, indent + 1)
+            else:
+                formatted += _format_scalar(item)
+            if i < len(json_data) - 1:
+                formatted += ","
+            formatted += "\n"
+        formatted += "  " * indent + "]"
+        return formatted
+    return _format_scalar(json_data)
+
+
+def make_extract(line_items: int) -> Dict[str, Any]:
+    """A statement extract with ``line_items`` itemized charges."""
+    return {
+        "statement": {
+            "account_number": "44575679",
+            "amount_due": 1142.35,
+            "due_date": "2024-07-20",
+            "provider_name": "VERIZON, INC.",
+            "charges": [
+                {
+                    "line": i,
+                    "description": f"Usage charge <{i}> & fees",
+                    "amount": round(i * 0.37, 2),
+                    "taxable": i % 2 == 0,
+                    "notes": None,
+                }
+                for i in range(line_items)
+            ],
+        }
+    }
+
+
+def make_deep(depth: int) -> Dict[str, Any]:
+    """A pathologically nested extract (``depth`` levels of single-key dicts)."""
+    data: Dict[str, Any] = {"leaf": "value"}
+    for i in range(depth):
+        data = {f"level_{i}": data}
+    return data
+
+
+def _time(fn: Callable[[], Any], repeat: int) -> Optional[float]:
+    """Best wall time over ``repeat`` runs, or None if ``fn`` hits the recursion limit."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            fn()
+        except RecursionError:
+            return None
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(items: List[int], repeat: int = 3, depth: int = 5000) -> List[Dict[str, Any]]:
+    cases = [(f"{n} line items", make_extract(n)) for n in items]
+    cases.append((f"depth {depth}", make_deep(depth)))
+    results = []
+    for label, data in cases:
+        results.append(
+            {
+                "case": label,
+                "legacy_s": _time(lambda: legacy_format_json(data), repeat),
+                "streaming_unbounded_s": _time(
+                    lambda: format_json(data, max_nodes=10**9, max_bytes=10**12), repeat
+                ),
+                "streaming_default_budget_s": _time(lambda: format_json(data), repeat),
+                "output_bytes": len(format_json(data, max_nodes=10**9, max_bytes=10**12)),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--items", type=int, nargs="+", default=[100, 1000, 5000, 20000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--depth", type=int, default=5000)
+    parser.add_argument("--json", help="Also write the results to this JSON file.")
+    args = parser.parse_args()
+
+    results = run(args.items, args.repeat, args.depth)
+
+    def fmt(seconds: Optional[float]) -> str:
+        return "recursion" if seconds is None else f"{seconds:.4f}"
+
+    print(f"{'case':>18} {'legacy':>10} {'streaming':>10} {'budgeted':>10} {'bytes':>12}")
+    for r in results:
+        print(
+            f"{r['case']:>18} {fmt(r['legacy_s']):>10} "
+            f"{fmt(r['streaming_unbounded_s']):>10} "
+            f"{fmt(r['streaming_default_budget_s']):>10} {r['output_bytes']:>12}"
+        )
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
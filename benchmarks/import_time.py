@@ -0,0 +1,199 @@
+"""
+Per-module import-time report for the Streamlit app's cold start.
+
+Each target is imported in a fresh interpreter under ``python -X importtime``
+(``--repeat`` times; the median run is reported), so every number is a cold
+import. Modules the bare interpreter already loads at startup are excluded.
+For each target the report shows the total import time and the slowest
+modules by self and cumulative time.
+
+Targets are the app entry point, each page module, and the processor with the
+GroundX SDK loaded. Pages that should stay light fail the run if they import
+one of their forbidden modules (e.g. ``groundx`` from the Documentation page),
+and ``--budget TARGET=MS`` fails it when a target gets slower than ``MS``
+milliseconds, so CI can catch startup regressions::
+
+    python -m benchmarks.import_time [--repeat 3] [--top 15]
+        [--targets app docs] [--budget app=1500] [--json out.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# SDK / prompt machinery that only the processing pages may load.
+HEAVY_MODULES = ("groundx", "manager", "prompts")
+
+# name -> (code run in the fresh interpreter, top-level modules it must not import)
+TARGETS: Dict[str, Tuple[str, Sequence[str]]] = {
+    "app": ("import apps.ui.streamlit_app", HEAVY_MODULES),
+    "docs": ("import apps.ui.views.docs", HEAVY_MODULES),
+    "view_data": ("import apps.ui.views.view_data", HEAVY_MODULES),
+    "submissions": ("import apps.ui.views.submissions", HEAVY_MODULES),
+    "infra": ("import apps.ui.views.infra", HEAVY_MODULES),
+    "upload": ("import apps.ui.views.upload", HEAVY_MODULES),
+    "sdk": (
+        "from apps.ui.components.document_processor import load_sdk; load_sdk()",
+        (),
+    ),
+}
+
+# One parsed ``-X importtime`` line: (module, depth, self_us, cumulative_us).
+Entry = Tuple[str, int, int, int]
+
+
+def parse_importtime(stderr: str) -> List[Entry]:
+    """Parse ``-X importtime`` output into ``(module, depth, self_us, cumulative_us)``."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # the column header
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        depth = (len(name) - len(stripped) - 1) // 2
+        entries.append((stripped, depth, int(parts[0]), int(parts[1])))
+    return entries
+
+
+def _run(code: str) -> List[Entry]:
+    env = dict(os.environ, METRICS_PORT="0", PYTHONPATH=_REPO_ROOT)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=_REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        tail = proc.stderr.strip().splitlines()[-1:] or ["no output"]
+        raise RuntimeError(f"import failed: {tail[0]}")
+    return parse_importtime(proc.stderr)
+
+
+def _startup_modules() -> Set[str]:
+    return {name for name, _, _, _ in _run("pass")}
+
+
+def measure(
+    name: str,
+    code: str,
+    forbidden: Sequence[str],
+    baseline: Set[str],
+    repeat: int,
+    top: int,
+) -> Dict[str, Any]:
+    """Report for one target: total, slowest modules and forbidden imports."""
+    runs = []
+    for _ in range(max(repeat, 1)):
+        entries = [e for e in _run(code) if e[0] not in baseline]
+        total = sum(cumulative for _, depth, _, cumulative in entries if depth == 0)
+        runs.append((total, entries))
+    runs.sort(key=lambda r: r[0])
+    total, entries = runs[len(runs) // 2]
+
+    loaded = {module for module, _, _, _ in entries}
+    roots = {module.split(".")[0] for module in loaded}
+    by_self = sorted(entries, key=lambda e: e[2], reverse=True)[:top]
+    by_cumulative = sorted(entries, key=lambda e: e[3], reverse=True)[:top]
+    return {
+        "target": name,
+        "code": code,
+        "total_ms": round(total / 1000, 2),
+        "runs_ms": [round(r[0] / 1000, 2) for r in runs],
+        "modules": len(loaded),
+        "forbidden_imported": sorted(set(forbidden) & roots),
+        "slowest_self": [{"module": m, "ms": round(s / 1000, 2)} for m, _, s, _ in by_self],
+        "slowest_cumulative": [
+            {"module": m, "ms": round(c / 1000, 2)} for m, _, _, c in by_cumulative
+        ],
+    }
+
+
+def _parse_budgets(values: Optional[Sequence[str]]) -> Dict[str, float]:
+    budgets = {}
+    for value in values or []:
+        name, _, ms = value.partition("=")
+        if name not in TARGETS or not ms:
+            raise SystemExit(f"--budget expects TARGET=MS with TARGET in {sorted(TARGETS)}")
+        budgets[name] = float(ms)
+    return budgets
+
+
+def _print_report(report: Dict[str, Any], budget: Optional[float]) -> None:
+    limit = f" (budget {budget:.0f} ms)" if budget is not None else ""
+    print(
+        f"\n== {report['target']}: {report['total_ms']:.1f} ms, "
+        f"{report['modules']} modules{limit}"
+    )
+    print(f"   {'self ms':>9}  module")
+    for row in report["slowest_self"]:
+        print(f"   {row['ms']:>9.2f}  {row['module']}")
+    print(f"   {'cum ms':>9}  module")
+    for row in report["slowest_cumulative"]:
+        print(f"   {row['ms']:>9.2f}  {row['module']}")
+    if report["forbidden_imported"]:
+        print("   FORBIDDEN: imports " + ", ".join(report["forbidden_imported"]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--targets", nargs="+", choices=list(TARGETS), default=list(TARGETS))
+    parser.add_argument("--repeat", type=int, default=3, help="runs per target (median is kept)")
+    parser.add_argument("--top", type=int, default=10, help="modules listed per target")
+    parser.add_argument("--budget", action="append", metavar="TARGET=MS")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    budgets = _parse_budgets(args.budget)
+    baseline = _startup_modules()
+    reports = []
+    failures = []
+    for name in args.targets:
+        code, forbidden = TARGETS[name]
+        try:
+            reports.append(measure(name, code, forbidden, baseline, args.repeat, args.top))
+        except RuntimeError as exc:
+            print(f"\n== {name}: {exc}")
+            failures.append(f"{name}: {exc}")
+
+    for report in reports:
+        budget = budgets.get(report["target"])
+        _print_report(report, budget)
+        if report["forbidden_imported"]:
+            failures.append(
+                f"{report['target']} imports {', '.join(report['forbidden_imported'])}"
+            )
+        if budget is not None and report["total_ms"] > budget:
+            failures.append(f"{report['target']} took {report['total_ms']:.1f} ms > {budget:.0f} ms")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "benchmark": "import_time",
+                    "python": platform.python_version(),
+                    "repeat": args.repeat,
+                    "budgets_ms": budgets,
+                    "failures": failures,
+                    "results": reports,
+                },
+                f,
+                indent=2,
+            )
+
+    if failures:
+        print("\nFAILED: " + "; ".join(failures))
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
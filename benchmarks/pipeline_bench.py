@@ -0,0 +1,330 @@
+"""
+End-to-end benchmark of the extraction pipeline against a local GroundX stand-in.
+
+Starts :class:`~benchmarks.fake_groundx.FakeGroundX` in-process, points the real
+GroundX SDK at it, and drives ``N`` synthetic documents through each pipeline
+variant:
+
+* ``process`` — :meth:`DocumentProcessor.process` on a thread pool of
+  ``--concurrency`` workers (what the background job queue does)
+* ``process_many`` — :meth:`DocumentProcessor.process_many` (shared ingest
+  requests)
+* ``async`` — :meth:`AsyncDocumentProcessor.process` gathered under its
+  ``concurrency`` limit
+
+Each mode starts cold (empty bucket cache, workflow registry, extraction
+cache and prompt render cache), so API calls per document include the
+one-time bucket/workflow setup amortized over the run. Reports per-stage
+p50/p95/p99 latency, API calls per document, throughput, how many requests
+reused a pooled HTTP connection and how many prompt renders were served from
+the render cache; ``--json`` writes the same numbers for comparing releases.
+
+Usage::
+
+    python -m benchmarks.pipeline_bench [--documents 20] [--concurrency 8]
+        [--modes process process_many async] [--processing-time 2]
+        [--latency status=0.02] [--failure-rate extract=0.05] [--json out.json]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from benchmarks.fake_groundx import FakeGroundX, add_config_arguments, config_from_args
+
+MODES = ("process", "process_many", "async")
+
+# Pipeline stages in the order DocumentProcessor enters them.
+STAGES = ("bucket", "workflow", "ingest", "processing", "download")
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 when empty)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[min(len(ordered), max(rank, 1)) - 1]
+
+
+def latency_summary(values: Sequence[float]) -> Dict[str, float]:
+    return {
+        "count": len(values),
+        "p50_s": round(percentile(values, 50), 4),
+        "p95_s": round(percentile(values, 95), 4),
+        "p99_s": round(percentile(values, 99), 4),
+        "max_s": round(max(values), 4) if values else 0.0,
+    }
+
+
+class StageTimer:
+    """``on_stage`` callback recording how long a document spent in each stage."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self._current: Optional[str] = None
+        self._entered = self.started
+        self.durations: Dict[str, float] = {}
+
+    def __call__(self, stage: str) -> None:
+        self._close(time.perf_counter())
+        self._current = stage
+
+    def _close(self, now: float) -> None:
+        if self._current is not None:
+            self.durations[self._current] = now - self._entered
+        self._entered = now
+
+    def finish(self) -> float:
+        now = time.perf_counter()
+        self._close(now)
+        self._current = None
+        return now - self.started
+
+
+def make_documents(directory: str, count: int, size: int) -> List[Any]:
+    """Write ``count`` distinct synthetic PDFs and wrap them as uploads."""
+    from apps.ui.components.sample_documents import SampleDocument
+
+    documents = []
+    for i in range(count):
+        path = os.path.join(directory, f"bench-{i:05d}.pdf")
+        with open(path, "wb") as f:
+            f.write(b"%PDF-1.4\n" + os.urandom(max(0, size - 9)))
+        documents.append(SampleDocument(path))
+    return documents
+
+
+def _processor(cls: type, state_dir: str, **kwargs: Any) -> Any:
+    """A processor with its own (empty) registry and extraction cache."""
+    from apps.ui.components.bucket_cache import BUCKET_CACHE
+    from apps.ui.components.extraction_cache import ExtractionCache
+    from apps.ui.components.workflow_registry import WorkflowRegistry
+
+    BUCKET_CACHE.clear()
+    processor = cls(
+        workflow_registry=WorkflowRegistry(os.path.join(state_dir, "workflows.json")),
+        extraction_cache=ExtractionCache(os.path.join(state_dir, "extract-cache")),
+        **kwargs,
+    )
+    if not processor.is_ready:
+        raise SystemExit(f"Processor not ready: {processor.init_error}")
+    return processor
+
+
+def _run_one(processor: Any, document: Any) -> Dict[str, Any]:
+    timer = StageTimer()
+    try:
+        record = processor.process(document, on_stage=timer, use_cache=False)
+        error = None
+    except Exception as exc:
+        record, error = None, str(exc)
+    total = timer.finish()
+    return {"stages": timer.durations, "total": total, "error": error, "record": record}
+
+
+def run_process(documents: List[Any], concurrency: int, state_dir: str) -> List[Dict[str, Any]]:
+    from apps.ui.components.document_processor import DocumentProcessor
+
+    processor = _processor(DocumentProcessor, state_dir)
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        return list(pool.map(lambda d: _run_one(processor, d), documents))
+
+
+def run_process_many(documents: List[Any], concurrency: int, state_dir: str) -> List[Dict[str, Any]]:
+    from apps.ui.components.document_processor import DocumentProcessor
+
+    processor = _processor(DocumentProcessor, state_dir)
+    started = time.perf_counter()
+    records = processor.process_many(documents)
+    total = time.perf_counter() - started
+    # process_many has no per-document stage callbacks; every file shares the wall time.
+    return [
+        {"stages": {}, "total": total, "error": r.get("error"), "record": r}
+        for r in records
+    ]
+
+
+def run_async(documents: List[Any], concurrency: int, state_dir: str) -> List[Dict[str, Any]]:
+    from apps.ui.components.async_document_processor import AsyncDocumentProcessor
+
+    processor = _processor(AsyncDocumentProcessor, state_dir, concurrency=concurrency)
+
+    async def one(document: Any) -> Dict[str, Any]:
+        timer = StageTimer()
+        try:
+            record = await processor.process(document, on_stage=timer, use_cache=False)
+            error = None
+        except Exception as exc:
+            record, error = None, str(exc)
+        total = timer.finish()
+        return {"stages": timer.durations, "total": total, "error": error, "record": record}
+
+    async def main() -> List[Dict[str, Any]]:
+        async with processor:
+            return list(await asyncio.gather(*(one(d) for d in documents)))
+
+    return asyncio.run(main())
+
+
+RUNNERS: Dict[str, Callable[[List[Any], int, str], List[Dict[str, Any]]]] = {
+    "process": run_process,
+    "process_many": run_process_many,
+    "async": run_async,
+}
+
+
+def summarize(
+    mode: str,
+    results: List[Dict[str, Any]],
+    wall: float,
+    calls: Dict[str, int],
+    http: Optional[Dict[str, Any]] = None,
+    renders: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Aggregate one mode's per-document results."""
+    ok = [r for r in results if r["error"] is None]
+    total_calls = sum(calls.values())
+    stages = {
+        stage: latency_summary([r["stages"][stage] for r in ok if stage in r["stages"]])
+        for stage in STAGES
+    }
+    return {
+        "mode": mode,
+        "documents": len(results),
+        "succeeded": len(ok),
+        "failed": len(results) - len(ok),
+        "errors": sorted({r["error"] for r in results if r["error"]})[:5],
+        "wall_s": round(wall, 4),
+        "throughput_docs_per_s": round(len(ok) / wall, 4) if wall else 0.0,
+        "latency": latency_summary([r["total"] for r in ok]),
+        "stages": {k: v for k, v in stages.items() if v["count"]},
+        "api_calls": calls,
+        "api_calls_total": total_calls,
+        "api_calls_per_document": round(total_calls / len(results), 3) if results else 0.0,
+        "http": http or {},
+        "prompt_renders": renders or {},
+    }
+
+
+def _http_delta(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    """Shared-pool request/connection counts for one mode."""
+    requests = after["requests"] - before["requests"]
+    opened = after["connections_opened"] - before["connections_opened"]
+    reused = max(requests - opened, 0)
+    return {
+        "requests": requests,
+        "connections_opened": opened,
+        "reused": reused,
+        "reuse_ratio": round(reused / requests, 4) if requests else 0.0,
+    }
+
+
+def run(
+    modes: Sequence[str],
+    documents: int,
+    concurrency: int,
+    doc_size: int,
+    fake: FakeGroundX,
+) -> List[Dict[str, Any]]:
+    os.environ["GROUNDX_API_KEY"] = os.environ.get("GROUNDX_BENCH_API_KEY", "bench")
+    os.environ["GROUNDX_BASE_URL"] = fake.base_url
+    os.environ["GROUNDX_UPLOAD_API"] = fake.upload_api
+
+    from apps.ui.components.http_pool import pool_stats
+    from manager import clear_render_cache, render_cache_stats
+
+    work_dir = tempfile.mkdtemp(prefix="pipeline-bench-")
+    try:
+        docs = make_documents(work_dir, documents, doc_size)
+        reports = []
+        for mode in modes:
+            state_dir = tempfile.mkdtemp(prefix=f"{mode}-", dir=work_dir)
+            fake.reset_counts()
+            clear_render_cache()
+            http_before = pool_stats()
+            started = time.perf_counter()
+            results = RUNNERS[mode](docs, concurrency, state_dir)
+            wall = time.perf_counter() - started
+            http = _http_delta(http_before, pool_stats())
+            renders = render_cache_stats()
+            reports.append(summarize(mode, results, wall, fake.counts(), http, renders))
+        return reports
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def _print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"\n== {report['mode']}: {report['succeeded']}/{report['documents']} ok in "
+        f"{report['wall_s']:.2f}s ({report['throughput_docs_per_s']:.2f} docs/s, "
+        f"{report['api_calls_per_document']:.2f} API calls/doc)"
+    )
+    print(f"{'stage':>12} {'p50':>8} {'p95':>8} {'p99':>8}")
+    rows = list(report["stages"].items()) + [("total", report["latency"])]
+    for stage, s in rows:
+        print(f"{stage:>12} {s['p50_s']:>8.3f} {s['p95_s']:>8.3f} {s['p99_s']:>8.3f}")
+    print("   api calls: " + ", ".join(f"{k}={v}" for k, v in report["api_calls"].items()))
+    http = report["http"]
+    if http:
+        print(
+            f"        http: {http['requests']} requests over {http['connections_opened']} "
+            f"connections ({http['reuse_ratio']:.0%} reused)"
+        )
+    renders = report["prompt_renders"]
+    if renders:
+        print(f"     prompts: {renders['misses']} renders, {renders['hits']} cache hits")
+    for error in report["errors"]:
+        print(f"   error: {error}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--documents", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--doc-size", type=int, default=64 * 1024, help="bytes per document")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--json", help="write results to this file")
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    config = config_from_args(args)
+    with FakeGroundX(config) as fake:
+        reports = run(args.modes, args.documents, args.concurrency, args.doc_size, fake)
+
+    for report in reports:
+        _print_report(report)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "benchmark": "pipeline",
+                    "python": platform.python_version(),
+                    "documents": args.documents,
+                    "concurrency": args.concurrency,
+                    "doc_size": args.doc_size,
+                    "fake": {
+                        "latency": config.latency,
+                        "failure_rate": config.failure_rate,
+                        "queue_time": config.queue_time,
+                        "processing_time": config.processing_time,
+                        "document_failure_rate": config.document_failure_rate,
+                    },
+                    "results": reports,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,8 @@
+import collections
+import copy
+import hashlib
+import json
+import threading
 import typing
 
 from groundx import (
@@ -18,11 +23,74 @@ from prompts.qa_statement import prompt_statement_qa
 from prompts.reconcile_statement import prompt_statement_reconcile
 
 
+# Rendered prompts, step configs and extract dicts, shared by every manager in
+# the process and keyed by (kind, file_name, workflow_id, schema hash), so
+# workers rendering the same schema concurrently render it once. The schema
+# hash is recomputed only when the schema file's version changes.
+RENDER_CACHE_SIZE = 64
+
+_RENDERED: "collections.OrderedDict[tuple, typing.Any]" = collections.OrderedDict()
+_RENDER_LOCKS: typing.Dict[tuple, threading.Lock] = {}
+_RENDER_LOCK = threading.Lock()
+_RENDER_STATS = {"hits": 0, "misses": 0}
+
+
+def render_cache_stats() -> typing.Dict[str, int]:
+    with _RENDER_LOCK:
+        return dict(_RENDER_STATS, entries=len(_RENDERED))
+
+
+def clear_render_cache() -> None:
+    with _RENDER_LOCK:
+        _RENDERED.clear()
+        _RENDER_LOCKS.clear()
+        _RENDER_STATS.update(hits=0, misses=0)
+
+
+def _memoized(key: tuple, render: typing.Callable[[], typing.Any]) -> typing.Any:
+    with _RENDER_LOCK:
+        if key in _RENDERED:
+            _RENDERED.move_to_end(key)
+            _RENDER_STATS["hits"] += 1
+            return _RENDERED[key]
+        key_lock = _RENDER_LOCKS.setdefault(key, threading.Lock())
+
+    # Single flight: concurrent callers for the same key wait for one render.
+    # The per-key lock only lives while a render is in flight, so both the
+    # rendered values and the locks stay bounded by RENDER_CACHE_SIZE.
+    try:
+        with key_lock:
+            with _RENDER_LOCK:
+                if key in _RENDERED:
+                    _RENDER_STATS["hits"] += 1
+                    return _RENDERED[key]
+            value = render()
+            with _RENDER_LOCK:
+                _RENDER_STATS["misses"] += 1
+                _RENDERED[key] = value
+                while len(_RENDERED) > RENDER_CACHE_SIZE:
+                    _RENDERED.popitem(last=False)
+            return value
+    finally:
+        with _RENDER_LOCK:
+            if _RENDER_LOCKS.get(key) is key_lock:
+                del _RENDER_LOCKS[key]
+
+
 class ExtractPromptManager(PromptManager):
     def __init__(
         self,
         **data: typing.Any,
     ) -> None:
+        # Processors, and so their managers, are shared across threads, but the
+        # SDK reloads a schema by replacing several dicts one after another.
+        # Loads, renders and the schema-hash memo all run under this lock; it
+        # is reentrant because renders nest (workflow_steps renders the
+        # statement prompt, which renders the field prompts).
+        self._state_lock = threading.RLock()
+        # workflow_id -> (schema version the hash was computed from, sha256)
+        self._schema_hashes: typing.Dict[str, typing.Tuple[str, str]] = {}
+        self._schema_sources = (data.get("config_source"), data.get("cache_source"))
         super().__init__(**data)
 
         if not self.is_init:
@@ -30,6 +98,106 @@ class ExtractPromptManager(PromptManager):
                 f"[{self.default_workflow_id}] [{self.default_file_name}.yaml] is not init"
             )
 
+    def schema_version(
+        self,
+        file_name: typing.Optional[str] = None,
+        workflow_id: typing.Optional[str] = None,
+    ) -> typing.Optional[str]:
+        """The schema version the SDK reloads on: config source first, then cache."""
+        config_source, cache_source = self._schema_sources
+        for source, name in (
+            (config_source, self.workflow_id(workflow_id)),
+            (cache_source, self.file_name(file_name)),
+        ):
+            if source is None:
+                continue
+            try:
+                version = source.peek(name)
+            except Exception:
+                continue
+            if version:
+                return version
+        return None
+
+    def schema_hash(
+        self,
+        file_name: typing.Optional[str] = None,
+        workflow_id: typing.Optional[str] = None,
+    ) -> str:
+        workflow_id = self.workflow_id(workflow_id)
+        version = self.schema_version(file_name=file_name, workflow_id=workflow_id)
+        with self._state_lock:
+            cached = self._schema_hashes.get(workflow_id)
+            if version and cached is not None and cached[0] == version:
+                return cached[1]
+
+            # Reloads the schema if it changed; a version peeked before an edit
+            # only ever makes the next call recompute.
+            groups = self.get_fields_for_workflow(file_name=file_name, workflow_id=workflow_id)
+            payload = json.dumps(
+                {k: v.model_dump(mode="json") for k, v in groups.items()},
+                sort_keys=True,
+                default=str,
+            )
+            digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+            if version:
+                self._schema_hashes[workflow_id] = (version, digest)
+            return digest
+
+    def cache_workflow(self, file_name: str, workflow_id: str) -> None:
+        with self._state_lock:
+            super().cache_workflow(file_name, workflow_id)
+
+    def reload_if_changed(self, workflow_id: typing.Optional[str] = None) -> None:
+        with self._state_lock:
+            super().reload_if_changed(workflow_id)
+
+    def _render(
+        self,
+        kind: str,
+        file_name: typing.Optional[str],
+        workflow_id: typing.Optional[str],
+        render: typing.Callable[[], typing.Any],
+    ) -> typing.Any:
+        # Taken before any per-key render lock, so lock order is always
+        # manager, then render keys from the outermost render inwards.
+        with self._state_lock:
+            key = (
+                kind,
+                self.file_name(file_name),
+                self.workflow_id(workflow_id),
+                self.schema_hash(file_name=file_name, workflow_id=workflow_id),
+            )
+            return _memoized(key, render)
+
+    def statement_field_prompts(
+        self,
+        file_name: typing.Optional[str] = None,
+        workflow_id: typing.Optional[str] = None,
+    ) -> str:
+        return self._render(
+            "statement_field_prompts",
+            file_name,
+            workflow_id,
+            lambda: self.group_field_prompts(
+                "statement", file_name=file_name, workflow_id=workflow_id
+            ),
+        )
+
+    def statement_descriptions(
+        self,
+        file_name: typing.Optional[str] = None,
+        workflow_id: typing.Optional[str] = None,
+    ) -> str:
+        return self._render(
+            "statement_descriptions",
+            file_name,
+            workflow_id,
+            lambda: self.group_descriptions(
+                "statement", file_name=file_name, workflow_id=workflow_id
+            ),
+        )
+
     def init_prompts(
         self,
         file_name: typing.Optional[str] = None,
@@ -52,6 +220,18 @@ class ExtractPromptManager(PromptManager):
         self,
         file_name: typing.Optional[str] = None,
         workflow_id: typing.Optional[str] = None,
+    ) -> WorkflowStepConfig:
+        return self._render(
+            "prompt_statement_extract",
+            file_name,
+            workflow_id,
+            lambda: self._prompt_statement_extract(file_name, workflow_id),
+        ).model_copy(deep=True)
+
+    def _prompt_statement_extract(
+        self,
+        file_name: typing.Optional[str],
+        workflow_id: typing.Optional[str],
     ) -> WorkflowStepConfig:
         return WorkflowStepConfig(
             field="sect-sum",
@@ -61,16 +241,16 @@ class ExtractPromptManager(PromptManager):
             prompt=WorkflowPromptGroup(
                 request=WorkflowPrompt(
                     prompt=prompt_statement_extract_request(
-                        self.group_field_prompts(
-                            "statement", file_name=file_name, workflow_id=workflow_id
+                        self.statement_field_prompts(
+                            file_name=file_name, workflow_id=workflow_id
                         ),
                     ),
                     role="assistant",
                 ),
                 task=WorkflowPrompt(
                     prompt=prompt_statement_extract_task(
-                        self.group_descriptions(
-                            "statement", file_name=file_name, workflow_id=workflow_id
+                        self.statement_descriptions(
+                            file_name=file_name, workflow_id=workflow_id
                         ),
                     ),
                     role="developer",
@@ -100,9 +280,7 @@ class ExtractPromptManager(PromptManager):
         return prompt_statement_qa(
             statement_fields,
             statement_field_keys,
-            self.group_field_prompts(
-                "statement", file_name=file_name, workflow_id=workflow_id
-            ),
+            self.statement_field_prompts(file_name=file_name, workflow_id=workflow_id),
         )
 
     def update_prompts(
@@ -126,6 +304,18 @@ class ExtractPromptManager(PromptManager):
         self,
         file_name: typing.Optional[str] = None,
         workflow_id: typing.Optional[str] = None,
+    ) -> WorkflowSteps:
+        return self._render(
+            "workflow_steps",
+            file_name,
+            workflow_id,
+            lambda: self._workflow_steps(file_name, workflow_id),
+        ).model_copy(deep=True)
+
+    def _workflow_steps(
+        self,
+        file_name: typing.Optional[str],
+        workflow_id: typing.Optional[str],
     ) -> WorkflowSteps:
         statement_step = self.prompt_statement_extract(
             file_name=file_name, workflow_id=workflow_id
@@ -144,3 +334,19 @@ class ExtractPromptManager(PromptManager):
             sect_instruct=None,
             sect_summary=None,
         )
+
+    def workflow_extract_dict(
+        self,
+        file_name: typing.Optional[str] = None,
+        workflow_id: typing.Optional[str] = None,
+    ) -> typing.Dict[str, typing.Dict[str, typing.Any]]:
+        return copy.deepcopy(
+            self._render(
+                "workflow_extract_dict",
+                file_name,
+                workflow_id,
+                lambda: super(ExtractPromptManager, self).workflow_extract_dict(
+                    file_name=file_name, workflow_id=workflow_id
+                ),
+            )
+        )
@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from benchmarks.fake_groundx import FakeConfig, FakeGroundX
+
+
+@pytest.fixture(scope="session")
+def fake_groundx():
+    """Local GroundX stand-in with near-instant document processing."""
+    with FakeGroundX(FakeConfig(queue_time=0.05, processing_time=0.05, seed=1)) as fake:
+        yield fake
+
+
+@pytest.fixture
+def groundx_env(fake_groundx, monkeypatch):
+    """Point processors built in the test at the fake service."""
+    monkeypatch.setenv("GROUNDX_API_KEY", "test")
+    monkeypatch.setenv("GROUNDX_BASE_URL", fake_groundx.base_url)
+    monkeypatch.setenv("GROUNDX_UPLOAD_API", fake_groundx.upload_api)
+    fake_groundx.reset_counts()
+    return fake_groundx
+
+
+@pytest.fixture
+def make_processor(groundx_env, tmp_path):
+    """Build a processor with its own workflow registry and extraction cache."""
+    from apps.ui.components.bucket_cache import BUCKET_CACHE
+    from apps.ui.components.extraction_cache import ExtractionCache
+    from apps.ui.components.workflow_registry import WorkflowRegistry
+
+    def make(cls=None, **kwargs):
+        if cls is None:
+            from apps.ui.components.document_processor import DocumentProcessor as cls
+        BUCKET_CACHE.clear()
+        processor = cls(
+            workflow_registry=WorkflowRegistry(str(tmp_path / "workflows.json")),
+            extraction_cache=ExtractionCache(str(tmp_path / "extract-cache")),
+            **kwargs,
+        )
+        assert processor.is_ready, processor.init_error
+        return processor
+
+    return make
+
+
+@pytest.fixture
+def make_documents(tmp_path):
+    """Write distinct small PDF-named files and wrap them as uploads."""
+    from apps.ui.components.sample_documents import SampleDocument
+
+    def make(count, prefix="doc"):
+        docs = []
+        for i in range(count):
+            path = tmp_path / f"{prefix}-{i}.pdf"
+            path.write_bytes(b"%PDF-1.4\n" + os.urandom(256))
+            docs.append(SampleDocument(str(path)))
+        return docs
+
+    return make
@@ -0,0 +1,74 @@
+import asyncio
+
+
+async def _closing(processor, coro):
+    async with processor:
+        return await coro
+
+from apps.ui.components.async_document_processor import AsyncDocumentProcessor
+from apps.ui.components.document_processor import DocumentProcessor
+
+
+def test_wraps_rather_than_subclasses(make_processor):
+    processor = make_processor(AsyncDocumentProcessor, concurrency=2)
+    assert not isinstance(processor, DocumentProcessor)
+    assert isinstance(processor.processor, DocumentProcessor)
+    # The wrapped processor's synchronous API still returns plain values.
+    assert isinstance(processor.processor.ensure_bucket(), int)
+
+
+def test_process_all_across_event_loops(make_processor, make_documents, groundx_env):
+    processor = make_processor(AsyncDocumentProcessor, concurrency=2)
+
+    async def run(documents):
+        async with processor:
+            return await processor.process_all(documents)
+
+    first = asyncio.run(run(make_documents(3, "a")))
+    second = asyncio.run(run(make_documents(2, "b")))
+
+    assert [r["filename"] for r in first] == ["a-0.pdf", "a-1.pdf", "a-2.pdf"]
+    assert [r.get("error") for r in first + second] == [None] * 5
+    assert all(r.get("document_id") for r in first + second)
+    assert groundx_env.counts().get("workflow_create") == 1
+
+
+def test_cached_replay(make_processor, make_documents, groundx_env):
+    processor = make_processor(AsyncDocumentProcessor)
+    (document,) = make_documents(1)
+    asyncio.run(_closing(processor, processor.process(document)))
+    groundx_env.reset_counts()
+    job = asyncio.run(_closing(processor, processor.process(document)))
+    assert job["cache_hit"] is True
+    assert not groundx_env.counts().get("ingest")
+
+
+class _UnreadableUpload:
+    name = "unreadable.pdf"
+    size = 10
+
+    def getvalue(self):
+        raise OSError("upload vanished")
+
+
+def test_failure_becomes_error_record(make_processor, make_documents):
+    processor = make_processor(AsyncDocumentProcessor)
+    uploads = make_documents(1) + [_UnreadableUpload()]
+    records = asyncio.run(_closing(processor, processor.process_all(uploads)))
+    assert records[0].get("document_id")
+    assert records[1]["status"] == "error"
+
+
+def test_aclose_closes_the_loops_client(make_processor, groundx_env):
+    processor = make_processor(AsyncDocumentProcessor)
+
+    async def run():
+        await processor.ensure_bucket()
+        state = processor._loop_state()
+        await processor.aclose()
+        assert state.http.is_closed
+        assert processor._loop_state() is not state
+        await processor.aclose()
+
+    asyncio.run(run())
+    assert len(processor._loops) == 0
@@ -0,0 +1,107 @@
+import io
+import json
+
+import pytest
+
+from apps import batch
+from apps.batch import BatchRunner, Checkpoint, discover
+from apps.ui.components.submission_store import SubmissionStore
+
+
+class _Processor:
+    def __init__(self, fail_on=()):
+        self.fail_on = set(fail_on)
+        self.processed = []
+
+    def process(self, document, on_stage=None, on_ingest=None, **kwargs):
+        if document.name in self.fail_on:
+            raise RuntimeError(f"cannot extract {document.name}")
+        on_ingest({"process_id": f"p-{document.name}", "bucket_id": 1, "workflow_id": "w"})
+        self.processed.append(document.name)
+        return {"document_id": f"d-{document.name}", "timings": {"total": 0.01}}
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    directory = tmp_path / "in"
+    directory.mkdir()
+    for name in ("a.pdf", "b.pdf", "c.pdf", "notes.txt"):
+        (directory / name).write_bytes(b"%PDF-1.4 " + name.encode())
+    return str(directory)
+
+
+def _runner(tmp_path, processor, monkeypatch, **kwargs):
+    monkeypatch.setattr(batch, "get_processor", lambda name, prompts_dir: processor)
+    output = io.StringIO()
+    runner = BatchRunner(
+        "simple",
+        SubmissionStore(base_dir=str(tmp_path / "subs")),
+        Checkpoint(str(tmp_path / "results.checkpoint")),
+        output,
+        concurrency=2,
+        **kwargs,
+    )
+    return runner, output
+
+
+def _results(output):
+    records = map(json.loads, output.getvalue().splitlines())
+    return {r["source_path"].rsplit("/", 1)[-1]: r for r in records}
+
+
+def test_discover_filters_document_types(inputs):
+    assert [p.rsplit("/", 1)[-1] for p in discover(inputs)] == ["a.pdf", "b.pdf", "c.pdf"]
+
+
+def test_one_failure_does_not_abort_the_batch(tmp_path, inputs, monkeypatch):
+    runner, output = _runner(tmp_path, _Processor(fail_on={"b.pdf"}), monkeypatch)
+    counts = runner.run(discover(inputs))
+    assert counts["complete"] == 2 and counts["error"] == 1
+
+    results = _results(output)
+    assert results["b.pdf"]["status"] == "error"
+    assert "cannot extract" in results["b.pdf"]["error"]
+    stored = runner.store.get(results["b.pdf"]["id"])
+    assert stored["status"] == "error"
+
+
+def test_classifier_failure_is_recorded_per_document(tmp_path, inputs, monkeypatch):
+    def classify(document, fallback, prompts_dir):
+        if document.name == "a.pdf":
+            raise ValueError("unreadable first page")
+        from apps.ui.components.schema_classifier import Classification
+
+        return Classification(fallback, 0.0, True, "low confidence", 0.001)
+
+    monkeypatch.setattr(batch, "classify", classify)
+    runner, output = _runner(tmp_path, _Processor(), monkeypatch, auto_schema=True)
+    counts = runner.run(discover(inputs))
+    assert counts["complete"] == 2 and counts["error"] == 1
+    results = _results(output)
+    assert results["a.pdf"]["error"] == "unreadable first page"
+    assert runner.store.get(results["a.pdf"]["id"])["status"] == "error"
+    assert results["c.pdf"]["classification"]["reason"] == "low confidence"
+
+
+def test_store_failure_still_reports_the_document(tmp_path, inputs, monkeypatch):
+    runner, output = _runner(tmp_path, _Processor(), monkeypatch)
+
+    def broken_record(record):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(runner.store, "record", broken_record)
+    counts = runner.run(discover(inputs))
+    assert counts["error"] == 3
+    assert all(r["error"] == "disk full" for r in _results(output).values())
+
+
+def test_rerun_skips_finished_documents(tmp_path, inputs, monkeypatch):
+    runner, _ = _runner(tmp_path, _Processor(fail_on={"b.pdf"}), monkeypatch)
+    runner.run(discover(inputs))
+    runner.checkpoint.close()
+
+    processor = _Processor()
+    again, _ = _runner(tmp_path, processor, monkeypatch, retry_errors=True)
+    counts = again.run(discover(inputs))
+    assert counts["skipped"] == 2
+    assert processor.processed == ["b.pdf"]
@@ -0,0 +1,40 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from apps.ui.components.bucket_cache import BucketCache
+
+
+def test_concurrent_misses_resolve_once():
+    cache = BucketCache(ttl=60)
+    calls = []
+    gate = threading.Event()
+
+    def resolve():
+        calls.append(1)
+        gate.wait(1)
+        return 7
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        futures = [pool.submit(cache.get_or_resolve, ("http://gx", "b"), resolve) for _ in range(6)]
+        gate.set()
+        assert {f.result() for f in futures} == {7}
+    assert len(calls) == 1
+
+
+def test_expired_and_invalidated_entries_resolve_again():
+    cache = BucketCache(ttl=0)
+    cache.put(("u", "b"), 1)
+    assert cache.peek(("u", "b")) is None
+
+    cache = BucketCache(ttl=60)
+    cache.put(("u", "b"), 1)
+    assert cache.get_or_resolve(("u", "b"), lambda: 2) == 1
+    cache.invalidate(("u", "b"))
+    assert cache.get_or_resolve(("u", "b"), lambda: 2) == 2
+
+
+def test_processor_lists_buckets_once(make_processor, groundx_env):
+    processor = make_processor()
+    first = processor.ensure_bucket()
+    assert processor.ensure_bucket() == first
+    assert groundx_env.counts().get("bucket_list") == 1
@@ -0,0 +1,39 @@
+from apps.ui.components.document_processor import DocumentProcessor
+
+
+class _UnreadableUpload:
+    name = "unreadable.pdf"
+    size = 10
+
+    def getvalue(self):
+        raise OSError("upload vanished")
+
+
+def test_process_returns_job_with_timings(make_processor, make_documents):
+    (document,) = make_documents(1)
+    job = make_processor().process(document, use_cache=False)
+    assert job["document_id"]
+    assert job["quality"]["has_values"]
+    assert {"bucket", "workflow", "ingest", "processing", "download", "total"} <= set(
+        job["timings"]
+    )
+
+
+def test_process_many_returns_one_record_per_input_in_order(make_processor, make_documents):
+    documents = make_documents(3)
+    inputs = [documents[0], _UnreadableUpload(), documents[1], documents[2]]
+    jobs = make_processor().process_many(inputs)
+
+    assert len(jobs) == len(inputs)
+    assert [j["filename"] for j in jobs] == [d.name for d in inputs]
+    assert jobs[1]["status"] == "error"
+    assert all(j.get("document_id") for i, j in enumerate(jobs) if i != 1)
+
+
+def test_process_many_reports_unlisted_documents(make_processor, make_documents, monkeypatch):
+    monkeypatch.setattr(DocumentProcessor, "_finished_documents", staticmethod(lambda res: []))
+    documents = make_documents(2)
+    jobs = make_processor().process_many(documents, timeout=5)
+    assert [j["status"] for j in jobs] == ["error", "error"]
+    assert [j["filename"] for j in jobs] == [d.name for d in documents]
+
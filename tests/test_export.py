@@ -0,0 +1,72 @@
+import csv
+import io
+import json
+
+import pytest
+
+from apps.ui.components.export import (
+    META_COLUMNS,
+    Exporter,
+    ExportError,
+    date_bounds,
+    flatten,
+    schema_columns,
+)
+from apps.ui.components.submission_store import SubmissionStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SubmissionStore(base_dir=str(tmp_path / "subs"))
+    store.record(
+        {
+            "status": "complete",
+            "filename": "a.pdf",
+            "yaml_file": "simple.yaml",
+            "extracted_data": {"statement": {"account_number": "A-1", "amount_due": 12}},
+        }
+    )
+    store.record({"status": "error", "filename": "b.pdf", "yaml_file": "simple.yaml"})
+    return store
+
+
+def test_schema_columns_follow_schema_order():
+    schema = {
+        "statement": {
+            "fields": {
+                "account": {"prompt": {}},
+                "charges": {"fields": {"total": {"prompt": {}}}},
+            }
+        }
+    }
+    assert schema_columns(schema) == ["account", "charges.total"]
+
+
+def test_flatten_reads_extract_under_statement():
+    record = {"id": "1", "extracted_data": {"statement": {"charges": [1, 2]}}}
+    row = flatten(record, ["charges", "missing"])
+    assert list(row)[: len(META_COLUMNS)] == list(META_COLUMNS)
+    assert row["charges"] == "[1, 2]"
+    assert row["missing"] is None
+
+
+def test_jsonl_and_csv_exports_filter_by_status(store):
+    out = io.StringIO()
+    assert Exporter(store=store, status="complete").write("jsonl", out) == 1
+    (line,) = out.getvalue().splitlines()
+    assert json.loads(line)["filename"] == "a.pdf"
+
+    out = io.StringIO()
+    assert Exporter(store=store).write("csv", out) == 2
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    by_name = {r["filename"]: r for r in rows}
+    assert by_name["a.pdf"]["account_number"] == "A-1"
+    assert by_name["a.pdf"]["amount_due"] == "12"
+
+
+def test_bad_inputs_raise_export_error(store):
+    with pytest.raises(ExportError):
+        date_bounds("not-a-date", None)
+    with pytest.raises(ExportError):
+        Exporter(store=store).write("xml", io.StringIO())
+    assert date_bounds("2024-01-01", "2024-01-31") == ("2024-01-01", "2024-02-01")
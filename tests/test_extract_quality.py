@@ -0,0 +1,27 @@
+from apps.ui.components.extract_quality import has_values, quality_of, summarize
+
+
+def test_summarize_counts_filled_leaves_per_field():
+    quality = summarize(
+        {"account_number": "A-1", "charges": [{"amount": 1}, {"amount": None}], "note": " "}
+    )
+    assert quality == {
+        "has_values": True,
+        "filled": 2,
+        "leaves": 4,
+        "fields": {"account_number": [1, 1], "charges": [1, 2], "note": [0, 1]},
+    }
+
+
+def test_empty_skeleton_has_no_values():
+    skeleton = {"statement": {"account_number": None, "due_date": "", "charges": []}}
+    assert not has_values(skeleton)
+    assert summarize(skeleton)["has_values"] is False
+    assert summarize(None)["leaves"] == 0
+
+
+def test_quality_of_prefers_stored_block():
+    stored = {"has_values": True, "filled": 9, "leaves": 9, "fields": {}}
+    assert quality_of({"quality": stored, "extracted_data": {}}) is stored
+    assert quality_of({"extracted_data": {"a": 1}})["filled"] == 1
+    assert quality_of(None)["has_values"] is False
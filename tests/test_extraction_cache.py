@@ -0,0 +1,75 @@
+import json
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+from apps.ui.components.extraction_cache import ExtractionCache
+
+
+def test_put_get_roundtrip_keeps_only_reusable_fields(tmp_path):
+    cache = ExtractionCache(str(tmp_path), max_bytes=1 << 20, max_age_days=1)
+    key = ExtractionCache.key("file", "schema", "acct")
+    cache.put(key, {"document_id": "d1", "extracted_data": {"a": 1}, "timings": {}})
+    entry = cache.get(key)
+    assert entry["document_id"] == "d1"
+    assert entry["extracted_data"] == {"a": 1}
+    assert "timings" not in entry
+    assert ExtractionCache.key("file", "other", "acct") != key
+    assert ExtractionCache.key("file", "schema", "other-acct") != key
+
+
+def test_writes_evict_entries_untouched_for_max_age(tmp_path):
+    cache = ExtractionCache(str(tmp_path), max_bytes=1 << 20, max_age_days=1)
+    cache.put("k", {"document_id": "d1"})
+    old = time.time() - 2 * 86400
+    os.utime(tmp_path / "k.json", (old, old))
+    cache.put("other", {"document_id": "d2"})
+    assert not (tmp_path / "k.json").exists()
+
+
+def test_frequent_reads_do_not_extend_max_age(tmp_path):
+    cache = ExtractionCache(str(tmp_path), max_bytes=1 << 20, max_age_days=1)
+    cache.put("k", {"document_id": "d1"})
+    path = tmp_path / "k.json"
+    entry = json.loads(path.read_text())
+    entry["cached_at"] = (datetime.now(timezone.utc) - timedelta(days=2)).isoformat()
+    path.write_text(json.dumps(entry))
+    assert cache.get("k") is None
+    assert not path.exists()
+
+
+def test_least_recently_used_evicted_beyond_max_bytes(tmp_path):
+    cache = ExtractionCache(str(tmp_path), max_bytes=1 << 20, max_age_days=1)
+    cache.put("old", {"extracted_data": "x" * 400})
+    past = time.time() - 60
+    os.utime(tmp_path / "old.json", (past, past))
+    cache.max_bytes = 600
+    cache.put("new", {"extracted_data": "y" * 400})
+    assert cache.get("old") is None
+    assert cache.get("new") is not None
+
+
+def test_repeat_upload_skips_groundx(make_processor, make_documents, groundx_env):
+    (document,) = make_documents(1)
+    processor = make_processor()
+    first = processor.process(document)
+    assert not first.get("cache_hit")
+
+    groundx_env.reset_counts()
+    job = processor.process(document)
+    assert job["cache_hit"]
+    assert job["document_id"] == first["document_id"]
+    assert not any(groundx_env.counts().values())
+
+
+def test_other_api_key_does_not_replay_the_cache(
+    make_processor, make_documents, groundx_env, monkeypatch
+):
+    (document,) = make_documents(1)
+    make_processor().process(document)
+
+    monkeypatch.setenv("GROUNDX_API_KEY", "other-account")
+    groundx_env.reset_counts()
+    job = make_processor().process(document)
+    assert not job.get("cache_hit")
+    assert groundx_env.counts().get("ingest") == 1
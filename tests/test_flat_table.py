@@ -0,0 +1,35 @@
+from apps.ui.components.formatting import FlatTable, iter_leaves
+
+DATA = {
+    "account": "A-1",
+    "charges": [{"amount": 1.5}, {"amount": 2}],
+    "empty": {},
+    "notes": None,
+}
+
+
+def test_iter_leaves_paths():
+    assert list(iter_leaves(DATA)) == [
+        ("account", "A-1"),
+        ("charges[0].amount", 1.5),
+        ("charges[1].amount", 2),
+        ("notes", None),
+    ]
+
+
+def test_iter_leaves_handles_deep_nesting():
+    data = 1
+    for _ in range(3000):
+        data = [data]
+    ((path, value),) = iter_leaves(data)
+    assert value == 1
+    assert path.count("[0]") == 3000
+
+
+def test_flat_table_pages_forward_and_back():
+    table = FlatTable({"values": list(range(10))})
+    assert len(table) == 10
+    assert [r["Value"] for r in table.rows(0, 3)] == ["0", "1", "2"]
+    assert [r["Value"] for r in table.rows(3, 6)] == ["3", "4", "5"]
+    assert [r["Field"] for r in table.rows(1, 2)] == ["values[1]"]
+    assert table.rows(8, 20)[-1] == {"Field": "values[9]", "Value": "9", "Type": "int"}
@@ -0,0 +1,61 @@
+from apps.ui.components.formatting import (
+    content_fingerprint,
+    flat_table_cached,
+    format_json,
+    format_json_cached,
+)
+
+
+def test_cached_render_reused_for_same_payload():
+    data = {"statement": {"amount_due": 10}}
+    first = format_json_cached("sub-same", data)
+    assert format_json_cached("sub-same", dict(data)) is first
+
+
+def test_updated_record_is_rerendered():
+    before = format_json_cached("sub-updated", {"statement": {"amount_due": 10}})
+    after = format_json_cached("sub-updated", {"statement": {"amount_due": 12}})
+    assert after != before
+    assert after == format_json({"statement": {"amount_due": 12}})
+
+
+def test_flat_table_follows_payload():
+    first = flat_table_cached("sub-table", {"a": 1})
+    assert flat_table_cached("sub-table", {"a": 1}) is first
+    updated = flat_table_cached("sub-table", {"a": 1, "b": 2})
+    assert updated is not first
+    assert len(updated) == 2
+
+
+def test_fingerprint_ignores_key_order():
+    assert content_fingerprint({"a": 1, "b": 2}) == content_fingerprint({"b": 2, "a": 1})
+    assert content_fingerprint({"a": 1}) != content_fingerprint({"a": 2})
+
+
+def test_format_json_escapes_and_survives_deep_nesting():
+    data = {"<b>": "a & b"}
+    for _ in range(3000):
+        data = {"x": data}
+    rendered = format_json(data, max_nodes=10_000, max_bytes=10 * 1024 * 1024)
+    assert "&lt;b&gt;" in rendered
+    assert "a &amp; b" in rendered
+
+
+def test_format_json_truncates_past_the_node_budget():
+    rendered = format_json({"items": list(range(100))}, max_nodes=10)
+    assert "json-truncated" in rendered
+    assert "91 more item(s)" in rendered
+
+
+def test_id_and_version_key_skips_hashing(monkeypatch):
+    from apps.ui.components import formatting
+
+    def no_hashing(json_data):
+        raise AssertionError("payload was fingerprinted")
+
+    monkeypatch.setattr(formatting, "content_fingerprint", no_hashing)
+    first = format_json_cached("sub-v", {"a": 1}, version="t1")
+    assert format_json_cached("sub-v", {"a": 1}, version="t1") is first
+    assert format_json_cached("sub-v", {"a": 2}, version="t2") != first
+    table = flat_table_cached("sub-v", {"a": 1}, version="t1")
+    assert flat_table_cached("sub-v", {"a": 1}, version="t1") is table
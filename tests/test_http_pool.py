@@ -0,0 +1,33 @@
+from apps.ui.components.http_pool import (
+    close_shared_client,
+    pool_limits,
+    pool_stats,
+    shared_client,
+)
+
+
+def test_shared_client_is_reused_until_closed():
+    client = shared_client()
+    assert shared_client() is client
+    close_shared_client()
+    assert client.is_closed
+    assert shared_client() is not client
+
+
+def test_sequential_requests_reuse_one_connection(fake_groundx):
+    close_shared_client()
+    before = pool_stats()
+    client = shared_client()
+    for _ in range(5):
+        client.get(fake_groundx.base_url)
+    after = pool_stats()
+    assert after["requests"] - before["requests"] == 5
+    assert after["connections_opened"] - before["connections_opened"] == 1
+
+
+def test_limits_come_from_the_environment(monkeypatch):
+    monkeypatch.setenv("GROUNDX_HTTP_MAX_CONNECTIONS", "7")
+    monkeypatch.setenv("GROUNDX_HTTP_MAX_KEEPALIVE", "not-a-number")
+    limits = pool_limits()
+    assert limits.max_connections == 7
+    assert limits.max_keepalive_connections == 20
@@ -0,0 +1,52 @@
+import threading
+import time
+
+from apps.ui.components.infra_checker import CheckResult, InfraChecker
+
+
+def _ok(name):
+    return lambda: CheckResult(name=name, ok=True, detail="fine")
+
+
+def test_slow_and_failing_checks_are_reported_without_blocking(tmp_path, monkeypatch):
+    checker = InfraChecker(submissions_dir=str(tmp_path))
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return CheckResult(name="slow", ok=True, detail="late")
+
+    def broken():
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(
+        checker,
+        "_checks",
+        lambda: [("fast", _ok("fast"), 1.0), ("slow", slow, 0.2), ("broken", broken, 1.0)],
+    )
+    started = time.monotonic()
+    results = checker.run_checks()
+    release.set()
+
+    assert time.monotonic() - started < 2
+    assert [r.name for r in results] == ["fast", "slow", "broken"]
+    assert [r.ok for r in results] == [True, False, False]
+    assert "Timed out" in results[1].detail
+    assert "boom" in results[2].detail
+
+
+def test_run_all_reuses_results_within_ttl(tmp_path, monkeypatch):
+    runs = []
+    checker = InfraChecker(submissions_dir=str(tmp_path), cache_ttl=60)
+    monkeypatch.setattr(checker, "run_checks", lambda: runs.append(1) or [])
+    checker.run_all()
+    InfraChecker(submissions_dir=str(tmp_path), cache_ttl=60).run_all()
+    assert len(runs) == 1
+    checker.run_all(use_cache=False)
+    assert len(runs) == 2
+
+
+def test_checks_pass_against_local_groundx(groundx_env, tmp_path):
+    results = InfraChecker(submissions_dir=str(tmp_path), cache_ttl=0).run_all()
+    failed = [(r.name, r.detail) for r in results if r.required and not r.ok]
+    assert not failed
@@ -0,0 +1,170 @@
+import io
+import time
+
+import pytest
+
+from apps.ui.components import job_queue
+from apps.ui.components.job_queue import JobQueue, QueuedFile
+from apps.ui.components.submission_store import SubmissionStore
+
+
+class _Processor:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.seen = []
+
+    def process(self, uploaded_file, **kwargs):
+        self.seen.append(uploaded_file)
+        if self.fail:
+            raise RuntimeError("boom")
+        return {"document_id": "doc-1", "timings": {"total": 0.01}}
+
+
+def _upload(name="bill.pdf"):
+    upload = io.BytesIO(b"%PDF-1.4 test")
+    upload.name = name
+    return upload
+
+
+def _wait(store, submission_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        record = store.get(submission_id)
+        if record["status"] not in job_queue.ACTIVE_STATES:
+            return record
+        time.sleep(0.02)
+    pytest.fail(f"submission {submission_id} still active")
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    monkeypatch.delenv("SUBMISSIONS_MAX_AGE_DAYS", raising=False)
+    monkeypatch.delenv("SUBMISSIONS_MAX_COUNT", raising=False)
+    monkeypatch.delenv("SUBMISSIONS_KEEP_ERRORS_DAYS", raising=False)
+    store = SubmissionStore(base_dir=str(tmp_path / "subs"))
+    return JobQueue(max_workers=1, store=store)
+
+
+@pytest.fixture
+def discarded(monkeypatch):
+    paths = []
+    original = QueuedFile.discard
+
+    def discard(self):
+        paths.append(self.path)
+        original(self)
+
+    monkeypatch.setattr(QueuedFile, "discard", discard)
+    return paths
+
+
+def test_completed_job_is_stored(queue, monkeypatch, discarded):
+    processor = _Processor()
+    monkeypatch.setattr(job_queue, "get_processor", lambda name: processor)
+    record = _wait(queue.store, queue.submit(_upload(), "simple.yaml")["id"])
+    assert record["status"] == "complete"
+    assert record["document_id"] == "doc-1"
+    assert set(record["timings"]) >= {"queue", "total"}
+    assert len(discarded) == 1
+
+
+def test_processor_failure_records_error(queue, monkeypatch, discarded):
+    monkeypatch.setattr(job_queue, "get_processor", lambda name: _Processor(fail=True))
+    record = _wait(queue.store, queue.submit(_upload(), "simple.yaml")["id"])
+    assert (record["status"], record["error"]) == ("error", "boom")
+    assert len(discarded) == 1
+
+
+def test_classifier_failure_records_error_and_discards_spool(queue, monkeypatch, discarded):
+    def broken_classify(uploaded_file, fallback):
+        raise ValueError("classifier exploded")
+
+    monkeypatch.setattr(job_queue, "classify", broken_classify)
+    monkeypatch.setattr(job_queue, "get_processor", lambda name: _Processor())
+    submitted = queue.submit(_upload(), "simple.yaml", auto_schema=True)
+    record = _wait(queue.store, submitted["id"])
+    assert record["status"] == "error"
+    assert "classifier exploded" in record["error"]
+    assert len(discarded) == 1
+
+
+def test_auto_schema_routes_to_classified_schema(queue, monkeypatch):
+    from apps.ui.components.schema_classifier import Classification
+
+    names = []
+    monkeypatch.setattr(
+        job_queue,
+        "classify",
+        lambda f, fallback: Classification("phone.yaml", 0.9, False, "matched", 0.002),
+    )
+    monkeypatch.setattr(job_queue, "get_processor", lambda name: names.append(name) or _Processor())
+    record = _wait(queue.store, queue.submit(_upload(), "simple.yaml", auto_schema=True)["id"])
+    assert names == ["phone"]
+    assert record["yaml_file"] == "phone.yaml"
+    assert record["classification"]["schema"] == "phone.yaml"
+    assert "classify" in record["timings"]
+
+
+def test_submit_returns_before_the_job_runs(queue, monkeypatch):
+    import threading
+
+    release = threading.Event()
+
+    class _Blocking(_Processor):
+        def process(self, uploaded_file, **kwargs):
+            release.wait(5)
+            return super().process(uploaded_file, **kwargs)
+
+    monkeypatch.setattr(job_queue, "get_processor", lambda name: _Blocking())
+    submitted = queue.submit(_upload(), "simple.yaml")
+    assert submitted["status"] == job_queue.QUEUED
+    assert queue.pending() == 1
+    release.set()
+    assert _wait(queue.store, submitted["id"])["status"] == "complete"
+
+
+def _dead_pid():
+    import subprocess
+    import sys
+
+    child = subprocess.Popen([sys.executable, "-c", "pass"])
+    child.wait()
+    return child.pid
+
+
+def test_restart_fails_only_this_hosts_interrupted_jobs(tmp_path):
+    store = SubmissionStore(base_dir=str(tmp_path / "subs"))
+    host = job_queue._HOST
+    stale = store.record(
+        {"filename": "a.pdf", "status": job_queue.PROCESSING, "owner": f"{host}:{_dead_pid()}"}
+    )
+    batch = store.record({"filename": "b.pdf", "status": job_queue.PROCESSING})
+    replica = store.record(
+        {"filename": "c.pdf", "status": job_queue.QUEUED, "owner": "other-pod:1"}
+    )
+    JobQueue(max_workers=1, store=store)
+
+    record = store.get(stale["id"])
+    assert record["status"] == "error"
+    assert "restart" in record["error"]
+    assert store.get(batch["id"])["status"] == job_queue.PROCESSING
+    assert store.get(replica["id"])["status"] == job_queue.QUEUED
+
+
+def test_second_queue_leaves_live_jobs_alone(queue, monkeypatch):
+    import threading
+
+    release = threading.Event()
+
+    class _Blocking(_Processor):
+        def process(self, uploaded_file, **kwargs):
+            release.wait(5)
+            return super().process(uploaded_file, **kwargs)
+
+    monkeypatch.setattr(job_queue, "get_processor", lambda name: _Blocking())
+    submitted = queue.submit(_upload(), "simple.yaml")
+    assert submitted["owner"] == job_queue.queue_owner()
+    JobQueue(max_workers=1, store=queue.store)
+    assert queue.store.get(submitted["id"])["status"] in job_queue.ACTIVE_STATES
+    release.set()
+    assert _wait(queue.store, submitted["id"])["status"] == "complete"
@@ -0,0 +1,29 @@
+import os
+import subprocess
+import sys
+
+HEAVY = ("groundx", "manager", "prompts")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _imported_after(statement):
+    code = (
+        f"import sys\n{statement}\n"
+        f"print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=REPO_ROOT
+    )
+    return result.stdout.strip().split(",") if result.stdout.strip() else []
+
+
+def test_processor_module_defers_the_sdk():
+    assert _imported_after("import apps.ui.components.document_processor") == []
+
+
+def test_load_sdk_imports_it_on_demand():
+    statement = (
+        "from apps.ui.components.document_processor import load_sdk\n"
+        "assert load_sdk()"
+    )
+    assert set(_imported_after(statement)) == set(HEAVY)
@@ -0,0 +1,39 @@
+import pytest
+
+from apps.ui.components.metrics import STAGE_SECONDS, Registry, StageClock
+
+
+def test_counter_and_histogram_render_in_exposition_format():
+    registry = Registry()
+    jobs = registry.counter("jobs_total", "Jobs.", ("status",))
+    seconds = registry.histogram("job_seconds", "Job time.", buckets=(1, 5))
+    jobs.inc(status="complete")
+    jobs.inc(2, status="error")
+    seconds.observe(0.5)
+    seconds.observe(3)
+
+    text = registry.render()
+    assert "# TYPE jobs_total counter" in text
+    assert 'jobs_total{status="error"} 2' in text
+    assert 'job_seconds_bucket{le="1"} 1' in text
+    assert 'job_seconds_bucket{le="5"} 2' in text
+    assert 'job_seconds_bucket{le="+Inf"} 2' in text
+    assert "job_seconds_sum 3.5" in text
+    assert jobs.value(status="complete") == 1
+
+
+def test_labels_must_match_declaration():
+    counter = Registry().counter("c", "C.", ("phase",))
+    with pytest.raises(ValueError):
+        counter.inc(stage="x")
+
+
+def test_stage_clock_times_each_stage():
+    before = STAGE_SECONDS.render()
+    clock = StageClock()
+    clock.enter("ingest")
+    clock.enter("download")
+    timings = clock.finish()
+    assert set(timings) == {"ingest", "download", "total"}
+    assert timings["total"] >= timings["ingest"] + timings["download"] - 0.001
+    assert STAGE_SECONDS.render() != before
@@ -0,0 +1,18 @@
+from benchmarks import pipeline_bench
+
+
+def test_percentile_nearest_rank():
+    values = [5, 1, 4, 2, 3]
+    assert pipeline_bench.percentile(values, 50) == 3
+    assert pipeline_bench.percentile(values, 99) == 5
+    assert pipeline_bench.percentile([], 50) == 0.0
+
+
+def test_every_mode_runs_against_the_stand_in(groundx_env):
+    reports = pipeline_bench.run(
+        pipeline_bench.MODES, documents=3, concurrency=2, doc_size=1024, fake=groundx_env
+    )
+    assert [r["mode"] for r in reports] == list(pipeline_bench.MODES)
+    for report in reports:
+        assert report["succeeded"] == 3, report["errors"]
+        assert report["api_calls"]["extract"] == 3
@@ -0,0 +1,54 @@
+import pytest
+
+from apps.ui.components.polling import (
+    PROCESSING,
+    QUEUED,
+    AdaptivePolling,
+    FixedPolling,
+    PhaseSchedule,
+    PollingStrategy,
+    PollStats,
+    status_phase,
+)
+
+
+def test_first_poll_uses_initial_delay_without_fast_polls():
+    schedule = PhaseSchedule(initial=0.5, max_delay=10.0, factor=2.0)
+    assert [schedule.delay(i) for i in range(4)] == [0.5, 1.0, 2.0, 4.0]
+
+
+def test_fast_polls_then_backoff_capped():
+    schedule = PhaseSchedule(initial=0.5, max_delay=2.0, factor=2.0, fast_polls=3)
+    assert [schedule.delay(i) for i in range(6)] == [0.5, 0.5, 0.5, 1.0, 2.0, 2.0]
+
+
+@pytest.mark.parametrize("phase", [QUEUED, PROCESSING])
+def test_default_schedules_start_sub_second(phase):
+    polling = AdaptivePolling(jitter=0)
+    assert all(polling.next_delay(phase, i, 60.0) < 1.0 for i in range(3))
+
+
+def test_delay_capped_by_remaining_deadline():
+    polling = AdaptivePolling(jitter=0)
+    assert polling.next_delay(QUEUED, 20, 0.25) == 0.25
+    assert FixedPolling(interval=5.0).next_delay(PROCESSING, 0, 1.0) == 1.0
+
+
+def test_jitter_stays_within_bounds():
+    polling = AdaptivePolling(jitter=0.2)
+    for _ in range(50):
+        assert 0.4 <= polling.next_delay(PROCESSING, 0, 60.0) <= 0.6
+
+
+def test_polling_strategy_is_abstract():
+    with pytest.raises(TypeError):
+        PollingStrategy()
+
+
+def test_status_phase_and_stats():
+    assert status_phase("") == QUEUED
+    assert status_phase("processing") == PROCESSING
+    stats = PollStats()
+    stats.record(QUEUED, 0.5)
+    stats.record(PROCESSING)
+    assert stats.as_dict() == {"polls": 2, "by_phase": {QUEUED: 1, PROCESSING: 1}, "waited_s": 0.5}
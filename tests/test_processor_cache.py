@@ -0,0 +1,32 @@
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+from apps.ui.components.processor_cache import ProcessorCache
+
+
+def test_concurrent_lookups_share_one_processor(groundx_env):
+    cache = ProcessorCache()
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        processors = list(pool.map(lambda _: cache.get("simple"), range(6)))
+    assert processors[0].is_ready
+    assert all(p is processors[0] for p in processors)
+
+
+def test_schema_edit_rebuilds_processor(groundx_env, tmp_path):
+    shutil.copy("prompts/simple.yaml", tmp_path / "simple.yaml")
+    cache = ProcessorCache()
+    first = cache.get("simple", prompts_dir=str(tmp_path))
+    (tmp_path / "simple.yaml").touch()
+    assert cache.get("simple", prompts_dir=str(tmp_path)) is first
+
+    with open(tmp_path / "simple.yaml", "a", encoding="utf-8") as f:
+        f.write("\n")
+    assert cache.get("simple", prompts_dir=str(tmp_path)) is not first
+
+
+def test_unready_processor_is_not_cached(groundx_env, monkeypatch):
+    monkeypatch.delenv("GROUNDX_API_KEY")
+    cache = ProcessorCache()
+    first = cache.get("simple")
+    assert not first.is_ready
+    assert cache.get("simple") is not first
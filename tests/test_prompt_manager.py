@@ -0,0 +1,114 @@
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from groundx.extract import Logger, Source
+
+import manager
+from manager import ExtractPromptManager, clear_render_cache, render_cache_stats
+
+
+@pytest.fixture
+def prompt_manager(tmp_path):
+    shutil.copy("prompts/simple.yaml", tmp_path / "simple.yaml")
+    clear_render_cache()
+    logger = Logger(name="test", level="warning")
+    yield ExtractPromptManager(
+        cache_source=Source(logger=logger, cache_path=str(tmp_path)),
+        config_source=Source(logger=logger, cache_path=str(tmp_path)),
+        logger=logger,
+        default_file_name="simple",
+        default_workflow_id="simple",
+    )
+    clear_render_cache()
+
+
+def _edit_schema(path):
+    text = path.read_text(encoding="utf-8")
+    path.write_text(text.replace("unique identifier for the customer account", "edited id"))
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + 5))
+
+
+def test_repeat_renders_hit_the_cache(prompt_manager):
+    first = prompt_manager.statement_field_prompts()
+    assert prompt_manager.statement_field_prompts() == first
+    stats = render_cache_stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+
+
+def test_schema_edit_changes_hash_and_rerenders(prompt_manager, tmp_path):
+    before_hash = prompt_manager.schema_hash()
+    before = prompt_manager.statement_field_prompts()
+    _edit_schema(tmp_path / "simple.yaml")
+
+    assert prompt_manager.schema_hash() != before_hash
+    after = prompt_manager.statement_field_prompts()
+    assert after != before
+    assert "edited id" in after
+
+
+def test_concurrent_callers_render_once(prompt_manager, monkeypatch):
+    calls = []
+    gate = threading.Event()
+    original = prompt_manager.group_field_prompts
+
+    def slow_render(*args, **kwargs):
+        calls.append(1)
+        gate.wait(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(prompt_manager, "group_field_prompts", slow_render)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(prompt_manager.statement_field_prompts) for _ in range(8)]
+        gate.set()
+        results = {f.result() for f in futures}
+    assert len(results) == 1
+    assert len(calls) == 1
+    assert manager._RENDER_LOCKS == {}
+
+
+def test_render_cache_is_bounded(monkeypatch):
+    clear_render_cache()
+    monkeypatch.setattr(manager, "RENDER_CACHE_SIZE", 3)
+    for i in range(10):
+        manager._memoized(("kind", i), lambda: i)
+    assert render_cache_stats()["entries"] == 3
+    assert manager._RENDER_LOCKS == {}
+    clear_render_cache()
+
+
+def test_failed_render_releases_its_lock():
+    clear_render_cache()
+
+    def boom():
+        raise RuntimeError("render failed")
+
+    with pytest.raises(RuntimeError):
+        manager._memoized(("kind", "boom"), boom)
+    assert manager._RENDER_LOCKS == {}
+
+
+def test_schema_reloads_are_serialized(prompt_manager, tmp_path, monkeypatch):
+    active = []
+    overlaps = []
+    original = prompt_manager._fetch_workflow_config
+
+    def slow_fetch(*args, **kwargs):
+        active.append(1)
+        overlaps.append(len(active))
+        try:
+            threading.Event().wait(0.02)
+            return original(*args, **kwargs)
+        finally:
+            active.pop()
+
+    monkeypatch.setattr(prompt_manager, "_fetch_workflow_config", slow_fetch)
+    _edit_schema(tmp_path / "simple.yaml")
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = set(pool.map(lambda _: prompt_manager.statement_field_prompts(), range(8)))
+    assert len(results) == 1
+    assert overlaps and max(overlaps) == 1
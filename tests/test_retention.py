@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from apps.ui.components.retention import Archive, RetentionPolicy, prune
+from apps.ui.components.submission_store import SubmissionStore
+
+
+def _ago(days):
+    return (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SubmissionStore(base_dir=str(tmp_path / "subs"))
+
+
+def _add(store, days, status="complete", **fields):
+    return store.record(dict(fields, created_at=_ago(days), status=status, filename="b.pdf"))
+
+
+def test_policy_from_env(monkeypatch):
+    monkeypatch.setenv("SUBMISSIONS_MAX_AGE_DAYS", "30")
+    monkeypatch.setenv("SUBMISSIONS_MAX_COUNT", "0")
+    monkeypatch.delenv("SUBMISSIONS_KEEP_ERRORS_DAYS", raising=False)
+    policy = RetentionPolicy.from_env()
+    assert policy == RetentionPolicy(max_age_days=30.0)
+    assert policy.enabled
+    assert not RetentionPolicy().enabled
+
+
+def test_prune_archives_expired_and_keeps_active(store):
+    old = _add(store, 40)
+    old_error = _add(store, 10, status="error")
+    fresh = _add(store, 1)
+    running = _add(store, 40, status="processing")
+
+    policy = RetentionPolicy(max_age_days=30, keep_errors_days=5)
+    assert prune(store, policy, dry_run=True, pause=0)["expired"] == 2
+    assert store.get(old["id"]) is not None
+
+    report = prune(store, policy, pause=0)
+    assert (report["archived"], report["deleted"], report["skipped"]) == (2, 2, 0)
+    assert report["bytes_reclaimed"] > 0
+    assert store.get(old["id"]) is None and store.get(old_error["id"]) is None
+    assert store.get(fresh["id"]) and store.get(running["id"])
+
+    archive = Archive(store)
+    assert archive.count() == 2
+    assert archive.get(old["id"])["id"] == old["id"]
+
+
+def test_max_count_keeps_newest(store):
+    ids = [_add(store, days)["id"] for days in (5, 4, 3, 2, 1)]
+    prune(store, RetentionPolicy(max_count=2), pause=0, batch_size=2)
+    assert [store.get(i) is not None for i in ids] == [False, False, False, True, True]
+
+
+def test_unreadable_records_are_skipped_not_deleted(store):
+    records = [_add(store, 40) for _ in range(4)]
+    broken = records[1]["id"]
+    with open(store._path(broken), "wb") as f:
+        f.write(b"{not json")
+
+    report = prune(store, RetentionPolicy(max_age_days=30), pause=0, batch_size=2)
+    assert (report["archived"], report["skipped"]) == (3, 1)
+    assert store.count() == 1
+    with open(store._path(broken), "rb") as f:
+        assert f.read() == b"{not json"
+    assert Archive(store).get(broken) is None
+
+
+def test_torn_bundle_tail_does_not_hide_later_appends(store):
+    first = _add(store, 40)
+    prune(store, RetentionPolicy(max_age_days=30), pause=0)
+    month = first["created_at"][:7]
+    bundle = f"{store.base_dir}/archive/{month}.jsonl.gz"
+    with open(bundle, "ab") as f:
+        f.write(b"\x1f\x8b\x08torn")
+
+    second = store.record(dict(first, id="second"))
+    prune(store, RetentionPolicy(max_age_days=30), pause=0)
+    assert {r["id"] for r in Archive(store).records(month)} == {first["id"], second["id"]}
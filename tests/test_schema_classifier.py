@@ -0,0 +1,113 @@
+import io
+import json
+
+import pytest
+
+from apps.ui.components import schema_classifier
+from apps.ui.components.schema_classifier import (
+    Fingerprint,
+    classify,
+    first_page_text,
+    fingerprints,
+    schema_fingerprint,
+    score,
+)
+
+ELECTRIC = """
+statement:
+  fields:
+    account_number:
+      prompt:
+        identifiers: ["Account Number"]
+    kwh_used:
+      prompt:
+        identifiers: ["kWh"]
+"""
+
+PHONE = """
+statement:
+  fields:
+    account_number:
+      prompt:
+        identifiers: ["Account Number"]
+    data_usage:
+      prompt:
+        identifiers: ["GB used"]
+"""
+
+
+@pytest.fixture
+def prompts_dir(tmp_path):
+    (tmp_path / "electric.yaml").write_text(ELECTRIC)
+    (tmp_path / "phone.yaml").write_text(PHONE)
+    (tmp_path / "fingerprints.json").write_text(json.dumps({"phone": {"providers": ["AT&T"]}}))
+    return str(tmp_path)
+
+
+class _Upload:
+    def __init__(self, name):
+        self.name = name
+
+
+def _page_text(monkeypatch, text):
+    monkeypatch.setattr(schema_classifier, "first_page_text", lambda _: text)
+
+
+def test_fingerprint_from_identifiers_and_sidecar(prompts_dir):
+    by_schema = {fp.schema: fp for fp in fingerprints(prompts_dir)}
+    assert set(by_schema) == {"electric.yaml", "phone.yaml"}
+    assert "kwh" in by_schema["electric.yaml"].keywords
+    assert "account number" in by_schema["electric.yaml"].keywords
+    assert by_schema["phone.yaml"].providers == ("at&t",)
+
+
+@pytest.mark.parametrize("content", [None, [], "just text", 3])
+def test_fingerprint_tolerates_non_mapping_documents(content):
+    assert schema_fingerprint("odd.yaml", content) == Fingerprint(schema="odd.yaml")
+
+
+def test_score_matches_whole_words_only():
+    fp = Fingerprint(schema="s", keywords=("tax", "due"), providers=("at&t",))
+    assert score("syntax overdue", fp) == (0.0, [])
+    value, matched = score("tax (due) billed by at&t.", fp)
+    assert value == 1.0
+    assert matched == ["tax", "due", "at&t"]
+
+
+def test_classify_picks_best_schema(monkeypatch, prompts_dir):
+    _page_text(monkeypatch, "AT&T  Account Number 123  GB used 4.2")
+    result = classify(_Upload("bill.pdf"), "electric.yaml", prompts_dir=prompts_dir)
+    assert result.schema == "phone.yaml"
+    assert not result.fallback
+    assert result.reason == "matched"
+    assert result.as_dict()["elapsed_ms"] >= 0
+
+
+def test_classify_falls_back_when_ambiguous(monkeypatch, prompts_dir):
+    _page_text(monkeypatch, "Account Number 123")
+    result = classify(_Upload("bill.pdf"), "electric.yaml", prompts_dir=prompts_dir)
+    assert result.schema == "electric.yaml"
+    assert result.fallback
+
+
+def test_classify_falls_back_for_low_confidence(monkeypatch, prompts_dir):
+    _page_text(monkeypatch, "nothing relevant here")
+    result = classify(_Upload("bill.pdf"), "phone.yaml", prompts_dir=prompts_dir)
+    assert (result.schema, result.reason) == ("phone.yaml", "low confidence")
+
+
+def test_classify_images_and_scans_fall_back(monkeypatch, prompts_dir):
+    result = classify(_Upload("bill.png"), "phone.yaml", prompts_dir=prompts_dir)
+    assert result.fallback and result.reason == "no text layer (image)"
+    _page_text(monkeypatch, "")
+    result = classify(_Upload("scan.pdf"), "phone.yaml", prompts_dir=prompts_dir)
+    assert result.reason == "no text layer on the first page"
+
+
+def test_first_page_text_rewinds_in_memory_uploads():
+    pytest.importorskip("pypdf")
+    upload = io.BytesIO(b"not really a pdf")
+    upload.name = "broken.pdf"
+    upload.seek(5)
+    assert first_page_text(upload) == ""
+    assert upload.tell() == 5
@@ -0,0 +1,134 @@
+import gzip
+import json
+import os
+import stat
+
+import pytest
+
+from apps.ui.components import submission_store
+from apps.ui.components.submission_store import SubmissionStore, decode_record, encode_record
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SubmissionStore(base_dir=str(tmp_path / "subs"))
+
+
+def test_encode_is_compact_below_threshold():
+    data = encode_record({"a": 1, "b": [1, 2]}, threshold=1024)
+    assert data == b'{"a":1,"b":[1,2]}'
+    assert decode_record(data) == {"a": 1, "b": [1, 2]}
+
+
+def test_encode_gzips_at_threshold_deterministically():
+    record = {"text": "x" * 2000}
+    data = encode_record(record, threshold=100)
+    assert data[:2] == b"\x1f\x8b"
+    assert data == encode_record(record, threshold=100)
+    assert decode_record(data) == record
+    assert encode_record(record, threshold=0)[:1] == b"{"
+
+
+def test_decode_reads_pretty_printed_legacy_files():
+    assert decode_record(json.dumps({"a": 1}, indent=2).encode()) == {"a": 1}
+
+
+def test_large_records_are_stored_compressed(tmp_path, monkeypatch):
+    monkeypatch.setenv("SUBMISSIONS_COMPRESS_THRESHOLD", "256")
+    store = SubmissionStore(base_dir=str(tmp_path / "subs"))
+    small = store.record({"status": "complete"})
+    large = store.record({"status": "complete", "extracted_data": {"t": "y" * 5000}})
+    with open(store._path(small["id"]), "rb") as f:
+        assert f.read(1) == b"{"
+    with open(store._path(large["id"]), "rb") as f:
+        assert json.loads(gzip.decompress(f.read()))["extracted_data"]["t"] == "y" * 5000
+    assert store.get(large["id"])["extracted_data"]["t"] == "y" * 5000
+
+
+def test_writes_leave_no_temp_files_and_a_umask_mode(store):
+    umask = os.umask(0o022)
+    os.umask(umask)
+    record = store.record({"status": "complete"})
+    store.update(record["id"], status="error", error="x")
+    names = os.listdir(store.base_dir)
+    assert not [n for n in names if n.endswith(".tmp")]
+    mode = stat.S_IMODE(os.stat(store._path(record["id"])).st_mode)
+    assert mode == 0o666 & ~umask
+    assert store.get(record["id"])["status"] == "error"
+
+
+def test_writing_does_not_touch_the_process_umask(store, monkeypatch):
+    calls = []
+    monkeypatch.setattr(submission_store.os, "umask", lambda *a: calls.append(a) or 0o022)
+    store.record({"status": "complete"})
+    assert calls == []
+
+
+def test_compact_rewrites_pretty_files_and_removes_temp_files(store):
+    record = store.record({"status": "complete", "filename": "a.pdf"})
+    path = store._path(record["id"])
+    with open(path, "w") as f:
+        json.dump(record, f, indent=4)
+    stray = os.path.join(store.base_dir, ".submission-abc.tmp")
+    open(stray, "w").close()
+
+    stats = store.compact()
+    assert stats["rewritten"] == 1
+    assert stats["bytes_saved"] > 0
+    assert not os.path.exists(stray)
+    assert store.get(record["id"]) == record
+    assert store.compact()["rewritten"] == 0
+
+
+def test_legacy_json_files_are_indexed_on_first_use(tmp_path):
+    base = tmp_path / "legacy"
+    base.mkdir()
+    for i in range(3):
+        record = {"id": f"r{i}", "created_at": f"2025-01-0{i + 1}", "status": "complete"}
+        (base / f"r{i}.json").write_text(json.dumps(record, indent=2))
+    (base / "broken.json").write_text("{")
+
+    store = SubmissionStore(base_dir=str(base))
+    assert store.count() == 3
+    assert [s["id"] for s in store.list(limit=2)] == ["r2", "r1"]
+    assert [s["id"] for s in store.list(limit=2, offset=2)] == ["r0"]
+    assert store.migrate() == 3
+
+
+def test_index_is_initialized_once_per_path(tmp_path, monkeypatch):
+    SubmissionStore(base_dir=str(tmp_path / "subs"))
+    calls = []
+    original = SubmissionStore._create_index
+    monkeypatch.setattr(
+        SubmissionStore, "_create_index", lambda self: calls.append(1) or original(self)
+    )
+    SubmissionStore(base_dir=str(tmp_path / "subs"))
+    assert calls == []
+    SubmissionStore(base_dir=str(tmp_path / "other"))
+    assert calls == [1]
+
+
+def test_status_filter_and_update(store):
+    first = store.record({"status": "complete", "created_at": "2025-01-01"})
+    second = store.record({"status": "error", "created_at": "2025-01-02"})
+    assert [s["id"] for s in store.list(status="error")] == [second["id"]]
+    store.update(first["id"], status="error")
+    assert store.count(status="error") == 2
+
+
+def test_delete_keeps_rows_whose_files_could_not_be_removed(store, monkeypatch):
+    kept = store.record({"status": "complete"})
+    gone = store.record({"status": "complete"})
+    missing = store.record({"status": "complete"})
+    os.unlink(store._path(missing["id"]))
+    real_unlink = os.unlink
+
+    def unlink(path):
+        if path == store._path(kept["id"]):
+            raise PermissionError(path)
+        real_unlink(path)
+
+    monkeypatch.setattr(submission_store.os, "unlink", unlink)
+    freed = store.delete([kept["id"], gone["id"], missing["id"]])
+    assert freed > 0
+    assert [s["id"] for s in store.list()] == [kept["id"]]
@@ -0,0 +1,30 @@
+import hashlib
+import io
+
+from apps.ui.components.sample_documents import SampleDocument
+from apps.ui.components.uploads import iter_chunks, local_path, spool_to, upload_sha256
+
+DATA = b"%PDF-1.4\n" + bytes(range(256)) * 20
+
+
+def test_path_backed_upload_is_read_from_disk(tmp_path):
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(DATA)
+    upload = SampleDocument(str(path))
+    assert local_path(upload) == str(path)
+    assert b"".join(bytes(c) for c in iter_chunks(upload, chunk_size=1000)) == DATA
+
+
+def test_in_memory_upload_is_chunked_without_path():
+    upload = io.BytesIO(DATA)
+    assert local_path(upload) is None
+    chunks = [bytes(c) for c in iter_chunks(upload, chunk_size=1000)]
+    assert all(len(c) <= 1000 for c in chunks)
+    assert b"".join(chunks) == DATA
+
+
+def test_spool_and_hash_match_the_bytes(tmp_path):
+    target = tmp_path / "spooled.pdf"
+    assert spool_to(io.BytesIO(DATA), str(target), chunk_size=333) == len(DATA)
+    assert target.read_bytes() == DATA
+    assert upload_sha256(io.BytesIO(DATA)) == hashlib.sha256(DATA).hexdigest()
@@ -0,0 +1,67 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from apps.ui.components.workflow_registry import WorkflowRegistry, workflow_fingerprint
+
+
+def test_put_get_and_account_default(tmp_path):
+    registry = WorkflowRegistry(str(tmp_path / "workflows.json"))
+    account = WorkflowRegistry.account("http://gx", "key-1")
+    key = WorkflowRegistry.key(account, "simple")
+    assert registry.get(key) is None
+    registry.put(key, "abc", "wf-1")
+    registry.set_account_default(account, "wf-1")
+
+    reopened = WorkflowRegistry(str(tmp_path / "workflows.json"))
+    assert reopened.get(key)["workflow_id"] == "wf-1"
+    assert reopened.account_default(account) == "wf-1"
+    assert "key-1" not in (tmp_path / "workflows.json").read_text()
+
+
+def test_accounts_on_one_base_url_are_separate(tmp_path):
+    registry = WorkflowRegistry(str(tmp_path / "workflows.json"))
+    first = WorkflowRegistry.account(None, "key-1")
+    second = WorkflowRegistry.account(None, "key-2")
+    assert first != second
+    registry.put(WorkflowRegistry.key(first, "simple"), "abc", "wf-1")
+    registry.set_account_default(first, "wf-1")
+    assert registry.get(WorkflowRegistry.key(second, "simple")) is None
+    assert registry.account_default(second) is None
+
+
+def test_fingerprint_changes_with_steps():
+    assert workflow_fingerprint("s", {"a": 1}, {}) == workflow_fingerprint("s", {"a": 1}, {})
+    assert workflow_fingerprint("s", {"a": 1}, {}) != workflow_fingerprint("s", {"a": 2}, {})
+
+
+def test_lock_is_shared_per_registry_key(tmp_path):
+    registry = WorkflowRegistry(str(tmp_path / "workflows.json"))
+    other = WorkflowRegistry(str(tmp_path / "workflows.json"))
+    assert registry.lock("k") is other.lock("k")
+    assert registry.lock("k") is not registry.lock("j")
+
+
+def test_concurrent_cold_jobs_create_one_workflow(make_processor, groundx_env):
+    processor = make_processor()
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        ids = set(pool.map(lambda _: processor.ensure_workflow(), range(6)))
+    assert len(ids) == 1
+    counts = groundx_env.counts()
+    assert counts.get("workflow_create") == 1
+    assert counts.get("workflow_account") == 1
+
+
+def test_registered_workflow_is_reused(make_processor, groundx_env):
+    first = make_processor().ensure_workflow()
+    groundx_env.reset_counts()
+    assert make_processor().ensure_workflow() == first
+    assert not groundx_env.counts().get("workflow_create")
+
+
+def test_second_api_key_gets_its_own_workflow(make_processor, groundx_env, monkeypatch):
+    make_processor().ensure_workflow()
+    monkeypatch.setenv("GROUNDX_API_KEY", "other-account")
+    groundx_env.reset_counts()
+    make_processor().ensure_workflow()
+    counts = groundx_env.counts()
+    assert counts.get("workflow_create") == 1
+    assert counts.get("workflow_account") == 1
@@ -0,0 +1,51 @@
+import os
+
+import pytest
+
+from apps.ui.components import yaml_manager
+from apps.ui.components.yaml_manager import YAMLManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    yaml_manager.invalidate()
+    yield YAMLManager(yaml_dir=str(tmp_path))
+    yaml_manager.invalidate()
+
+
+def test_repeat_loads_parse_once(manager, monkeypatch):
+    manager.save_content("s.yaml", {"statement": {"fields": {}}})
+    parses = []
+    original = yaml_manager.yaml.load
+    monkeypatch.setattr(
+        yaml_manager.yaml, "load", lambda *a, **k: parses.append(1) or original(*a, **k)
+    )
+    assert manager.load_content("s.yaml") == {"statement": {"fields": {}}}
+    assert manager.load_content("s.yaml") == {"statement": {"fields": {}}}
+    assert len(parses) == 1
+
+
+def test_loaded_content_is_a_copy(manager):
+    manager.save_content("s.yaml", {"a": {"b": 1}})
+    manager.load_content("s.yaml")["a"]["b"] = 2
+    assert manager.load_content("s.yaml") == {"a": {"b": 1}}
+
+
+def test_external_edit_and_save_invalidate(manager, tmp_path):
+    manager.save_content("s.yaml", {"a": 1})
+    assert manager.load_content("s.yaml") == {"a": 1}
+
+    path = tmp_path / "s.yaml"
+    path.write_text("a: 22\n")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert manager.load_content("s.yaml") == {"a": 22}
+
+    ok, _ = manager.edit_and_save("s.yaml", "a: 3\n")
+    assert ok
+    assert manager.load_content("s.yaml") == {"a": 3}
+    assert manager.load_raw("s.yaml") == "a: 3\n"
+
+
+def test_missing_file_returns_none(manager):
+    assert manager.load_content("missing.yaml") is None